@@ -0,0 +1,159 @@
+"""
+Batch analysis of a lot of Oska boards at once.
+Jobs are (board, curr_player, depth) tuples with the board in the usual List[str] format. analyseBatch() takes any
+iterable of jobs (it can be a generator reading a huge file) and yields the results in the same order as the jobs.
+The jobs are sent to a pool of worker processes in chunks, and only a few chunks per worker are ever waiting or being
+worked on, so the memory used stays the same no matter how many jobs there are.
+
+It can also be run on a file of JSON lines, each one either [board, player, depth] or
+{"board": board, "player": player, "depth": depth}:
+    python batchAnalysis.py jobs.jsonl results.jsonl --workers 8
+Each output line is a JSON object with the job and its "best" board and "score" (both null when there is no move).
+With --cache FILE every worker looks the boards up in the same DiskCache (see diskCache.py) first and stores the ones
+it searched, so a board that comes up again, in this run or a later one, isn't searched again.
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, TextIO, Tuple
+
+from diskCache import DiskCache
+from oskaPlayer import analyse
+from transTable import TranspositionTable
+
+# how many jobs are sent to a worker at a time
+CHUNK_SIZE = 64
+# how many chunks per worker can be waiting or being worked on at once
+CHUNKS_PER_WORKER = 2
+# memory for the transposition table made for each job
+JOB_TABLE_MEMORY = 1024 * 1024
+
+Job = Tuple[List[str], str, int]
+
+"""
+Function that analyses one job
+@:param job: the (board, curr_player, depth) job
+@:param cache: an optional DiskCache the result is looked up in first
+@:return a tuple of the best board (or None) and its score (or None)
+"""
+
+
+def analyseJob(job: Job, cache: DiskCache = None) -> Tuple[List[str], int]:
+    board, player, depth = job
+    # every job gets a new table so the results don't depend on which jobs came before it
+    return analyse(board, player, depth, table=TranspositionTable(JOB_TABLE_MEMORY), cache=cache)
+
+
+# runs in a worker process, analyses a whole chunk of jobs
+def _analyseChunk(jobs: List[Job], cache: DiskCache = None) -> List[Tuple[List[str], int]]:
+    return [analyseJob(job, cache) for job in jobs]
+
+
+# splits the jobs into lists of chunk_size jobs, without reading more of the jobs than the next chunk
+def _chunks(jobs: Iterable[Job], chunk_size: int) -> Iterator[List[Job]]:
+    chunk = []
+    for job in jobs:
+        chunk.append(job)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+"""
+Function that analyses all the jobs and yields a (job, (best board, score)) tuple for each of them, in the same order
+as the jobs. Runs in this process when workers is 1.
+
+@:param jobs: an iterable of (board, curr_player, depth) jobs
+@:param workers: how many worker processes to use, defaults to the number of CPUs
+@:param chunk_size: how many jobs are sent to a worker at a time
+@:param cache: an optional DiskCache shared by all the workers
+
+@:return:
+    a generator of (job, (best board, score)) tuples
+"""
+
+
+def analyseBatch(jobs: Iterable[Job], workers: int = None,
+                 chunk_size: int = CHUNK_SIZE, cache: DiskCache = None) -> Iterator[Tuple[Job, Tuple[List[str], int]]]:
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for job in jobs:
+            yield job, analyseJob(job, cache)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # the chunks that were sent to the pool, oldest first, so the results come out in order
+        pending = deque()
+        for chunk in _chunks(jobs, chunk_size):
+            pending.append((chunk, pool.submit(_analyseChunk, chunk, cache)))
+            # wait for the oldest chunk before reading more jobs once enough chunks are waiting
+            while len(pending) >= workers * CHUNKS_PER_WORKER:
+                yield from _finished(pending.popleft())
+        while pending:
+            yield from _finished(pending.popleft())
+
+
+# waits for a chunk and yields its jobs with their results
+def _finished(sent) -> Iterator[Tuple[Job, Tuple[List[str], int]]]:
+    chunk, future = sent
+    yield from zip(chunk, future.result())
+
+
+"""
+Function that reads jobs from a file of JSON lines, one job at a time. Blank lines are skipped.
+@:param lines: the open file (or any iterable of lines)
+@:return a generator of (board, curr_player, depth) jobs
+"""
+
+
+def readJobs(lines: Iterable[str]) -> Iterator[Job]:
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        job = json.loads(line)
+        if isinstance(job, dict):
+            yield job['board'], job['player'], int(job['depth'])
+        else:
+            board, player, depth = job
+            yield board, player, int(depth)
+
+
+"""
+Function that writes the results of analyseBatch() as JSON lines
+@:param results: the (job, (best board, score)) tuples
+@:param out: the file to write to
+"""
+
+
+def writeResults(results: Iterable[Tuple[Job, Tuple[List[str], int]]], out: TextIO):
+    for (board, player, depth), (best, score) in results:
+        out.write(json.dumps({'board': board, 'player': player, 'depth': depth, 'best': best, 'score': score}))
+        out.write('\n')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Find the best move for every board in a file of jobs')
+    parser.add_argument('jobs', help='file of JSON lines, each [board, player, depth], or - for stdin')
+    parser.add_argument('results', nargs='?', default='-', help='file to write the results to (default stdout)')
+    parser.add_argument('--workers', type=int, default=None, help='number of worker processes')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='jobs sent to a worker at a time')
+    parser.add_argument('--cache', help='DiskCache file shared by the workers and kept between runs')
+    args = parser.parse_args()
+
+    cache = None if args.cache is None else DiskCache(args.cache)
+    infile = sys.stdin if args.jobs == '-' else open(args.jobs)
+    outfile = sys.stdout if args.results == '-' else open(args.results, 'w')
+    try:
+        writeResults(analyseBatch(readJobs(infile), args.workers, args.chunk_size, cache), outfile)
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+        if outfile is not sys.stdout:
+            outfile.close()
@@ -0,0 +1,136 @@
+"""
+Evaluation of a whole batch of List[List[str]] boards at once.
+The evaluator scores a board from four numbers: how many pieces each player has and how many steps they are away from
+the other side. With NumPy the boards of a batch are packed into one array with a row for each board and a column for
+each cell, and the four numbers of every board come out of a few reductions of that array: the counts are the sums of
+where the pieces are, and the steps are those multiplied by how far each cell is from the other side (one vector for
+white and one for black). The rules of goodness() in bitBoard.py (20 for a win, -20 for a loss, otherwise the
+difference in steps) are then applied to the whole batch with np.where.
+NumPy is optional. Without it evaluateBoards() counts the pieces of the boards one at a time in Python, the same way
+evaluator() does, and the scores are the same either way. HAVE_NUMPY says which one is used.
+
+The search uses this for dfs(..., batch=True) (engine='batch' in oskaplayer()), which evaluates all the children of a
+board at the last turn in one batch. Run this file to compare the speed of both on the boards a few turns from the
+start board:
+    python batchEval.py --plies 4
+"""
+
+import argparse
+import time
+from functools import lru_cache
+from typing import List, Tuple
+
+from bitBoard import boardTables, goodness
+
+try:
+    import numpy as np
+
+    HAVE_NUMPY = True
+except ImportError:
+    np = None
+    HAVE_NUMPY = False
+
+"""
+Function that returns how many steps a piece on each cell is away from the other side, for a board with rows rows of
+the given lengths. The cells are in the order of the rows joined together. Only used with NumPy.
+@:param row_lengths: how many cells each row of the board has
+@:return a tuple of the steps for a white piece on each cell and the steps for a black piece on each cell
+"""
+
+
+@lru_cache(maxsize=None)
+def rowDistances(row_lengths: Tuple[int, ...]) -> Tuple:
+    rows = len(row_lengths)
+    white = [rows - i - 1 for i, length in enumerate(row_lengths) for _ in range(length)]
+    black = [i for i, length in enumerate(row_lengths) for _ in range(length)]
+    return np.array(white, dtype=np.int64), np.array(black, dtype=np.int64)
+
+
+"""
+Function that evaluates every board of a batch for a player, with the same scores as evaluator() in oskaPlayer.py.
+All the boards have to be the same size.
+
+@:param boards: the boards, each a List[List[str]] or a List[str]
+@:param curr_player: the player the boards are evaluated for, 'w' or 'b'
+@:return a list with the score of each board
+"""
+
+
+def evaluateBoards(boards: List[List[List[str]]], curr_player: str) -> List[int]:
+    if not boards:
+        return []
+    if not HAVE_NUMPY:
+        scores = []
+        for board in boards:
+            white_count = white_steps = black_count = black_steps = 0
+            for i, row in enumerate(board):
+                for cell in row:
+                    if cell == 'w':
+                        white_steps += len(board) - i - 1
+                        white_count += 1
+                    elif cell == 'b':
+                        black_steps += i
+                        black_count += 1
+            if curr_player == 'w':
+                scores.append(goodness(white_count, white_steps, black_count, black_steps))
+            else:
+                scores.append(goodness(black_count, black_steps, white_count, white_steps))
+        return scores
+
+    white_distance, black_distance = rowDistances(tuple(len(row) for row in boards[0]))
+    # one byte for each cell of each board, a row for each board
+    cells = np.frombuffer(''.join(''.join(row) for board in boards for row in board).encode('ascii'), dtype=np.uint8)
+    cells = cells.reshape(len(boards), len(white_distance))
+    white = cells == ord('w')
+    black = cells == ord('b')
+    white_count, black_count = white.sum(axis=1), black.sum(axis=1)
+    white_steps, black_steps = white @ white_distance, black @ black_distance
+    if curr_player == 'w':
+        return _goodness(white_count, white_steps, black_count, black_steps).tolist()
+    return _goodness(black_count, black_steps, white_count, white_steps).tolist()
+
+
+# goodness() from bitBoard.py for arrays of counts and steps, the rules are checked in the same order
+def _goodness(count, steps, opp_count, opp_steps):
+    score = opp_steps - steps
+    score = np.where((opp_steps == 0) | (count == 0), -20, score)
+    score = np.where((opp_count == 0) | (steps == 0), 20, score)
+    # both players have their pieces on the other side, whichever has more pieces wins
+    both = (steps == 0) & (opp_steps == 0) & (count != 0) & (opp_count != 0)
+    score = np.where(both & (count > opp_count), 20, score)
+    return np.where(both & (opp_count > count), -20, score)
+
+
+# all the boards exactly plies turns from the board, used to get a wide batch for the comparison below
+def _frontier(board: List[List[str]], player: str, plies: int) -> List[List[List[str]]]:
+    from moveEngine import moveBoard, moveList
+
+    boards = [board]
+    for _ in range(plies):
+        boards = [moveBoard(board, move) for board in boards for move in moveList(board, player)]
+        player = 'b' if player == 'w' else 'w'
+    return boards
+
+
+if __name__ == '__main__':
+    from oskaPlayer import evaluator
+
+    parser = argparse.ArgumentParser(description='Compare evaluateBoards() with evaluator() on a batch of boards')
+    parser.add_argument('--plies', type=int, default=4, help='evaluate the boards this many turns from the start')
+    parser.add_argument('--n', type=int, default=4, help='length of the first row of the board (default 4)')
+    args = parser.parse_args()
+
+    rows = boardTables(args.n).rowLengths
+    start = [['w'] * args.n] + [['-'] * length for length in rows[1:-1]] + [['b'] * args.n]
+    boards = _frontier(start, 'w', args.plies)
+
+    began = time.perf_counter()
+    expected = [evaluator(board, 'w') for board in boards]
+    loop = time.perf_counter() - began
+    began = time.perf_counter()
+    scores = evaluateBoards(boards, 'w')
+    batch = time.perf_counter() - began
+    print(f'{len(boards)} boards, {HAVE_NUMPY=}')
+    print(f'evaluator()      {loop:.4f}s')
+    print(f'evaluateBoards() {batch:.4f}s ({loop / batch:.1f}x)')
+    print('same scores' if scores == expected else 'DIFFERENT SCORES')
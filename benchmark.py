@@ -0,0 +1,211 @@
+"""
+Benchmark of the whole search, from oskaplayer() down to the evaluator.
+A fixed set of boards (the start board of each size and a few boards from the middle of a game) is searched at every
+depth in a range, and for each search the benchmark records how long it took, how many nodes it searched, the peak
+memory of the process that ran it and the memory it allocated. Every search runs in a new process, so the peak memory
+is the one of that search and not the biggest of all the searches before it. The results are written to a JSON file,
+and if a baseline file from an earlier run is given, every search that got slower, used more memory or searched a
+different number of nodes is flagged (a different number of nodes means the search itself changed, not just its speed).
+
+    python benchmark.py --output before.json
+    python benchmark.py --output after.json --baseline before.json
+
+A size stops going deeper once one of its searches takes longer than --max-seconds, so the same command can be used
+for the quick sizes and the slow ones.
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+from bitBoard import boardTables
+from oskaPlayer import SearchStats, oskaplayer
+
+# how much slower than the baseline a search can be before it is flagged
+SLOWER = 1.25
+# searches quicker than this are too noisy to flag for being slower
+MIN_SECONDS = 0.05
+# how much more memory than the baseline a search can use before it is flagged, for the bytes it allocated and for the
+# peak RSS of its process
+MORE_MEMORY = 1.25
+# searches that allocated less than this at their peak are too small to flag for using more memory
+MIN_ALLOC_BYTES = 1024
+
+"""
+Function that returns the start board for a board whose top row is n cells long
+@:param n: the length of the first row of the board
+@:return the start board as a List[str]
+"""
+
+
+def startBoard(n: int) -> List[str]:
+    rows = boardTables(n).rowLengths
+    return ['w' * n] + ['-' * length for length in rows[1:-1]] + ['b' * n]
+
+
+"""
+Function that returns the boards the benchmark searches for a size of board. The middle game boards are found by
+playing the first turns with a shallow search, so they are the same every time.
+@:param n: the length of the first row of the board
+@:return a list of (name, board, whose turn it is) tuples
+"""
+
+
+def benchmarkPositions(n: int) -> List[Tuple[str, List[str], str]]:
+    if n == 4:
+        # boards from the game in main.py
+        return [('start', startBoard(4), 'w'),
+                ('turn=3', ['---w', 'www', 'b-', 'b--', '--bb'], 'w'),
+                ('turn=7', ['---w', 'w-w', 'bb', 'b-w', '---b'], 'w')]
+    board, player = startBoard(n), 'w'
+    for _ in range(2 * (n - 1)):
+        board = oskaplayer(board, player, 2)
+        player = 'b' if player == 'w' else 'w'
+    return [('start', startBoard(n), 'w'), (f'ply={2 * (n - 1)}', board, player)]
+
+
+"""
+Function that searches one board and measures it. The search runs in a new process (started with spawn, so it doesn't
+share any memory with this one) that only does this search.
+@:param board: the board to search
+@:param player: whose turn it is
+@:param depth: how deep to search
+@:param engine: 'alphabeta', 'dfs' or 'batch'
+@:param allocations: also run the search a second time with tracemalloc on to measure the memory it allocates
+@:return a dict with:
+    seconds, nodes, nodes_per_sec: how long the search took and how many nodes it searched
+    peak_rss_kb: the peak RSS of the process (KB on Linux). Most of it is the interpreter and the imports, so it only
+                 goes up for searches that need a lot of memory
+    peak_alloc_bytes: the most memory the search had allocated at once on top of what was allocated before it started
+                      (tracemalloc's peak, reset just before the search), so memory that is allocated and freed again
+                      at every node, like a copy of the board for each child, counts once for every board on the
+                      deepest line of the search
+    alloc_bytes_per_node: peak_alloc_bytes divided by the nodes
+"""
+
+
+def measure(board: List[str], player: str, depth: int, engine: str, allocations: bool = True) -> Dict:
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as pool:
+        return pool.submit(_measure, board, player, depth, engine, allocations).result()
+
+
+# runs in the new process, does what measure() says
+def _measure(board: List[str], player: str, depth: int, engine: str, allocations: bool) -> Dict:
+    stats = SearchStats()
+    start = time.perf_counter()
+    oskaplayer(board, player, depth, stats, engine)
+    seconds = time.perf_counter() - start
+    result = {'seconds': round(seconds, 6), 'nodes': stats.nodes, 'nodes_per_sec': round(stats.nodes / seconds),
+              'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}
+    if allocations:
+        # tracemalloc slows everything down, so it gets its own run that isn't timed
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        oskaplayer(board, player, depth, SearchStats(), engine)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result['peak_alloc_bytes'] = peak - before
+        result['alloc_bytes_per_node'] = round((peak - before) / stats.nodes, 2)
+    return result
+
+
+"""
+Function that runs the whole benchmark
+@:param sizes: the sizes of board to search
+@:param depths: the depths to search each board at
+@:param engine: 'alphabeta', 'dfs' or 'batch'
+@:param max_seconds: a board isn't searched any deeper once a search of it took longer than this
+@:param allocations: also measure the memory allocated by each search
+@:return a list of dicts, one for each search, with the size, board, depth and what measure() returns
+"""
+
+
+def runBenchmark(sizes: List[int], depths: List[int], engine: str, max_seconds: float,
+                 allocations: bool = True) -> List[Dict]:
+    results = []
+    for n in sizes:
+        for name, board, player in benchmarkPositions(n):
+            for depth in depths:
+                result = {'engine': engine, 'n': n, 'position': name, 'depth': depth}
+                result.update(measure(board, player, depth, engine, allocations))
+                results.append(result)
+                print(f"{engine} {n=} {name:8} {depth=} {result['seconds']:9.3f}s {result['nodes']:>9} nodes "
+                      f"{result['nodes_per_sec']:>8}/s")
+                if result['seconds'] > max_seconds:
+                    break
+    return results
+
+
+"""
+Function that compares the results with a baseline from an earlier run
+@:param results: the results of this run
+@:param baseline: the results of the earlier run
+@:return a list of strings, one for each search that got slower, used more memory or searched a different number of
+         nodes
+"""
+
+
+def compareBaseline(results: List[Dict], baseline: List[Dict]) -> List[str]:
+    def caseKey(result: Dict) -> Tuple:
+        return result['engine'], result['n'], result['position'], result['depth']
+
+    before = {caseKey(result): result for result in baseline}
+    flagged = []
+    for result in results:
+        old = before.get(caseKey(result))
+        if old is None:
+            continue
+        name = '{} n={} {} depth={}'.format(*caseKey(result))
+        if result['nodes'] != old['nodes']:
+            flagged.append(f"{name}: searched {result['nodes']} nodes, was {old['nodes']}")
+        if result['seconds'] > MIN_SECONDS and result['seconds'] > SLOWER * old['seconds']:
+            flagged.append(f"{name}: took {result['seconds']:.3f}s, was {old['seconds']:.3f}s")
+        if result['peak_rss_kb'] > MORE_MEMORY * old['peak_rss_kb']:
+            flagged.append(f"{name}: peak RSS {result['peak_rss_kb']} KB, was {old['peak_rss_kb']} KB")
+        # only when both runs measured the allocations
+        if 'peak_alloc_bytes' in result and 'peak_alloc_bytes' in old:
+            if (result['peak_alloc_bytes'] > MIN_ALLOC_BYTES and
+                    result['alloc_bytes_per_node'] > MORE_MEMORY * old['alloc_bytes_per_node']):
+                flagged.append(f"{name}: allocated {result['alloc_bytes_per_node']} bytes per node "
+                               f"({result['peak_alloc_bytes']} at the peak), was {old['alloc_bytes_per_node']} "
+                               f"({old['peak_alloc_bytes']})")
+    return flagged
+
+
+# parses a range like '3-9' or a single number into a list of ints
+def _span(text: str) -> List[int]:
+    low, _, high = text.partition('-')
+    return list(range(int(low), int(high or low) + 1))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the Oska search')
+    parser.add_argument('--sizes', type=_span, default=_span('4-7'), help='sizes of board, like 4-7 (default)')
+    parser.add_argument('--depths', type=_span, default=_span('3-9'), help='depths to search, like 3-9 (default)')
+    parser.add_argument('--engine', choices=['alphabeta', 'dfs', 'batch'], default='alphabeta')
+    parser.add_argument('--max-seconds', type=float, default=30, help='stop going deeper after a search this long')
+    parser.add_argument('--no-allocations', action='store_true', help="don't measure the memory allocated")
+    parser.add_argument('--output', default='benchmark.json', help='file to write the results to')
+    parser.add_argument('--baseline', help='results of an earlier run to compare with')
+    args = parser.parse_args()
+
+    results = runBenchmark(args.sizes, args.depths, args.engine, args.max_seconds, not args.no_allocations)
+    with open(args.output, 'w') as file:
+        json.dump({'python': platform.python_version(), 'machine': platform.machine(), 'time': time.time(),
+                   'results': results}, file, indent=1)
+    print(f'wrote {args.output}')
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            flagged = compareBaseline(results, json.load(file)['results'])
+        for line in flagged:
+            print(f'REGRESSION {line}')
+        sys.exit(1 if flagged else 0)
@@ -0,0 +1,383 @@
+"""
+Bitboard representation of an Oska board.
+Each side is stored as one int where bit i is set when that side has a piece on cell i. Cells are numbered row by row,
+left to right, so for the 4-3-2-3-4 board the top row is cells 0-3, the next row is cells 4-6 and so on. Everything
+that only depends on the size of the board (which cell is next to which, where a jump lands, how many steps a cell is
+from the other side) is worked out once per size by boardTables() and then looked up during the search.
+Moves are (from, over, to) tuples of cell numbers, over is NO_CELL for a forward move and the captured cell otherwise.
+"""
+
+from typing import Dict, Iterator, List, Tuple
+
+# used in the tables and in moves when there is no cell (off the board or nothing captured)
+NO_CELL = -1
+
+"""
+Class BoardTables holds all the lookup tables for one size of board. Don't build it directly, use boardTables() so the
+tables only get built once for each size.
+For each cell, whiteSlots and blackSlots have the (over, to) slots of the moves a piece on that cell could make. A slot
+with over == NO_CELL is a forward move to an empty cell, the others are captures of an opponent's piece on over landing
+on an empty to. The slots of a cell are in the same order the old hand written generators (see legacyMoveGen.py) listed
+the moves, so every search breaks ties between equally good moves the same way the original one did.
+whiteTargets and blackTargets are the same slots as ((row, col) moved to, (row, col) jumped over or None) pairs, looked
+up by [row][col], for the List[List[str]] move generator in moveEngine.py.
+"""
+
+
+class BoardTables:
+    def __init__(self, n: int):
+        self.n = n
+        self.rows = 2 * n - 3
+        self.mid = (self.rows - 1) // 2
+        # rows get one shorter until the middle row (which is 2 long) then one longer again
+        self.rowLengths = [2 + abs(r - self.mid) for r in range(self.rows)]
+        self.cells = [(r, c) for r in range(self.rows) for c in range(self.rowLengths[r])]
+        self.index = []
+        for r in range(self.rows):
+            self.index.append([NO_CELL] * self.rowLengths[r])
+        for i, (r, c) in enumerate(self.cells):
+            self.index[r][c] = i
+        self.size = len(self.cells)
+        self.full = (1 << self.size) - 1
+
+        # how many rows each cell is away from the other side, for white (going down) and black (going up)
+        self.whiteSteps = [self.rows - r - 1 for r, _ in self.cells]
+        self.blackSteps = [r for r, _ in self.cells]
+        self.rowMasks = [0] * self.rows
+        for i, (r, _) in enumerate(self.cells):
+            self.rowMasks[r] |= 1 << i
+
+        self.whiteSlots = [self.moveSlots(i, 1) for i in range(self.size)]
+        self.blackSlots = [self.moveSlots(i, -1) for i in range(self.size)]
+        self.whiteTargets = self.targets(self.whiteSlots)
+        self.blackTargets = self.targets(self.blackSlots)
+
+    # the cell one step away from (row, col) in the direction, or NO_CELL if that is off the board
+    def step(self, row: int, col: int, down: int, right: bool) -> Tuple[int, int]:
+        newRow = row + down
+        if newRow < 0 or newRow >= self.rows:
+            return NO_CELL, NO_CELL
+        # the row that is moved to is either one longer or one shorter, which shifts the columns by one
+        longer = self.rowLengths[newRow] > self.rowLengths[row]
+        newCol = col + (1 if longer else 0) - (0 if right else 1)
+        if newCol < 0 or newCol >= self.rowLengths[newRow]:
+            return NO_CELL, NO_CELL
+        return newRow, newCol
+
+    # the (over, to) slots of a cell, see the class description for the order they are in
+    def moveSlots(self, i: int, down: int) -> Tuple[Tuple[int, int], ...]:
+        row, col = self.cells[i]
+        forwards, captures = {}, {}
+        for right in (False, True):
+            nRow, nCol = self.step(row, col, down, right)
+            if nRow == NO_CELL:
+                continue
+            forwards[right] = (NO_CELL, self.index[nRow][nCol])
+            jRow, jCol = self.step(nRow, nCol, down, right)
+            if jRow != NO_CELL:
+                captures[right] = (self.index[nRow][nCol], self.index[jRow][jCol])
+
+        if 0 < col < self.rowLengths[row] - 1:
+            # piece in the middle of a row: forward then capture, left side first
+            order = [(forwards, False), (captures, False), (forwards, True), (captures, True)]
+        elif down == 1:
+            # white piece on the edge of a row: forwards then captures, captures start from the edge the piece is on
+            first = col != 0
+            order = [(forwards, False), (forwards, True), (captures, first), (captures, not first)]
+        else:
+            # black piece on the edge of a row: forwards then captures, right side first
+            order = [(forwards, True), (forwards, False), (captures, True), (captures, False)]
+        return tuple(slots[right] for slots, right in order if right in slots)
+
+    # the slots of every cell turned into (row, col) pairs, by row and then column
+    def targets(self, slots: List[Tuple[Tuple[int, int], ...]]) -> List[List[Tuple]]:
+        targets = [[None] * length for length in self.rowLengths]
+        for i, (r, c) in enumerate(self.cells):
+            targets[r][c] = tuple((self.cells[to], None if over == NO_CELL else self.cells[over])
+                                  for over, to in slots[i])
+        return targets
+
+
+_tables: Dict[int, BoardTables] = {}
+
+"""
+Function that returns the tables for a board whose top row is n cells long. They are built the first time a size is
+asked for and shared after that.
+@:param n: the length of the first row of the board (4 for the standard board)
+@:return the BoardTables for that size
+"""
+
+
+def boardTables(n: int) -> BoardTables:
+    tables = _tables.get(n)
+    if tables is None:
+        tables = _tables[n] = BoardTables(n)
+    return tables
+
+
+"""
+Function to convert a board (either a List[str] or a List[List[str]]) into the white and black bitboards
+@:param tables: the BoardTables for the size of the board
+@:param board: the board to convert
+@:return a tuple of the white bitboard and the black bitboard
+"""
+
+
+def toBits(tables: BoardTables, board: List[str]) -> Tuple[int, int]:
+    white = black = 0
+    i = 0
+    for row in board:
+        for cell in row:
+            if cell == 'w':
+                white |= 1 << i
+            elif cell == 'b':
+                black |= 1 << i
+            i += 1
+    return white, black
+
+
+"""
+Function to convert the white and black bitboards back into the List[str] representation of the board
+@:param tables: the BoardTables for the size of the board
+@:param white: the white bitboard
+@:param black: the black bitboard
+@:return a List[str] representation of the board
+"""
+
+
+def fromBits(tables: BoardTables, white: int, black: int) -> List[str]:
+    cells = ['w' if white >> i & 1 else 'b' if black >> i & 1 else '-' for i in range(tables.size)]
+    board = []
+    start = 0
+    for length in tables.rowLengths:
+        board.append(''.join(cells[start:start + length]))
+        start += length
+    return board
+
+
+"""
+Function that generates all the moves a curr_player can make. The pieces are gone through in the same order as the
+cells of the board and the moves of each piece are in the order of its slots (see BoardTables).
+@:param tables: the BoardTables for the size of the board
+@:param white: the white bitboard
+@:param black: the black bitboard
+@:param curr_player: 'w' or 'b', whose moves to generate
+@:return a list of (from, over, to) moves
+"""
+
+
+def genMoves(tables: BoardTables, white: int, black: int, curr_player: str) -> List[Tuple[int, int, int]]:
+    if curr_player == 'w':
+        mine, theirs, slots = white, black, tables.whiteSlots
+    else:
+        mine, theirs, slots = black, white, tables.blackSlots
+    empty = tables.full & ~(white | black)
+    moves = []
+    pieces = mine
+    while pieces:
+        low = pieces & -pieces
+        pieces ^= low
+        frm = low.bit_length() - 1
+        for over, to in slots[frm]:
+            if empty >> to & 1 and (over == NO_CELL or theirs >> over & 1):
+                moves.append((frm, over, to))
+    return moves
+
+
+"""
+Streaming version of genMoves(). The moves are yielded one at a time so a search that gets a cutoff early never
+generates the rest, and all the captures come before the forward moves since they are the most likely to cause one.
+@:param tables: the BoardTables for the size of the board
+@:param white: the white bitboard
+@:param black: the black bitboard
+@:param curr_player: 'w' or 'b', whose moves to generate
+@:return a generator of (from, over, to) moves, captures first
+"""
+
+
+def lazyMoves(tables: BoardTables, white: int, black: int, curr_player: str) -> Iterator[Tuple[int, int, int]]:
+    if curr_player == 'w':
+        mine, theirs, slots = white, black, tables.whiteSlots
+    else:
+        mine, theirs, slots = black, white, tables.blackSlots
+    empty = tables.full & ~(white | black)
+    # first go through the pieces for the captures, then a second time for the forward moves
+    pieces = mine
+    while pieces:
+        low = pieces & -pieces
+        pieces ^= low
+        frm = low.bit_length() - 1
+        for over, to in slots[frm]:
+            if over != NO_CELL and empty >> to & 1 and theirs >> over & 1:
+                yield frm, over, to
+    pieces = mine
+    while pieces:
+        low = pieces & -pieces
+        pieces ^= low
+        frm = low.bit_length() - 1
+        for over, to in slots[frm]:
+            if over == NO_CELL and empty >> to & 1:
+                yield frm, over, to
+
+
+"""
+Function to check that a move can be played on a board, used for moves that didn't come from the move generator (like
+the best move stored in the transposition table)
+@:param tables: the BoardTables for the size of the board
+@:param white: the white bitboard
+@:param black: the black bitboard
+@:param curr_player: 'w' or 'b', who would be making the move
+@:param move: the (from, over, to) move
+@:return True if the move is one of the moves genMoves() would return
+"""
+
+
+def isLegal(tables: BoardTables, white: int, black: int, curr_player: str, move: Tuple[int, int, int]) -> bool:
+    frm, over, to = move
+    if curr_player == 'w':
+        mine, theirs, slots = white, black, tables.whiteSlots
+    else:
+        mine, theirs, slots = black, white, tables.blackSlots
+    if not mine >> frm & 1 or (over, to) not in slots[frm] or (white | black) >> to & 1:
+        return False
+    return over == NO_CELL or theirs >> over & 1 == 1
+
+
+"""
+Function to play a move
+@:param white: the white bitboard
+@:param black: the black bitboard
+@:param curr_player: 'w' or 'b', who is making the move
+@:param move: the (from, over, to) move
+@:return a tuple of the white bitboard and the black bitboard after the move
+"""
+
+
+def playMove(white: int, black: int, curr_player: str, move: Tuple[int, int, int]) -> Tuple[int, int]:
+    frm, over, to = move
+    moved = (1 << frm) | (1 << to)
+    captured = 0 if over == NO_CELL else 1 << over
+    if curr_player == 'w':
+        return white ^ moved, black ^ captured
+    return white ^ captured, black ^ moved
+
+
+"""
+Function that evaluates the goodness of a board for the curr_player. Gives the same value as evaluator() in
+oskaPlayer.py does for the List[List[str]] version of the board, see there for how the value is worked out.
+@:param tables: the BoardTables for the size of the board
+@:param white: the white bitboard
+@:param black: the black bitboard
+@:param curr_player: the player the board is evaluated for
+@:return an integer value that represents the goodness of the board
+"""
+
+
+def evaluateBits(tables: BoardTables, white: int, black: int, curr_player: str) -> int:
+    return evaluateMaterial(material(tables, white, black), curr_player)
+
+
+"""
+Function that counts the pieces of both players and the steps they are away from the other side. The search works this
+out once for the board it starts from and then updates it for every move with moveMaterial(), so the boards at the
+bottom of the search can be evaluated without going through the board.
+@:param tables: the BoardTables for the size of the board
+@:param white: the white bitboard
+@:param black: the black bitboard
+@:return a (white count, white steps, black count, black steps) tuple
+"""
+
+
+def material(tables: BoardTables, white: int, black: int) -> Tuple[int, int, int, int]:
+    white_steps = black_steps = 0
+    last = tables.rows - 1
+    for r, mask in enumerate(tables.rowMasks):
+        white_steps += (white & mask).bit_count() * (last - r)
+        black_steps += (black & mask).bit_count() * r
+    return white.bit_count(), white_steps, black.bit_count(), black_steps
+
+
+"""
+Function that updates the counts and steps of material() for a move
+@:param tables: the BoardTables for the size of the board
+@:param counts: the (white count, white steps, black count, black steps) before the move
+@:param curr_player: 'w' or 'b', who is making the move
+@:param move: the (from, over, to) move
+@:return the (white count, white steps, black count, black steps) after the move
+"""
+
+
+def moveMaterial(tables: BoardTables, counts: Tuple[int, int, int, int], curr_player: str,
+                 move: Tuple[int, int, int]) -> Tuple[int, int, int, int]:
+    white_count, white_steps, black_count, black_steps = counts
+    frm, over, to = move
+    if curr_player == 'w':
+        white_steps += tables.whiteSteps[to] - tables.whiteSteps[frm]
+        if over != NO_CELL:
+            black_count -= 1
+            black_steps -= tables.blackSteps[over]
+    else:
+        black_steps += tables.blackSteps[to] - tables.blackSteps[frm]
+        if over != NO_CELL:
+            white_count -= 1
+            white_steps -= tables.whiteSteps[over]
+    return white_count, white_steps, black_count, black_steps
+
+
+"""
+Function that evaluates the board after a move from the counts and steps of the board before it, the same value
+evaluateBits() gives for the board after the move. It only does a few lookups and doesn't make any objects, which is
+what the search uses for the boards at the bottom of the search.
+@:param tables: the BoardTables for the size of the board
+@:param counts: the (white count, white steps, black count, black steps) before the move
+@:param curr_player: 'w' or 'b', who is making the move
+@:param move: the (from, over, to) move
+@:param player: the player the board is evaluated for
+@:return an integer value that represents the goodness of the board after the move
+"""
+
+
+def evaluateMove(tables: BoardTables, counts: Tuple[int, int, int, int], curr_player: str,
+                 move: Tuple[int, int, int], player: str) -> int:
+    return evaluateMaterial(moveMaterial(tables, counts, curr_player, move), player)
+
+
+"""
+Function that evaluates a board from its counts and steps, the same value evaluateBits() gives for the board
+@:param counts: the (white count, white steps, black count, black steps) of the board
+@:param player: the player the board is evaluated for
+@:return an integer value that represents the goodness of the board
+"""
+
+
+def evaluateMaterial(counts: Tuple[int, int, int, int], player: str) -> int:
+    white_count, white_steps, black_count, black_steps = counts
+    if player == 'w':
+        return goodness(white_count, white_steps, black_count, black_steps)
+    return goodness(black_count, black_steps, white_count, white_steps)
+
+
+"""
+Function with the rules the evaluator uses to score a board, given how many pieces each side has and how many steps
+they are away from the other side in total.
+@:param count: how many pieces the player has
+@:param steps: the total steps the player's pieces are away from the other side
+@:param opp_count: how many pieces the opponent has
+@:param opp_steps: the total steps the opponent's pieces are away from the other side
+@:return +20 for a win, -20 for a loss and the difference in steps otherwise
+"""
+
+
+def goodness(count: int, steps: int, opp_count: int, opp_steps: int) -> int:
+    # if both players have their pieces on the other side, whichever has more pieces wins
+    if steps == 0 and opp_steps == 0 and count != 0 and opp_count != 0:
+        if count > opp_count:
+            return 20
+        elif opp_count > count:
+            return -20
+    # player winning situation
+    if opp_count == 0 or steps == 0:
+        return 20
+    elif opp_steps == 0 or count == 0:  # opponent winning situation
+        return -20
+    return opp_steps - steps
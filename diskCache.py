@@ -0,0 +1,197 @@
+"""
+Search cache on disk that any number of processes can share.
+Each board the search was started from is stored with how deep it was searched, the score of the best move for the
+player whose turn it was and the best move itself. A later search of the same board, in the same process or another
+one, or after a restart, can play the stored move straight away when it was searched at least as deep as asked for.
+
+The cache is an SQLite database in WAL mode, so readers don't block the writer and the writes of different processes
+are serialised by SQLite's own file locks (a process waits up to timeout seconds for the lock). A store only replaces
+an entry that was searched less deep. A hit updates when the entry was last used if that was more than TOUCH_AFTER
+seconds ago, so most hits only read the file and don't wait for the lock. A store that takes the cache over max_entries
+entries deletes the ones used longest ago in the same transaction, so no process ever sees more than max_entries. The
+number of entries is kept up to date by triggers so it doesn't have to be counted.
+
+The key of a board is its size, both bitboards, whose turn it is and the tablebase the search used if any (see
+cacheKey()), so it is the same in every process, unlike the Zobrist keys of the transposition table. With
+symmetric=True the key is the one of the canonical form of the board (see symmetry.py), which needs about a quarter of
+the entries, but a hit can then give a different move with the same score than a search of the board itself would have
+picked.
+
+Open it once in each process and pass it to oskaplayer(..., cache=cache). A DiskCache can be sent to a worker process,
+the worker opens its own connection to the same file.
+"""
+
+import os
+import sqlite3
+import time
+from typing import Dict, Tuple
+
+from bitBoard import BoardTables
+from symmetry import IDENTITY, canonicalBits, transformMove
+from tablebase import Tablebase
+
+# how many entries a cache keeps by default
+DEFAULT_ENTRIES = 1_000_000
+# how many seconds after the last update of when an entry was used a hit updates it again
+TOUCH_AFTER = 60.0
+
+"""
+Function that returns the key of a board in the cache
+@:param tables: the BoardTables for the size of the board
+@:param white: the white bitboard
+@:param black: the black bitboard
+@:param turn: whose turn it is
+@:param tablebase: the Tablebase the search used, or None. The scores of a search with a tablebase are exact where the
+                   one without only has the evaluator, so they get different keys
+@:return the key as a str
+"""
+
+
+def cacheKey(tables: BoardTables, white: int, black: int, turn: str, tablebase: Tablebase = None) -> str:
+    key = f'{tables.n}:{white:x}:{black:x}:{turn}'
+    return key if tablebase is None else f'{key}:tb{tablebase.pieces}'
+
+
+"""
+Class DiskCache is an open cache file. Its functions can be called from any number of processes at once, lookup() and
+save() take a board and work out its key, probe() and store() take the key.
+"""
+
+
+class DiskCache:
+    def __init__(self, path: str, max_entries: int = DEFAULT_ENTRIES, timeout: float = 30.0, symmetric: bool = False):
+        self.path = path
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self.symmetric = symmetric
+        self.hits = self.misses = self.stores = self.evictions = 0
+        self._connection = None
+        self._pid = None
+        self.connection()
+
+    # function that returns the connection to the file, a forked process gets a new one since an SQLite connection
+    # can't be shared between processes
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None or self._pid != os.getpid():
+            # autocommit, every statement is its own transaction
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute('CREATE TABLE IF NOT EXISTS positions (key TEXT PRIMARY KEY, depth INTEGER NOT NULL, '
+                               'score INTEGER NOT NULL, frm INTEGER NOT NULL, over INTEGER NOT NULL, '
+                               'dest INTEGER NOT NULL, used REAL NOT NULL)')
+            connection.execute('CREATE INDEX IF NOT EXISTS positions_used ON positions (used)')
+            # the number of entries, counted once for a file made before it was kept
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                connection.execute('CREATE TABLE IF NOT EXISTS size (entries INTEGER NOT NULL)')
+                connection.execute('CREATE TRIGGER IF NOT EXISTS positions_insert AFTER INSERT ON positions '
+                                   'BEGIN UPDATE size SET entries = entries + 1; END')
+                connection.execute('CREATE TRIGGER IF NOT EXISTS positions_delete AFTER DELETE ON positions '
+                                   'BEGIN UPDATE size SET entries = entries - 1; END')
+                connection.execute('INSERT INTO size SELECT count(*) FROM positions '
+                                   'WHERE NOT EXISTS (SELECT 1 FROM size)')
+                connection.execute('COMMIT')
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+            self._connection, self._pid = connection, os.getpid()
+        return self._connection
+
+    # function to look up a board, returns (depth, score, move) or None if it isn't in the cache. The score is for the
+    # player whose turn it is and the move is a move on the board as it was passed in
+    def lookup(self, tables: BoardTables, white: int, black: int, turn: str,
+               tablebase: Tablebase = None) -> Tuple[int, int, Tuple[int, int, int]]:
+        transform = IDENTITY
+        if self.symmetric:
+            white, black, turn, transform = canonicalBits(tables, white, black, turn)
+        entry = self.probe(cacheKey(tables, white, black, turn, tablebase))
+        if entry is None:
+            return None
+        depth, score, move = entry
+        return depth, score, transformMove(tables, move, transform)
+
+    # function to store the result of a search of a board, see store()
+    def save(self, tables: BoardTables, white: int, black: int, turn: str, depth: int, score: int,
+             move: Tuple[int, int, int], tablebase: Tablebase = None):
+        if self.symmetric:
+            white, black, turn, transform = canonicalBits(tables, white, black, turn)
+            move = transformMove(tables, move, transform)
+        self.store(cacheKey(tables, white, black, turn, tablebase), depth, score, move)
+
+    # function to look up a key, returns (depth, score, move) or None if it isn't in the cache
+    def probe(self, key: str) -> Tuple[int, int, Tuple[int, int, int]]:
+        connection = self.connection()
+        row = connection.execute('SELECT depth, score, frm, over, dest, used FROM positions WHERE key = ?',
+                                 (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        depth, score, frm, over, dest, used = row
+        now = time.time()
+        if now - used > TOUCH_AFTER:
+            connection.execute('UPDATE positions SET used = ? WHERE key = ?', (now, key))
+        return depth, score, (frm, over, dest)
+
+    # function to store the result of a search, it only replaces an entry that was searched less deep. If the cache has
+    # more than max_entries entries after it, the ones used longest ago are deleted
+    def store(self, key: str, depth: int, score: int, move: Tuple[int, int, int]):
+        connection = self.connection()
+        # the store, the count and the delete are one transaction so two processes don't both delete the extra entries
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            connection.execute(
+                'INSERT INTO positions VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET '
+                'depth = excluded.depth, score = excluded.score, frm = excluded.frm, over = excluded.over, '
+                'dest = excluded.dest, used = excluded.used WHERE excluded.depth >= positions.depth',
+                (key, depth, score, *move, time.time()))
+            extra = connection.execute('SELECT entries FROM size').fetchone()[0] - self.max_entries
+            if extra > 0:
+                connection.execute('DELETE FROM positions WHERE key IN '
+                                   '(SELECT key FROM positions WHERE key != ? ORDER BY used LIMIT ?)', (key, extra))
+                self.evictions += extra
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        self.stores += 1
+
+    # number of entries in the cache, from every process
+    def __len__(self):
+        return self.connection().execute('SELECT entries FROM size').fetchone()[0]
+
+    # function to close the connection of this process, the next probe() or store() opens a new one
+    def close(self):
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+
+    # only the file and the settings are sent to another process, which opens the file there once (see openDiskCache())
+    def __reduce__(self):
+        return openDiskCache, (self.path, self.max_entries, self.timeout, self.symmetric)
+
+    # overriding string function to print stuff out. Used for debugging purposes
+    def __str__(self):
+        return f'{self.path=}, {self.symmetric=}, {self.hits=}, {self.misses=}, {self.stores=}, {self.evictions=}'
+
+
+_opened: Dict[str, DiskCache] = {}
+
+"""
+Function that opens a cache file, or returns the one that is already open in this process (so the worker processes of
+batchAnalysis.py only open it once each)
+@:param path: the cache file
+@:param max_entries: how many entries the cache keeps
+@:param timeout: how many seconds to wait for another process to let go of the lock
+@:param symmetric: key the boards on their canonical form
+@:return the DiskCache
+"""
+
+
+def openDiskCache(path: str, max_entries: int = DEFAULT_ENTRIES, timeout: float = 30.0,
+                  symmetric: bool = False) -> DiskCache:
+    cache = _opened.get(path)
+    if cache is None:
+        cache = _opened[path] = DiskCache(path, max_entries, timeout, symmetric)
+    return cache
@@ -0,0 +1,125 @@
+"""
+A whole game for one player, searching every turn with what was found out on the turns before.
+oskaplayer() starts every turn from scratch unless it is given a table and a MoveOrder to keep, and it doesn't know
+which turn of which game it is searching. A GameSession keeps, for the length of a game:
+    - the transposition table. The boards the last search went through below the opponent's reply are looked up instead
+      of searched again; they were searched two turns less deep than the new search needs, so mostly they give the best
+      move to try first, and with a time limit the first depths of the new search come straight out of the table. The
+      boards of the earlier turns can't come up again (pieces only move forward), so each turn starts a new generation
+      of the table and they make way for the boards of the new search
+    - the history table of the move ordering
+    - the reply the last search expected from the opponent, to count how often the opponent played it
+    - the score of every move it played
+The moves it plays are the same ones oskaplayer() plays for the same depth. Searching the root move the table has first
+isn't done without a time limit: the scores of a lot of moves are the same and the first one in generation order has
+to win, so trying a later move first made the search look at more boards, not fewer.
+
+    session = GameSession('w', depth=7)
+    board = session.move(board)     # white's move
+    ...                             # black moves
+    board = session.move(board)     # white again, starting from the last search
+"""
+
+import time
+from typing import List, Tuple
+
+from bitBoard import BoardTables, boardTables, fromBits, genMoves, playMove, toBits
+from moveOrder import MoveOrder
+from oskaPlayer import SearchContext, SearchStats, deepenRoot, searchRoot
+from tablebase import Tablebase
+from transTable import TranspositionTable, moveKey, positionKey, zobristKeys
+
+# memory for the transposition table of a session, it is kept for the whole game so it gets more than one search's
+SESSION_TABLE_MEMORY = 32 * 1024 * 1024
+
+"""
+Class GameSession plays one side of a game and keeps its search state from one turn to the next, see the top of the
+file. Use one session per player and per game.
+"""
+
+
+class GameSession:
+    def __init__(self, player: str, depth: int, time_limit: float = None, tablebase: Tablebase = None,
+                 memory: int = SESSION_TABLE_MEMORY):
+        self.player = player
+        self.depth = depth
+        self.time_limit = time_limit
+        self.tablebase = tablebase
+        self.table = TranspositionTable(memory)
+        self.ordering = MoveOrder()
+        self.stats = SearchStats()
+        self.tables: BoardTables = None
+        # the (white, black) board the last search expected the opponent to leave, None before the first move
+        self.expected: Tuple[int, int] = None
+        # the score of every move played, for self.player
+        self.scores: List[int] = []
+        # how many turns the opponent played the expected reply, and how many deepening searches started with the move
+        # the table had for the board
+        self.predicted = self.reused = 0
+
+    # function that returns the board after the best move for self.player, the same as oskaplayer(board, player, depth)
+    def move(self, board: List[str]) -> List[str]:
+        if self.tables is None or self.tables.n != len(board[0]):
+            self.newGame(boardTables(len(board[0])))
+        tables, player = self.tables, self.player
+        white, black = toBits(tables, board)
+        next_moves = genMoves(tables, white, black, player)
+        if not next_moves:
+            self.expected = None
+            next_player = 'b' if player == 'w' else 'w'
+            # same as oskaplayer(): the board comes back as it is if the opponent can still move
+            return None if not genMoves(tables, white, black, next_player) else board
+
+        if self.expected == (white, black):
+            self.predicted += 1
+        # the entries of the earlier turns stay in the table but make way for the boards of this one
+        self.table.newGeneration()
+        self.ordering.newSearch()
+        keys = zobristKeys(tables)
+        key = positionKey(keys, white, black, player, player)
+        best_move, score = self.search(white, black, next_moves, key)
+        self.scores.append(score)
+        new_white, new_black = playMove(white, black, player, best_move)
+        self.expected = self.expectedReply(moveKey(keys, key, player, best_move), new_white, new_black)
+        return fromBits(tables, new_white, new_black)
+
+    # function that searches the board, one depth at a time with a time limit like minmaxBits() does (see deepenRoot())
+    def search(self, white: int, black: int, next_moves: List[Tuple[int, int, int]],
+               key: int) -> Tuple[Tuple[int, int, int], int]:
+        if self.time_limit is None:
+            search = SearchContext(self.tables, self.player, self.depth, self.stats, self.table, self.tablebase,
+                                   self.ordering)
+            best_move, score = searchRoot(search, white, black, next_moves)
+            self.stats.depth = self.depth
+            return best_move, score
+        start = time.perf_counter()
+        # the shallow depths start with the best move the last search found for this board, if it went through it
+        best_move = None
+        entry = self.table.probe(key)
+        if entry is not None and entry[4] in next_moves:
+            best_move = entry[4]
+            self.reused += 1
+        return deepenRoot(self.tables, white, black, self.player, next_moves, self.depth, start + self.time_limit,
+                          self.stats, self.table, self.tablebase, self.ordering, best_move)
+
+    # function that finds the board the search expects the opponent to leave after the move that was just played, from
+    # the best move the table has for the board after it
+    def expectedReply(self, key: int, white: int, black: int) -> Tuple[int, int]:
+        opponent = 'b' if self.player == 'w' else 'w'
+        entry = self.table.probe(key)
+        if entry is None or entry[4] not in genMoves(self.tables, white, black, opponent):
+            return None
+        return playMove(white, black, opponent, entry[4])
+
+    # function to start a new game, everything learned in the last one is dropped
+    def newGame(self, tables: BoardTables = None):
+        self.tables = tables
+        self.table.clear()
+        self.ordering = MoveOrder()
+        self.expected = None
+        self.scores = []
+        self.predicted = self.reused = 0
+
+    # overriding string function to print stuff out. Used for debugging purposes
+    def __str__(self):
+        return f'{self.player=}, {self.depth=}, {self.stats.nodes=}, {self.predicted=}, {self.reused=}, {self.scores=}'
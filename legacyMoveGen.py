@@ -0,0 +1,350 @@
+"""
+The original hand written move generators, one branch for every edge case of the standard board. They were replaced by
+the table driven generator in moveEngine.py and are only kept here so the new generator can be checked against them
+with crossCheck(). There is one known difference: the old black generator wraps around to the bottom row for a black
+piece on the left end of the top row (board[row - 1] with row 0), which moveEngine.py doesn't do.
+
+To check the new generator against these from the start board and the board in main.py:
+    python legacyMoveGen.py --depth 6
+"""
+
+import argparse
+from typing import Iterator, List, Tuple
+
+from moveEngine import Move, makeMove, moveBoard, moveList, unmakeMove
+
+"""
+Object for a piece
+Keeps track of which curr_player the piece belongs to and its current position on the board
+"""
+
+
+class Piece:
+    def __init__(self, player: str, i: int, j: int):
+        self.player = player
+        self.row = i
+        self.col = j
+
+    # function to just print out the object. Used for debugging purposes
+    def __str__(self):
+        return f'{self.player=}, {self.row=}, {self.col=}'
+
+
+"""
+Function that generates all the moves for a curr_player as (from, to, captured) tuples with the old generators. Same
+as moveList() in moveEngine.py, which should be used instead.
+
+@:param board: the current board
+@:param piece: a char value of either 'b' or 'w' which represents who's turn it is
+@:return a list of all the moves the curr_player can make
+"""
+
+
+def legacyMoveList(board: List[List[str]], piece: str) -> List[Move]:
+    new = []
+    # go through the board and find all the pieces for the curr_player
+    for idx, row in enumerate(board):
+        for jdx, cell in enumerate(row):
+            if cell == piece:
+                playerPiece = Piece(cell, idx, jdx)
+                # generate the moves for the curr_player's piece
+                moves = possibleMoves(board, playerPiece)
+                # append all the new moves generated
+                for move in moves:
+                    new.append(move)
+    return new
+
+
+"""
+Function to generate the moves for an individual piece on the board
+@:param board: the current board 
+@:param playerPiece: the current piece that will be used to generate the new moves for
+@:return a generator of all the (from, to, captured) moves this current playerPiece can make
+"""
+
+
+def possibleMoves(board: List[List[str]], playerPiece: Piece) -> Iterator[Move]:
+    # depending on which curr_player it is, the moves will either be going downwards or upwards.
+    # so depending on whose turn it is, return the appropriate moves
+    if playerPiece.player == 'w':
+        return whiteMoves(board, playerPiece)
+    else:
+        # the black moves
+        return blackMoves(board, playerPiece)
+
+
+"""
+Function to generate the moves of a given white piece on the board. Does not do any error checking, assumes all input is 
+valid.
+@:param board: the current board
+@:param playerPiece: the piece that will be moved
+@:return a list of all the (from, to, captured) moves this current white playerPiece can make
+"""
+
+
+def whiteMoves(board: List[List[str]], playerPiece: Piece) -> Iterator[Move]:
+    # need the row and col of the current piece to determine which moves can be made from this position
+    row, col = playerPiece.row, playerPiece.col
+    # need the size of the board to know the bounds of the board
+    size = len(board)
+
+    # if the col is 0, then can't go diagonally to the left cause out of bounds unless its on the lower half of the
+    # board
+    if col == 0:
+        # Moving forward
+        # two scenarios: piece is either on the upper half or on the lower half
+        if row < size - 1 and board[row + 1][col] == '-':
+            yield ((row, col), (row + 1, col), None)
+        # lower half
+        if (size - 1) // 2 <= row < size - 1 and board[row + 1][col + 1] == '-':
+            yield ((row, col), (row + 1, col + 1), None)
+
+        # if there is an opponent's piece then capture
+        # upper half
+        if row < size - 2 and row != ((size - 1) // 2) - 1 and board[row + 1][col] == 'b' \
+                and board[row + 2][col] == '-':
+            yield ((row, col), (row + 2, col), (row + 1, col))
+        # the piece is on the row just above the center
+        if row == ((size - 1) // 2) - 1 and board[row + 1][col] == 'b' and board[row + 2][col + 1] == '-':
+            yield ((row, col), (row + 2, col + 1), (row + 1, col))
+        # if the piece is on the lower half of the board
+        if (size - 1) // 2 <= row < size - 2 and board[row + 1][col + 1] == 'b' and board[row + 2][col + 2] == '-':
+            yield ((row, col), (row + 2, col + 2), (row + 1, col + 1))
+    # the piece is on the far right most side of the current row
+    elif col == len(board[row]) - 1:
+        # same thing again, generate the forward moves then the capture moves
+        # forward moves - upper half
+        if row < (size - 1) // 2 and board[row + 1][col - 1] == '-':
+            yield ((row, col), (row + 1, col - 1), None)
+        # forward moves - lower half
+        if (size - 1) // 2 <= row < size - 1:
+            if board[row + 1][col] == '-':
+                yield ((row, col), (row + 1, col), None)
+            if board[row + 1][col + 1] == '-':
+                yield ((row, col), (row + 1, col + 1), None)
+
+        # capture moves - upper half
+        if row < ((size - 1) // 2) - 1 and board[row + 1][col - 1] == 'b' and board[row + 2][col - 2] == '-':
+            yield ((row, col), (row + 2, col - 2), (row + 1, col - 1))
+        # capture moves - row above the center row
+        if row == ((size - 1) // 2) - 1 and board[row + 1][col - 1] == 'b' and board[row + 2][col - 1] == '-':
+            yield ((row, col), (row + 2, col - 1), (row + 1, col - 1))
+        # capture moves - lower half
+        if (size - 1) // 2 <= row < size - 2:
+            # capture moves - right side lower half
+            if board[row + 1][col + 1] == 'b' and board[row + 2][col + 2] == '-':
+                yield ((row, col), (row + 2, col + 2), (row + 1, col + 1))
+            # capture moves - left side lower half
+            if board[row + 1][col] == 'b' and board[row + 2][col] == '-':
+                yield ((row, col), (row + 2, col), (row + 1, col))
+    # piece is in the middle of the row
+    else:
+        # upper half forward and capture moves
+        if row < (size - 1) // 2:
+            # upper half left forward and capture moves
+            # forward move - left
+            if board[row + 1][col - 1] == '-':
+                yield ((row, col), (row + 1, col - 1), None)
+            # capture move - left
+            if col > 1 and board[row + 1][col - 1] == 'b' and board[row + 2][col - 2] == '-':
+                yield ((row, col), (row + 2, col - 2), (row + 1, col - 1))
+            # piece is on the row above center
+            if col == 1 and row == ((size - 1) // 2) - 1 and board[row + 1][col - 1] == 'b' and board[row + 2][
+                col - 1] == '-':
+                yield ((row, col), (row + 2, col - 1), (row + 1, col - 1))
+
+            # upper half right forward and capture moves
+            # forward move - right
+            if board[row + 1][col] == '-':
+                yield ((row, col), (row + 1, col), None)
+            # capture move - right
+            if len(board[row + 2]) > col and row != ((size - 1) // 2) - 1 and board[row + 1][col] == 'b' and \
+                    board[row + 2][col] == '-':
+                yield ((row, col), (row + 2, col), (row + 1, col))
+            # piece is on the row just above the center
+            if len(board[row + 2]) > col + 1 and row == ((size - 1) // 2) - 1 and board[row + 1][col] == 'b' and \
+                    board[row + 2][
+                        col + 1] == '-':
+                yield ((row, col), (row + 2, col + 1), (row + 1, col))
+        # lower half forward and capture moves
+        else:
+            # forward move - left
+            if row < size - 1 and board[row + 1][col] == '-':
+                yield ((row, col), (row + 1, col), None)
+            # capture move - left
+            if row < size - 2 and board[row + 1][col] == 'b' and board[row + 2][col] == '-':
+                yield ((row, col), (row + 2, col), (row + 1, col))
+
+            # forward move - right
+            if row < size - 1 and board[row + 1][col + 1] == '-':
+                yield ((row, col), (row + 1, col + 1), None)
+            # capture move - right
+            if row < size - 2 and board[row + 1][col + 1] == 'b' and board[row + 2][col + 2] == '-':
+                yield ((row, col), (row + 2, col + 2), (row + 1, col + 1))
+
+
+"""
+Function to generate the moves of a given black piece on the board. Does not do any error checking, assumes all input is 
+valid.
+@:param board: the current board
+@:param playerPiece: the piece that will be moved
+@:return a generator of all the (from, to, captured) moves this current black playerPiece can make
+"""
+
+
+def blackMoves(board: List[List[str]], playerPiece: Piece) -> Iterator[Move]:
+    # need the row and col of the current piece to determine which moves can be made from this position
+    row, col = playerPiece.row, playerPiece.col
+    # need the size of the board to know the bounds of the board
+    size = len(board)
+
+    # if the piece is on the far left of the curr row
+    if col == 0:
+        # forward moves - upper half
+        if row <= (size - 1) // 2 and board[row - 1][col + 1] == '-':
+            yield ((row, col), (row - 1, col + 1), None)
+        if row > 0 and board[row - 1][col] == '-':
+            yield ((row, col), (row - 1, col), None)
+
+        # capture moves - upper half
+        if 1 < row <= (size - 1) // 2 and board[row - 1][col + 1] == 'w' and board[row - 2][col + 2] == '-':
+            yield ((row, col), (row - 2, col + 2), (row - 1, col + 1))
+        # capture moves - lower half
+        if row != ((size - 1) // 2) + 1 and row > 1 and board[row - 1][col] == 'w' and board[row - 2][col] == '-':
+            yield ((row, col), (row - 2, col), (row - 1, col))
+        # capture moves - row just below center row
+        if row == ((size - 1) // 2) + 1 and board[row - 1][col] == 'w' and board[row - 2][col + 1] == '-':
+            yield ((row, col), (row - 2, col + 1), (row - 1, col))
+
+    elif col == len(board[row]) - 1:  # the curr piece is on the far right side of the curr row
+        # forward moves - upper half
+        if 1 <= row <= (size - 1) // 2:
+            if board[row - 1][col + 1] == '-':
+                yield ((row, col), (row - 1, col + 1), None)
+            if board[row - 1][col] == '-':
+                yield ((row, col), (row - 1, col), None)
+
+        # forward moves - lower half
+        if row > (size - 1) // 2 and board[row - 1][col - 1] == '-':
+            yield ((row, col), (row - 1, col - 1), None)
+
+        # capture moves - upper half
+        if 1 < row <= (size - 1) // 2:
+            if board[row - 1][col + 1] == 'w' and board[row - 2][col + 2] == '-':
+                yield ((row, col), (row - 2, col + 2), (row - 1, col + 1))
+            if board[row - 1][col] == 'w' and board[row - 2][col] == '-':
+                yield ((row, col), (row - 2, col), (row - 1, col))
+        # capture moves - lower half
+        if row > ((size - 1) // 2) + 1 and board[row - 1][col - 1] == 'w' and board[row - 2][col - 2] == '-':
+            yield ((row, col), (row - 2, col - 2), (row - 1, col - 1))
+
+        # capture moves - row just below the center
+        if row == ((size - 1) // 2) + 1 and board[row - 1][col - 1] == 'w' and board[row - 2][col - 1] == '-':
+            yield ((row, col), (row - 2, col - 1), (row - 1, col - 1))
+    else:  # piece is in the middle of the row, so it can move in both directions
+        # forward and capture moves - upper half
+        if row < (size - 1) // 2:
+            if row > 0 and board[row - 1][col] == '-':  # forward move - left
+                yield ((row, col), (row - 1, col), None)
+            if row > 1 and board[row - 1][col] == 'w' and board[row - 2][col] == '-':  # capture move - left
+                yield ((row, col), (row - 2, col), (row - 1, col))
+
+            if row > 0 and board[row - 1][col + 1] == '-':  # forward move - right
+                yield ((row, col), (row - 1, col + 1), None)
+            if row > 1 and board[row - 1][col + 1] == 'w' and board[row - 2][col + 2] == '-':  # capture move - right
+                yield ((row, col), (row - 2, col + 2), (row - 1, col + 1))
+        else:  # forward and capture moves - lower half
+            if board[row - 1][col - 1] == '-':  # forward move - left
+                yield ((row, col), (row - 1, col - 1), None)
+            if col > 1 and board[row - 1][col - 1] == 'w' and board[row - 2][col - 2] == '-':  # capture move - left
+                yield ((row, col), (row - 2, col - 2), (row - 1, col - 1))
+            # capture move - row just below the center row
+            if col == 1 and row == ((size - 1) // 2) + 1 and board[row - 1][col - 1] == 'w' and board[row - 2][
+                col - 1] == '-':
+                yield ((row, col), (row - 2, col - 1), (row - 1, col - 1))
+
+            # capture and forward moves - right
+            if board[row - 1][col] == '-':
+                yield ((row, col), (row - 1, col), None)
+            if col < len(board[row - 2]) and row != ((size - 1) // 2) + 1 and board[row - 1][col] == 'w' and \
+                    board[row - 2][col] == '-':
+                yield ((row, col), (row - 2, col), (row - 1, col))
+            # capture move - row just below the center row
+            if row == ((size - 1) // 2) + 1 and col + 1 < len(board[row - 2]) and board[row - 1][col] == 'w' and \
+                    board[row - 2][col + 1] == '-':
+                yield ((row, col), (row - 2, col + 1), (row - 1, col))
+
+
+"""
+Function to make a forward move with no jumping over opponent's piece
+@:param board: the current board
+@:param playerPiece: the piece that will be moved
+@ param newRow: the new row position for the playerPiece
+@:param newCol: the new column position for the playerPiece
+@:return a list of str which represents the updated board
+"""
+
+
+def forward(board: List[List[str]], playerPiece: Piece, newRow: int, newCol: int) -> List[List[str]]:
+    return moveBoard(board, ((playerPiece.row, playerPiece.col), (newRow, newCol), None))
+
+
+"""
+Function to make a forward move and capture an opponent's piece
+@:param board: the current board
+@:param playerPiece: the piece that will be moved
+@:param oppPlayer: the piece that will be captured by the current curr_player
+@ param newRow: the new row position for the playerPiece
+@:param newCol: the new column position for the playerPiece
+@:return a list of str which represents the updated board
+"""
+
+
+def capture(board: List[List[str]], playerPiece: Piece, oppPiece: Piece, newRow: int, newCol: int) -> List[List[str]]:
+    return moveBoard(board, ((playerPiece.row, playerPiece.col), (newRow, newCol), (oppPiece.row, oppPiece.col)))
+
+
+"""
+Function that plays every game from a board up to depth turns with the new generator and compares the moves it generates
+for every board along the way with the ones the old generator does (same moves in the same order).
+
+@:param board: the board to start from, a List[List[str]]
+@:param piece: whose turn it is on the board
+@:param depth: how many turns to play
+@:param mismatches: list the (board, piece, new moves, old moves) of every board the generators don't agree on is
+                    added to
+
+@:return:
+    the number of boards depth turns from the board (the same number perft counts)
+"""
+
+
+def crossCheck(board: List[List[str]], piece: str, depth: int, mismatches: List[Tuple] = None) -> int:
+    moves = moveList(board, piece)
+    if mismatches is not None:
+        old = legacyMoveList(board, piece)
+        if moves != old:
+            mismatches.append(([''.join(row) for row in board], piece, moves, old))
+    if depth == 0:
+        return 1
+    next_player = 'b' if piece == 'w' else 'w'
+    count = 0
+    for move in moves:
+        makeMove(board, move)
+        count += crossCheck(board, next_player, depth - 1, mismatches)
+        unmakeMove(board, move)
+    return count
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Check the move generator against the old hand written generators')
+    parser.add_argument('--depth', type=int, default=6, help='how many turns to play from each board (default 6)')
+    args = parser.parse_args()
+    for start, player in ((['wwww', '---', '--', '---', 'bbbb'], 'w'), (['---w', 'w-w', 'bb', 'b-w', '---b'], 'w')):
+        found = []
+        count = crossCheck([list(row) for row in start], player, args.depth, found)
+        # leave out the moves the old black generator makes off the top of the board (the wrap around)
+        unexpected = [m for m in found if [move for move in m[3] if move[1][0] >= 0] != m[2]]
+        print(f'{start} {player=} {args.depth=} {count=} mismatches={len(found)} unexpected={len(unexpected)}')
+        for mismatch in unexpected[:10]:
+            print(f'    {mismatch}')
@@ -1,5 +1,8 @@
 from moveGen import moveGen
+from moveOrder import MoveOrder
 from oskaPlayer import *
+from ponder import Ponderer
+from transTable import TranspositionTable
 
 
 # Press the green button in the gutter to run the script.
@@ -74,17 +77,27 @@ if __name__ == '__main__':
     #         print('error in black moves')
 
     depth = 5
+    engine = 'alphabeta'  # change to 'dfs' to compare how many nodes the exhaustive search visits
+    stats = SearchStats()
+    table = TranspositionTable()  # kept for the whole game so each turn can reuse the boards searched before
+    ordering = MoveOrder()  # same for the killer moves and history
+    ponderer = None  # set to Ponderer(depth) to have white search black's likely replies while black is thinking
     print('My game--------------')
-    white = oskaplayer(['wwww', '---', '--', '---', 'bbbb'], 'w', depth)
-    black = oskaplayer(white, 'b', depth)
+    white = oskaplayer(['wwww', '---', '--', '---', 'bbbb'], 'w', depth, stats, engine, table, ordering=ordering)
+    black = oskaplayer(white, 'b', depth, stats, engine, table, ordering=ordering)
     turn = 0
     print(f'first turn\t{white=}\t{black=}')
     while white and black:
         if turn % 2 == 1:  # black turn
-            black = oskaplayer(white, 'b', depth)
+            black = oskaplayer(white, 'b', depth, stats, engine, table, ordering=ordering)
             print(f'{turn=}\t{black=}')
         else:  # white turn
-            white = oskaplayer(black, 'w', depth)
+            if ponderer is None:
+                white = oskaplayer(black, 'w', depth, stats, engine, table, ordering=ordering)
+            else:
+                white = ponderer.answer(black, 'w')
+                if white:
+                    ponderer.ponder(white, 'b')
             print(f'{turn=}\t{white=}')
         # determine the winner (whichever is None won)
         if white is None:
@@ -92,3 +105,9 @@ if __name__ == '__main__':
         elif black is None:
             print(f'Black Won :)')
         turn += 1
+    print(f'{engine=}\t{stats.nodes=}')
+    print(f'transposition table: {table}')
+    print(f'move ordering: {ordering}')
+    if ponderer is not None:
+        print(f'pondering: {ponderer}')
+        ponderer.close()
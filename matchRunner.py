@@ -0,0 +1,385 @@
+"""
+Matches between engines, a lot of games played in parallel.
+An engine is a way of setting up the search, written as options separated by commas:
+    depth=N         how many turns the search looks ahead (has to be there for every engine but mcts)
+    time=SECONDS    time limit per move, the search goes one turn deeper at a time up to depth (see oskaplayer())
+    engine=NAME     'alphabeta' (default), 'dfs', 'batch' or 'mcts'. 'dfs' and 'batch' don't have a time limit
+    tablebase=FILE  a tablebase (see tablebase.py) for the exact result of the boards with few pieces
+    simulations=N   for mcts, the simulations per move (see mcts.py)
+    rollout=N       for mcts, how many turns a rollout plays before the evaluator scores the board
+so 'depth=5', 'depth=9,time=0.2', 'depth=7,tablebase=oska4.tb' and 'engine=mcts,time=0.5,rollout=8' are four
+engines. Every pair of engines plays --games games: each opening twice, with each engine playing white once. An opening
+is the start board followed by --random-plies random moves, so the games aren't all the same, and it only depends on
+--seed and which opening it is.
+
+    python matchRunner.py depth=3 depth=5 --games 1000 --output match.jsonl
+
+The games are played by a pool of worker processes and each one is written to the output as a JSON line as soon as it
+is finished, after a first line with the --size, --games, --random-plies and --seed of the match. Running the same
+command again with the same output file only plays the games that aren't in it yet, so a long match that was stopped
+can be carried on; a file written with different settings isn't carried on, its games had different openings. At the
+end it prints the wins, draws and losses of each pair of engines and of each engine against the others, the Elo
+difference they come to with the low and high ends of its 95% error bars, and the average time per move of each engine.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import combinations
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+
+from benchmark import startBoard
+from bitBoard import boardTables, fromBits, genMoves, playMove, toBits
+from gameSession import GameSession
+from mcts import MCTS_SIMULATIONS, SearchTree
+from oskaPlayer import oskaplayer
+from tablebase import gameOver, openTablebase
+
+# a game is a draw once it has gone on this many turns (it can't in Oska, pieces only move forward)
+MAX_PLIES = 400
+# how many games per worker can be waiting or being played at once
+GAMES_PER_WORKER = 2
+# memory for the transposition table of each side of a game
+GAME_TABLE_MEMORY = 4 * 1024 * 1024
+# how sure the error bars are: 1.96 standard deviations is 95%
+CONFIDENCE = 1.96
+# scores closer than this to 0 or 1 are taken as this close, so the Elo difference stays within +/- 1200
+SCORE_EPSILON = 0.001
+
+"""
+Class EngineConfig is one engine of a match, made from options like 'depth=7,time=0.5' (see the top of the file)
+"""
+
+
+class EngineConfig:
+    def __init__(self, spec: str):
+        self.spec = spec
+        self.depth: int = None
+        self.time_limit: float = None
+        self.engine = 'alphabeta'
+        self.tablebase: str = None
+        self.simulations: int = None
+        self.rollout_depth: int = None
+        for option in spec.split(','):
+            name, _, value = option.partition('=')
+            name, value = name.strip(), value.strip()
+            if name == 'depth':
+                self.depth = int(value)
+            elif name == 'time':
+                self.time_limit = float(value)
+            elif name == 'engine':
+                if value not in ('alphabeta', 'dfs', 'batch', 'mcts'):
+                    raise ValueError(f'unknown engine {value} in {spec}')
+                self.engine = value
+            elif name == 'tablebase':
+                self.tablebase = value
+            elif name == 'simulations':
+                self.simulations = int(value)
+            elif name == 'rollout':
+                self.rollout_depth = int(value)
+            else:
+                raise ValueError(f'unknown option {name} in {spec}')
+        if self.depth is None and self.engine != 'mcts':
+            raise ValueError(f'no depth in {spec}')
+
+    # function that raises ValueError if the engine can't play on boards with a first row of length n, because its
+    # tablebase is for another size. Called before the match starts so it doesn't stop halfway through
+    def checkSize(self, n: int):
+        if self.tablebase is not None:
+            openTablebase(self.tablebase).checkSize(n)
+
+    # function that makes the player for one side of one game, a function from the board to the board after its move.
+    # seed is for the random moves of mcts
+    def player(self, colour: str, seed: int = 0) -> Callable[[List[str]], List[str]]:
+        tablebase = None if self.tablebase is None else openTablebase(self.tablebase)
+        if self.engine == 'alphabeta':
+            # a session keeps the table and move ordering from one of its turns to the next
+            return GameSession(colour, self.depth, self.time_limit, tablebase, GAME_TABLE_MEMORY).move
+        if self.engine == 'mcts':
+            simulations = self.simulations
+            if simulations is None and self.time_limit is None:
+                simulations = MCTS_SIMULATIONS
+            # the tree is kept from one of its turns to the next
+            tree = SearchTree(simulations, self.rollout_depth, seed)
+            return lambda board: oskaplayer(board, colour, self.depth, engine='mcts', time_limit=self.time_limit,
+                                            tree=tree)
+        return lambda board: oskaplayer(board, colour, self.depth, engine=self.engine, tablebase=tablebase)
+
+    # overriding string function to print stuff out. Used for debugging purposes
+    def __str__(self):
+        return (f'{self.depth=}, {self.time_limit=}, {self.engine=}, {self.tablebase=}, {self.simulations=}, '
+                f'{self.rollout_depth=}')
+
+
+# a game to play: (its number, the white engine, the black engine, the opening board, whose turn it is on it)
+Game = Tuple[int, EngineConfig, EngineConfig, List[str], str]
+
+"""
+Function that makes an opening: the start board followed by random moves
+@:param n: the length of the first row of the board
+@:param plies: how many random moves are played
+@:param rng: the random.Random to pick the moves with
+@:return the board and whose turn it is on it
+"""
+
+
+def randomOpening(n: int, plies: int, rng: random.Random) -> Tuple[List[str], str]:
+    tables = boardTables(n)
+    white, black = toBits(tables, startBoard(n))
+    turn = 'w'
+    for _ in range(plies):
+        moves = genMoves(tables, white, black, turn)
+        if not moves:
+            break
+        new_white, new_black = playMove(white, black, turn, rng.choice(moves))
+        next_player = 'b' if turn == 'w' else 'w'
+        # stop before a move that ends the game, that wouldn't be much of an opening
+        if gameOver(tables, new_white, new_black, next_player) is not None:
+            break
+        white, black, turn = new_white, new_black, next_player
+    return fromBits(tables, white, black), turn
+
+
+"""
+Function that lists all the games of a match, in the same order every time for the same arguments
+@:param engines: the engines, every pair of them plays
+@:param games: how many games each pair plays, rounded up to an even number so each opening is played both ways
+@:param n: the length of the first row of the board
+@:param random_plies: how many random moves each opening has
+@:param seed: the seed the openings are made from
+@:return a generator of the games
+"""
+
+
+def schedule(engines: List[EngineConfig], games: int, n: int, random_plies: int, seed: int) -> Iterator[Game]:
+    openings = [randomOpening(n, random_plies, random.Random(f'{seed}:{i}')) for i in range((games + 1) // 2)]
+    number = 0
+    for first, second in combinations(engines, 2):
+        for board, turn in openings:
+            yield number, first, second, board, turn
+            yield number + 1, second, first, board, turn
+            number += 2
+
+
+"""
+Function that plays one game
+@:param game: the game to play
+@:return a dict with the game, its result ('w', 'b' or 'draw'), how many turns it took and how long each side took
+"""
+
+
+def playGame(game: Game) -> Dict:
+    number, white, black, board, turn = game
+    tables = boardTables(len(board[0]))
+    players = {'w': white.player('w', number), 'b': black.player('b', number)}
+    seconds = {'w': 0.0, 'b': 0.0}
+    moves = {'w': 0, 'b': 0}
+    result = 'draw'
+    for _ in range(MAX_PLIES):
+        outcome = gameOver(tables, *toBits(tables, board), 'w')
+        if outcome is not None:
+            result = 'w' if outcome > 0 else 'b' if outcome < 0 else 'draw'
+            break
+        start = time.perf_counter()
+        board = players[turn](board)
+        seconds[turn] += time.perf_counter() - start
+        moves[turn] += 1
+        # neither player can move
+        if board is None:
+            break
+        turn = 'b' if turn == 'w' else 'w'
+    return {'game': number, 'white': white.spec, 'black': black.spec, 'opening': game[3], 'result': result,
+            'plies': moves['w'] + moves['b'], 'white_seconds': seconds['w'], 'white_moves': moves['w'],
+            'black_seconds': seconds['b'], 'black_moves': moves['b']}
+
+
+"""
+Function that plays the games and yields the result of each one as soon as it is finished, so not in the order of the
+games. Runs in this process when workers is 1.
+@:param games: the games to play
+@:param workers: how many worker processes to use, defaults to the number of CPUs
+@:return a generator of the results of playGame()
+"""
+
+
+def playGames(games: Iterable[Game], workers: int = None) -> Iterator[Dict]:
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for game in games:
+            yield playGame(game)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for game in games:
+            pending.add(pool.submit(playGame, game))
+            # wait for a game to finish before sending more once enough are waiting
+            if len(pending) >= workers * GAMES_PER_WORKER:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in pending:
+            yield future.result()
+
+
+"""
+Function that reads what was already written to an output file, for carrying on a match
+@:param path: the output file, it doesn't have to exist
+@:return a tuple of the settings of the match in the file (None if it has none) and a list of the results in it. A last
+         line that was cut off when the match was stopped is left out
+"""
+
+
+def readResults(path: str) -> Tuple[Dict, List[Dict]]:
+    settings, results = None, []
+    if not os.path.exists(path):
+        return settings, results
+    with open(path) as file:
+        for line in file:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if 'settings' in record:
+                settings = record['settings']
+            else:
+                results.append(record)
+    return settings, results
+
+
+"""
+Function that plays a match, skipping the games that are in the output file already and writing each game to it once
+it is finished
+@:param games: all the games of the match, see schedule()
+@:param path: the output file, a file of JSON lines
+@:param settings: what the games were made from (the size, games, random_plies and seed of schedule()), written to a
+                  new file and checked against the ones of a file that is carried on
+@:param workers: how many worker processes to use
+@:return the results of all the games of the match, the ones from the file and the new ones
+"""
+
+
+def runMatch(games: Iterable[Game], path: str, settings: Dict, workers: int = None) -> List[Dict]:
+    file_settings, results = readResults(path)
+    if file_settings is None and results:
+        raise ValueError(f'{path} has no match settings, so it can\'t be carried on')
+    if file_settings is not None and file_settings != settings:
+        raise ValueError(f'{path} was played with {file_settings}, not {settings}')
+    played = {result['game']: result for result in results}
+    games = list(games)
+    for number, white, black, _, _ in games:
+        if number in played and (played[number]['white'], played[number]['black']) != (white.spec, black.spec):
+            raise ValueError(f'game {number} in {path} was played by different engines')
+    with open(path, 'a+') as out:
+        # a line that was cut off when the match was stopped doesn't get the next game stuck on the end of it
+        out.seek(0, os.SEEK_END)
+        if out.tell():
+            out.seek(out.tell() - 1)
+            if out.read(1) != '\n':
+                out.write('\n')
+        if file_settings is None:
+            out.write(json.dumps({'settings': settings}) + '\n')
+        for result in playGames((game for game in games if game[0] not in played), workers):
+            out.write(json.dumps(result) + '\n')
+            out.flush()
+            results.append(result)
+    return results
+
+
+"""
+Function that works out the Elo difference a score comes to and its error bars
+@:param wins: how many games were won
+@:param draws: how many games were drawn
+@:param losses: how many games were lost
+@:return a tuple of the Elo difference and the low and high ends of its error bars. The error bars aren't the same
+         length either way, most of all near a score of 0 or 1. All three are worked out from scores kept SCORE_EPSILON
+         away from 0 and 1, so they are finite even if every game was won or lost
+"""
+
+
+def eloDifference(wins: int, draws: int, losses: int) -> Tuple[float, float, float]:
+    games = wins + draws + losses
+    score = (wins + draws / 2) / games
+    # the standard deviation of the score of one game, and of the average over all the games
+    deviation = math.sqrt((wins * (1 - score) ** 2 + draws * (0.5 - score) ** 2 + losses * score ** 2) / games)
+    margin = CONFIDENCE * deviation / math.sqrt(games)
+    if deviation == 0:
+        # every game had the same result, which says nothing about the spread; the rule of three puts the 95% bound
+        # 3 / games away from the score
+        margin = 3 / games
+    return _elo(score), _elo(score - margin), _elo(score + margin)
+
+
+# the Elo difference that has score as its expected score, with the score kept SCORE_EPSILON away from 0 and 1
+def _elo(score: float) -> float:
+    score = min(max(score, SCORE_EPSILON), 1 - SCORE_EPSILON)
+    return 400 * math.log10(score / (1 - score))
+
+
+"""
+Function that adds up the results of a match
+@:param results: the results of the games
+@:param engines: the specs of the engines, in the order to list them
+@:return the lines of the report
+"""
+
+
+def report(results: List[Dict], engines: List[str]) -> List[str]:
+    # (wins, draws, losses) of each engine against each other engine, and against all the others together
+    scores: Dict[Tuple[str, str], List[int]] = {}
+    seconds = {engine: 0.0 for engine in engines}
+    moves = {engine: 0 for engine in engines}
+    for result in results:
+        for colour, engine, opponent in (('w', result['white'], result['black']),
+                                         ('b', result['black'], result['white'])):
+            outcome = 1 if result['result'] == 'draw' else 0 if result['result'] == colour else 2
+            for key in ((engine, opponent), (engine, None)):
+                scores.setdefault(key, [0, 0, 0])[outcome] += 1
+            if engine in seconds:
+                side = 'white' if colour == 'w' else 'black'
+                seconds[engine] += result[f'{side}_seconds']
+                moves[engine] += result[f'{side}_moves']
+
+    lines = [f'{len(results)} games']
+    keys = [(first, second) for first, second in combinations(engines, 2)] + [(engine, None) for engine in engines]
+    for engine, opponent in keys:
+        if (engine, opponent) not in scores:
+            continue
+        wins, draws, losses = scores[engine, opponent]
+        elo, low, high = eloDifference(wins, draws, losses)
+        lines.append(f'{engine} vs {opponent or "the rest"}: +{wins} ={draws} -{losses}, '
+                     f'{100 * (wins + draws / 2) / (wins + draws + losses):.1f}%, '
+                     f'Elo {elo:+.0f} [{low:+.0f}, {high:+.0f}]')
+    for engine in engines:
+        if moves[engine]:
+            lines.append(f'{engine}: {1000 * seconds[engine] / moves[engine]:.2f} ms per move over '
+                         f'{moves[engine]} moves')
+    return lines
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Play matches between Oska engines')
+    parser.add_argument('engines', nargs='+', type=EngineConfig, help="engines like depth=5 or depth=9,time=0.2")
+    parser.add_argument('--games', type=int, default=100, help='games each pair of engines plays (default 100)')
+    parser.add_argument('--size', type=int, default=4, help='length of the first row of the board (default 4)')
+    parser.add_argument('--random-plies', type=int, default=4, help='random moves in each opening (default 4)')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the openings')
+    parser.add_argument('--workers', type=int, default=None, help='number of worker processes')
+    parser.add_argument('--output', default='match.jsonl', help='file the games are written to and carried on from')
+    args = parser.parse_args()
+    if len(args.engines) < 2:
+        parser.error('a match needs at least two engines')
+    for config in args.engines:
+        try:
+            config.checkSize(args.size)
+        except ValueError as error:
+            parser.error(f'{config.spec}: {error}')
+
+    all_games = schedule(args.engines, args.games, args.size, args.random_plies, args.seed)
+    match_settings = {'size': args.size, 'games': args.games, 'random_plies': args.random_plies, 'seed': args.seed}
+    match = runMatch(all_games, args.output, match_settings, args.workers)
+    print('\n'.join(report(match, [engine.spec for engine in args.engines])))
@@ -0,0 +1,257 @@
+"""
+Monte Carlo tree search (UCT) for Oska, oskaplayer(..., engine='mcts').
+The depth limited searches have to look at every move down to the last turn, which stops being possible in any
+reasonable time on the bigger boards. MCTS grows a tree from the board instead, one simulation at a time:
+    1. select: from the root, go down to the child with the best UCT value (its win rate plus a bonus for having been
+       tried less often than its siblings) until a board that still has moves without a child
+    2. expand: give that board a child for one of those moves
+    3. rollout: play random moves from the new child until the game is over. With a rollout depth the rollout stops
+       after that many turns and the evaluator (evaluateBits() in bitBoard.py, the same value as evaluator()) scores
+       the board instead, so a rollout doesn't have to play to the end of a long game
+    4. backpropagate: add the result to every board on the way back up to the root
+The move played is the child of the root that was tried the most. The search can be stopped after any number of
+simulations, so its budget is a number of simulations, a time limit or both.
+
+A SearchTree keeps the tree between calls: pass the same one to every oskaplayer() call in a game and the part of the
+tree below the board the game got to is kept, so the next search starts with the simulations that went through it.
+Its simulations and seconds say how fast the rollouts are (simulationsPerSecond()).
+
+    tree = SearchTree(simulations=5000, rollout_depth=8)
+    board = oskaplayer(board, 'w', depth, engine='mcts', tree=tree)
+"""
+
+import math
+import random
+import time
+from typing import List, Tuple
+
+from bitBoard import BoardTables, evaluateBits, genMoves, playMove
+from tablebase import gameOver
+
+# simulations per search when there is no time limit
+MCTS_SIMULATIONS = 2000
+# how much the UCT value favours moves that haven't been tried much, sqrt(2) is the usual value for results in 0..1
+EXPLORATION = math.sqrt(2)
+# how big an evaluator score is worth a 10 to 1 chance of winning, for turning the score at a rollout cutoff into
+# a result between 0 and 1
+EVALUATION_SCALE = 8
+# the move of a player who can't move but whose opponent can
+PASS = None
+
+"""
+Class TreeNode is one board of the tree. value is the sum of the results of the simulations that went through it, for
+the player who made the move to it (so the parent picks the child that is best for itself).
+"""
+
+
+class TreeNode:
+    __slots__ = ('white', 'black', 'turn', 'move', 'parent', 'children', 'untried', 'visits', 'value', 'result')
+
+    def __init__(self, tables: BoardTables, white: int, black: int, turn: str, move=None, parent: 'TreeNode' = None):
+        self.white = white
+        self.black = black
+        self.turn = turn
+        self.move = move
+        self.parent = parent
+        self.children: List[TreeNode] = []
+        self.visits = 0
+        self.value = 0.0
+        # the result for white if the game is over on this board, otherwise None
+        self.result = _result(tables, white, black)
+        # the moves that don't have a child yet
+        self.untried = [] if self.result is not None else _moves(tables, white, black, turn)
+        if self.result is None and not self.untried:
+            # neither player can move
+            self.result = 0.5
+
+    # function that picks the child with the best UCT value
+    def select(self) -> 'TreeNode':
+        log_visits = math.log(self.visits)
+        best, best_value = None, -math.inf
+        for child in self.children:
+            value = child.value / child.visits + EXPLORATION * math.sqrt(log_visits / child.visits)
+            if value > best_value:
+                best, best_value = child, value
+        return best
+
+    # overriding string function to print stuff out. Used for debugging purposes
+    def __str__(self):
+        return f'{self.move=}, {self.turn=}, {self.visits=}, {self.value=}, {len(self.children)=}'
+
+
+# the result of the game for white (1 a win, 0.5 a draw, 0 a loss) if it is over, otherwise None
+def _result(tables: BoardTables, white: int, black: int) -> float:
+    outcome = gameOver(tables, white, black, 'w')
+    return None if outcome is None else (outcome + 1) / 2
+
+
+# the moves of a board, [PASS] if the player can't move but the opponent can and [] if neither can
+def _moves(tables: BoardTables, white: int, black: int, turn: str) -> list:
+    moves = genMoves(tables, white, black, turn)
+    if moves:
+        return moves
+    return [PASS] if genMoves(tables, white, black, 'b' if turn == 'w' else 'w') else []
+
+
+"""
+Class SearchTree is the tree of one game, see the top of the file.
+@:param simulations: how many simulations a search runs, None to only stop at the time limit
+@:param rollout_depth: how many turns a rollout plays before the evaluator scores the board, None to play to the end
+@:param seed: the seed for the random moves, the same seed gives the same moves without a time limit
+"""
+
+
+class SearchTree:
+    def __init__(self, simulations: int = MCTS_SIMULATIONS, rollout_depth: int = None, seed: int = 0):
+        self.simulations = simulations
+        self.rollout_depth = rollout_depth
+        self.rng = random.Random(seed)
+        self.root: TreeNode = None
+        # simulations run and seconds spent over every search, and how many searches started from a kept board
+        self.total_simulations = 0
+        self.seconds = 0.0
+        self.reused = 0
+
+    # function that finds the best move from a board, or None if neither player can move. The move is PASS if only
+    # the opponent can
+    def search(self, tables: BoardTables, white: int, black: int, turn: str, time_limit: float = None,
+               stats: 'SearchStats' = None):
+        start = time.perf_counter()
+        root = self.findRoot(tables, white, black, turn)
+        if root.result is not None:
+            # the game is already decided but the player can still move, no move changes the result so the first one is
+            # played like minmaxBits() does
+            moves = _moves(tables, white, black, turn)
+            return moves[0] if moves else None
+        budget = self.simulations
+        if budget is None and time_limit is None:
+            budget = MCTS_SIMULATIONS
+        deadline = None if time_limit is None else start + time_limit
+        simulations = deepest = 0
+        while budget is None or simulations < budget:
+            # there is always at least one simulation so there is always a move
+            if deadline is not None and simulations and time.perf_counter() >= deadline:
+                break
+            boards, depth = self.simulate(tables, root)
+            simulations += 1
+            deepest = max(deepest, depth)
+            if stats is not None:
+                stats.nodes += boards
+        self.total_simulations += simulations
+        self.seconds += time.perf_counter() - start
+        if stats is not None:
+            stats.depth = deepest
+        # the most tried child, the first one in the order the moves were generated if there is a tie
+        best = max(root.children, key=lambda child: child.visits)
+        self.root = best
+        return best.move
+
+    # function that makes the root of the tree the node for the board, keeping it if the board is the root or one of
+    # its children (the board after the opponent's reply), otherwise starting a new tree
+    def findRoot(self, tables: BoardTables, white: int, black: int, turn: str) -> TreeNode:
+        root = self.root
+        if root is not None:
+            if (root.white, root.black, root.turn) != (white, black, turn):
+                root = next((child for child in root.children if (child.white, child.black, child.turn) ==
+                             (white, black, turn)), None)
+        if root is None:
+            root = TreeNode(tables, white, black, turn)
+        else:
+            self.reused += 1
+        # the rest of the old tree can't come up again
+        root.parent = None
+        self.root = root
+        return root
+
+    # function that runs one simulation from the root, returns how many boards it looked at and how deep the tree
+    # part of it went
+    def simulate(self, tables: BoardTables, root: TreeNode) -> Tuple[int, int]:
+        node, depth = root, 0
+        # select
+        while not node.untried and node.children:
+            node = node.select()
+            depth += 1
+        # expand
+        if node.untried:
+            move = node.untried.pop(0)
+            next_player = 'b' if node.turn == 'w' else 'w'
+            white, black = (node.white, node.black) if move is PASS else playMove(node.white, node.black, node.turn,
+                                                                                  move)
+            child = TreeNode(tables, white, black, next_player, move, node)
+            node.children.append(child)
+            node = child
+            depth += 1
+        # rollout
+        if node.result is not None:
+            result, plies = node.result, 0
+        else:
+            result, plies = self.rollout(tables, node.white, node.black, node.turn)
+        # backpropagate, each board adds the result for the player who moved to it
+        while node is not None:
+            node.visits += 1
+            if node.parent is not None:
+                node.value += result if node.parent.turn == 'w' else 1 - result
+            node = node.parent
+        return depth + plies, depth
+
+    # function that plays random moves from a board, returns the result for white and how many turns were played
+    def rollout(self, tables: BoardTables, white: int, black: int, turn: str) -> Tuple[float, int]:
+        choice = self.rng.choice
+        plies = 0
+        passed = False
+        while self.rollout_depth is None or plies < self.rollout_depth:
+            outcome = gameOver(tables, white, black, 'w')
+            if outcome is not None:
+                return (outcome + 1) / 2, plies
+            moves = genMoves(tables, white, black, turn)
+            if moves:
+                white, black = playMove(white, black, turn, choice(moves))
+                passed = False
+            elif passed:
+                # neither player can move
+                return 0.5, plies
+            else:
+                passed = True
+            turn = 'b' if turn == 'w' else 'w'
+            plies += 1
+        outcome = gameOver(tables, white, black, 'w')
+        if outcome is not None:
+            return (outcome + 1) / 2, plies
+        # the evaluator's chance that white wins from here
+        return 1 / (1 + 10 ** (-evaluateBits(tables, white, black, 'w') / EVALUATION_SCALE)), plies
+
+    # how many simulations a second the searches ran
+    def simulationsPerSecond(self) -> float:
+        return self.total_simulations / self.seconds if self.seconds else 0.0
+
+    # overriding string function to print stuff out. Used for debugging purposes
+    def __str__(self):
+        return f'{self.total_simulations=}, {self.seconds=}, {self.reused=}, {self.simulationsPerSecond()=}'
+
+
+"""
+Same as minmaxBits() in oskaPlayer.py but with MCTS, for oskaplayer(..., engine='mcts').
+@:param tables: the BoardTables for the size of the board
+@:param white: the white bitboard
+@:param black: the black bitboard
+@:param player: whose turn it is
+@:param stats: an optional SearchStats, nodes counts every board the simulations looked at and depth is how deep the
+               tree went
+@:param time_limit: an optional number of seconds the search can take
+@:param tree: an optional SearchTree to keep between calls, a new one is made if None
+
+@:return:
+    a tuple of the white and black bitboards after the best move, the same boards if the opponent has to make the next
+    move or None if neither player can move
+"""
+
+
+def mctsBits(tables: BoardTables, white: int, black: int, player: str, stats: 'SearchStats' = None,
+             time_limit: float = None, tree: SearchTree = None) -> Tuple[int, int]:
+    if tree is None:
+        tree = SearchTree()
+    if not genMoves(tables, white, black, player):
+        next_player = 'b' if player == 'w' else 'w'
+        # same as minmaxBits(): the board comes back as it is if the opponent can still move
+        return None if not genMoves(tables, white, black, next_player) else (white, black)
+    return playMove(white, black, player, tree.search(tables, white, black, player, time_limit, stats))
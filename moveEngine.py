@@ -0,0 +1,138 @@
+"""
+Move generator for List[List[str]] Oska boards of any size.
+The moves a piece can make only depend on the cell it is on, so they are looked up in the tables BoardTables builds
+once for each size of board (see bitBoard.py) instead of being worked out with a branch for every edge case. For every
+cell the tables have the cells a white or black piece there could move to, and the cell it jumps over for a capture, in
+the same order the old hand written generators (kept in legacyMoveGen.py) listed the moves. Generating the moves of a
+piece is then just checking those few cells on the board.
+Both moveGen.py and oskaPlayer.py use this generator.
+
+Top function: moveGen(board, curr_player) -> List[List[List[str]]]:
+    will have two parameters: the board (a List[str] or a List[List[str]]) and a char representing who's turn it is
+    Does not do any error checking, assumes all input is valid input
+    returns a list of all possible moves
+moveList(board, curr_player) -> List[Move]:
+    same as moveGen() but returns the moves as (from, to, captured) tuples instead of copying the board for each one.
+    makeMove() and unmakeMove() play a move on the board in place and take it back
+"""
+
+from typing import Iterator, List, Optional, Tuple
+
+from bitBoard import boardTables
+
+# a move is ((row, col) it moves from, (row, col) it moves to, (row, col) of the captured piece or None)
+Move = Tuple[Tuple[int, int], Tuple[int, int], Optional[Tuple[int, int]]]
+
+"""
+Top function for generating new moves given a board and which curr_player's turn it is
+
+@:param board: a list of strings (or a list of lists of chars) representing the board
+@:param curr_player: a char value of either 'b' or 'w' which represents who's turn it is
+@:return a list of lists of strings which is all the possible moves that can be generated for the current curr_player
+"""
+
+
+def moveGen(board: List[List[str]], piece: str) -> List[List[List[str]]]:
+    # make a new board for each of the moves
+    return [moveBoard(board, move) for move in moveList(board, piece)]
+
+
+"""
+Function that generates all the moves for a curr_player as (from, to, captured) tuples, without making a new board for
+any of them. Use makeMove()/unmakeMove() to play a move on the board and take it back, or moveBoard() to get a new
+board with the move played.
+
+@:param board: the current board
+@:param piece: a char value of either 'b' or 'w' which represents who's turn it is
+@:return a list of all the moves the curr_player can make
+"""
+
+
+def moveList(board: List[List[str]], piece: str) -> List[Move]:
+    tables = boardTables(len(board[0]))
+    targets = tables.whiteTargets if piece == 'w' else tables.blackTargets
+    opponent = 'b' if piece == 'w' else 'w'
+    moves = []
+    # go through the board and find all the pieces for the curr_player
+    for row, line in enumerate(board):
+        for col, cell in enumerate(line):
+            if cell == piece:
+                for to, over in targets[row][col]:
+                    if board[to[0]][to[1]] == '-' and (over is None or board[over[0]][over[1]] == opponent):
+                        moves.append(((row, col), to, over))
+    return moves
+
+
+"""
+Streaming version of moveList(). The moves are yielded one at a time instead of being put in a list, so a search that
+gets a cutoff after the first few moves never generates the rest. All the captures are yielded before any forward
+move since they are the moves most likely to cause a cutoff.
+
+@:param board: the current board
+@:param piece: a char value of either 'b' or 'w' which represents who's turn it is
+@:return a generator of all the moves the curr_player can make, captures first
+"""
+
+
+def iterMoves(board: List[List[str]], piece: str) -> Iterator[Move]:
+    tables = boardTables(len(board[0]))
+    targets = tables.whiteTargets if piece == 'w' else tables.blackTargets
+    opponent = 'b' if piece == 'w' else 'w'
+    # first go through the pieces for the captures, then a second time for the forward moves
+    for row, line in enumerate(board):
+        for col, cell in enumerate(line):
+            if cell == piece:
+                for to, over in targets[row][col]:
+                    if over is not None and board[over[0]][over[1]] == opponent and board[to[0]][to[1]] == '-':
+                        yield (row, col), to, over
+    for row, line in enumerate(board):
+        for col, cell in enumerate(line):
+            if cell == piece:
+                for to, over in targets[row][col]:
+                    if over is None and board[to[0]][to[1]] == '-':
+                        yield (row, col), to, over
+
+
+"""
+Function to play a move on the board. The board is changed in place, use unmakeMove() to take the move back.
+@:param board: the current board
+@:param move: the (from, to, captured) move, captured is None for a forward move
+"""
+
+
+def makeMove(board: List[List[str]], move: Move):
+    (row, col), (newRow, newCol), captured = move
+    board[newRow][newCol] = board[row][col]
+    board[row][col] = '-'
+    if captured is not None:
+        board[captured[0]][captured[1]] = '-'
+
+
+"""
+Function to take back a move that was played with makeMove(). It has to be the last move played on the board.
+@:param board: the current board
+@:param move: the (from, to, captured) move
+"""
+
+
+def unmakeMove(board: List[List[str]], move: Move):
+    (row, col), (newRow, newCol), captured = move
+    player = board[newRow][newCol]
+    board[row][col] = player
+    board[newRow][newCol] = '-'
+    if captured is not None:
+        board[captured[0]][captured[1]] = 'b' if player == 'w' else 'w'
+
+
+"""
+Function to make a new board with a move played on it, the board passed in isn't changed
+@:param board: the current board, either a List[str] or a List[List[str]]
+@:param move: the (from, to, captured) move
+@:return a List[List[str]] which represents the updated board
+"""
+
+
+def moveBoard(board: List[List[str]], move: Move) -> List[List[str]]:
+    new = [list(row) for row in board]
+    makeMove(new, move)
+    return new
@@ -0,0 +1,80 @@
+"""
+Move ordering for the alpha-beta search.
+Alpha-beta only skips moves after one that causes a cutoff, so the sooner the search tries the move that does, the fewer
+boards it looks at. The moves of a board are tried in this order:
+    1. the best move stored for the board in the transposition table
+    2. the killer moves of the ply: moves that caused a cutoff on another board at the same ply
+    3. the other moves, the ones that caused the most cutoffs so far (the history table) first
+Captures don't get tried first. The evaluator scores a board by how far the opponent's pieces still have to go, so
+taking a piece usually makes the board worse for the player who took it, and trying captures first ended up searching
+more boards than not ordering the moves at all.
+The table move and the killers are tried before the rest of the moves are generated, so a cutoff on one of them means
+the other moves never get generated or sorted.
+The same MoveOrder can be kept for a whole game (killers and history from one turn are still good guesses on the next),
+and its counters say how well the ordering is working: first_cutoffs / cutoffs is how often the first move tried was
+the one that caused the cutoff.
+"""
+
+from typing import Dict, Iterator, List, Tuple
+
+from bitBoard import BoardTables, genMoves, isLegal
+
+# how many killer moves are kept for each ply
+KILLERS = 2
+
+"""
+Class MoveOrder keeps the killer moves and the history table and hands out the moves of a board in order.
+"""
+
+
+class MoveOrder:
+    def __init__(self):
+        # killers[ply] is the list of killer moves for that ply, newest first
+        self.killers: List[List[Tuple[int, int, int]]] = []
+        # how much each (player, from, to) move has caused cutoffs, deeper cutoffs count for more
+        self.history: Dict[Tuple[str, int, int], int] = {}
+        self.cutoffs = self.first_cutoffs = 0
+
+    # function to call before each new search: killers are for the plies of one search, history is only halved so the
+    # newer cutoffs count for more than the older ones
+    def newSearch(self):
+        self.killers = []
+        for move in list(self.history):
+            self.history[move] //= 2
+            if not self.history[move]:
+                del self.history[move]
+
+    # function that yields the moves of a board in the order at the top of the file
+    def moves(self, tables: BoardTables, white: int, black: int, turn: str, ply: int,
+              table_move: Tuple[int, int, int] = None) -> Iterator[Tuple[int, int, int]]:
+        tried = []
+        if table_move is not None and isLegal(tables, white, black, turn, table_move):
+            tried.append(table_move)
+            yield table_move
+        if ply < len(self.killers):
+            for move in self.killers[ply]:
+                if move not in tried and isLegal(tables, white, black, turn, move):
+                    tried.append(move)
+                    yield move
+        history = self.history
+        rest = [move for move in genMoves(tables, white, black, turn) if move not in tried]
+        # sorted() keeps moves with the same history in the order they were generated
+        yield from sorted(rest, key=lambda move: -history.get((turn, move[0], move[2]), 0))
+
+    # function the search calls when a move caused a cutoff
+    def cutoff(self, turn: str, ply: int, move: Tuple[int, int, int], draft: int, first: bool):
+        self.cutoffs += 1
+        if first:
+            self.first_cutoffs += 1
+        while len(self.killers) <= ply:
+            self.killers.append([])
+        killers = self.killers[ply]
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[KILLERS:]
+        key = (turn, move[0], move[2])
+        self.history[key] = self.history.get(key, 0) + draft * draft
+
+    # overriding string function to print stuff out. Used for debugging purposes
+    def __str__(self):
+        return f'{self.cutoffs=}, {self.first_cutoffs=}, {len(self.history)=}'
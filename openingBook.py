@@ -0,0 +1,149 @@
+"""
+Opening book for Oska.
+Every game starts from the same board, so the first few turns keep asking for the same searches. The book is built
+offline: every board that can come up in the first plies turns of a game is searched depth turns deep and its best
+move is written to a file. oskaplayer() looks the board up in the book before searching and plays the book move if
+there is one that was found by a search at least as deep as the one it was asked for.
+
+The file is a small header followed by one record per board, sorted by the Zobrist key of the board (see transTable.py,
+the keys are the same in every run). A lookup is a binary search over the records of the memory mapped file, so
+opening the book doesn't read it and a lookup only touches a few pages of it.
+
+To build a book for the standard board:
+    python openingBook.py oska4.book --depth 7 --plies 6
+"""
+
+import argparse
+import mmap
+import struct
+import time
+from typing import Dict, List, Tuple
+
+from bitBoard import boardTables, fromBits, genMoves, isLegal, playMove, toBits
+from oskaPlayer import SearchContext, searchRoot
+from transTable import TranspositionTable, positionKey, zobristKeys
+
+# the header of the file: the magic string, the length of the first row of the board and how many records there are
+HEADER = struct.Struct('<8sBI')
+MAGIC = b'OSKABK1\0'
+# a record: the key of the board, the (from, over, to) move, the score of the move and how deep it was searched
+RECORD = struct.Struct('<QBbBbB')
+# the board every game starts from
+START_BOARD = ['wwww', '---', '--', '---', 'bbbb']
+
+"""
+Function that builds a book by searching every board that can come up in the first plies turns of a game, starting
+with white on the start board
+@:param path: the file to write
+@:param depth: how deep each board is searched
+@:param plies: how many turns into the game the book goes
+@:param board: the board the games start from
+@:param verbose: print how far along the build is
+"""
+
+
+def buildBook(path: str, depth: int, plies: int, board: List[str] = None, verbose: bool = False):
+    board = board or START_BOARD
+    tables = boardTables(len(board[0]))
+    keys = zobristKeys(tables)
+    # one table for all the searches, a lot of the boards below one board are also below the others
+    table = TranspositionTable()
+    records: Dict[int, Tuple] = {}
+    start = time.perf_counter()
+
+    level = [(*toBits(tables, board), 'w')]
+    for ply in range(plies):
+        next_level = []
+        for white, black, turn in level:
+            key = positionKey(keys, white, black, turn, turn)
+            if key in records:
+                continue
+            next_moves = genMoves(tables, white, black, turn)
+            next_player = 'b' if turn == 'w' else 'w'
+            if not next_moves:
+                # the other player moves next on the same board, unless neither can move
+                if genMoves(tables, white, black, next_player):
+                    next_level.append((white, black, next_player))
+                continue
+            search = SearchContext(tables, turn, depth, None, table)
+            move, score = searchRoot(search, white, black, next_moves)
+            records[key] = (key, *move, score, depth)
+            for move in next_moves:
+                next_level.append((*playMove(white, black, turn, move), next_player))
+        level = next_level
+        if verbose:
+            print(f'{ply=} {len(records)=} {time.perf_counter() - start:.1f}s')
+
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, tables.n, len(records)))
+        for key in sorted(records):
+            frm, over, to = records[key][1:4]
+            file.write(RECORD.pack(key, frm, over, to, *records[key][4:]))
+
+
+"""
+Class OpeningBook is a book file opened for lookups. Open it once and pass it to oskaplayer().
+"""
+
+
+class OpeningBook:
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, n, self.count = HEADER.unpack_from(self.data)
+        if magic != MAGIC:
+            raise ValueError(f'{path} is not an Oska opening book')
+        if len(self.data) != HEADER.size + self.count * RECORD.size:
+            raise ValueError(f'{path} is the wrong size')
+        self.tables = boardTables(n)
+        self.keys = zobristKeys(self.tables)
+
+    # function to look up the record of a board by its key, returns None if the board isn't in the book
+    def find(self, key: int) -> Tuple:
+        low, high = 0, self.count
+        while low < high:
+            mid = (low + high) // 2
+            record = RECORD.unpack_from(self.data, HEADER.size + mid * RECORD.size)
+            if record[0] < key:
+                low = mid + 1
+            elif record[0] > key:
+                high = mid
+            else:
+                return record
+        return None
+
+    # function that returns the (from, over, to) book move and its score for a board, or None if the board isn't in
+    # the book or its move was found by a search less deep than depth
+    def lookup(self, white: int, black: int, curr_player: str, depth: int) -> Tuple[Tuple[int, int, int], int]:
+        record = self.find(positionKey(self.keys, white, black, curr_player, curr_player))
+        if record is None or record[5] < depth:
+            return None
+        move = record[1:4]
+        # two boards could have the same key, so make sure the move can actually be played
+        if not isLegal(self.tables, white, black, curr_player, move):
+            return None
+        return move, record[4]
+
+    # function that returns the board after the book move, or None if there is no book move for the board
+    def bestBoard(self, board: List[str], curr_player: str, depth: int) -> List[str]:
+        if len(board[0]) != self.tables.n:
+            return None
+        white, black = toBits(self.tables, board)
+        found = self.lookup(white, black, curr_player, depth)
+        if found is None:
+            return None
+        return fromBits(self.tables, *playMove(white, black, curr_player, found[0]))
+
+    # function to close the file
+    def close(self):
+        self.data.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build an opening book for Oska')
+    parser.add_argument('path', help='file to write the book to')
+    parser.add_argument('--depth', type=int, default=7, help='how deep each board is searched (default 7)')
+    parser.add_argument('--plies', type=int, default=6, help='how many turns into the game the book goes (default 6)')
+    args = parser.parse_args()
+    buildBook(args.path, args.depth, args.plies, verbose=True)
@@ -1,12 +1,33 @@
 """
 Function calls for playing one move on a valid given Oska board
-It uses the moveGen function so that has been copied to this file (not imported)
+The moves of a List[List[str]] board come from the move generator in moveEngine.py, the same one moveGen.py uses
+moveGen() and the board helpers that used to be in this file (moveList(), iterMoves(), makeMove(), unmakeMove(),
+moveBoard(), forward(), capture() and Piece) are imported here, so code that imports them from oskaPlayer still works
 The main function, oskaplayer(), is run and returns the next best move for whichever player the function was called
 for.
 """
 
-from copy import deepcopy
-from typing import List
+import time
+from itertools import chain
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+
+from batchEval import evaluateBoards
+from bitBoard import (BoardTables, boardTables, evaluateMaterial, evaluateMove, fromBits, genMoves, isLegal,
+                      lazyMoves, material, moveMaterial, playMove, toBits)
+from diskCache import DiskCache
+from legacyMoveGen import Piece, capture, forward
+from mcts import SearchTree, mctsBits
+from moveEngine import Move, iterMoves, makeMove, moveBoard, moveGen, moveList, unmakeMove
+from moveOrder import MoveOrder
+from tablebase import Tablebase
+from transTable import EXACT, LOWER, UPPER, TranspositionTable, moveKey, positionKey, zobristKeys
+
+# bigger than any value the evaluator can return, used as the starting bounds for the alpha-beta search
+INFINITY = float('inf')
+# how many boards a search with a time limit looks at between checking the clock
+TIME_CHECK_NODES = 256
+# memory for the transposition table a search with a time limit makes when it isn't given one
+DEEPENING_TABLE_MEMORY = 4 * 1024 * 1024
 
 """
 Function definition for the main function. oskaplayer() will call other functions to return the next best move from a 
@@ -16,25 +37,181 @@ the curr_player is a valid curr_player.
 @:param initial_board: a List of strings that represent a valid Oska board 
 @:param curr_player: a string representing the current curr_player (who's turn it is). Should only be 'w' or 'b'
 @:param turn: an integer representing how many moves ahead the minmax function should look to determine the best move
+@:param stats: an optional SearchStats object that will count how many nodes the search visited
+@:param engine: which search to use, 'alphabeta' (default), the exhaustive 'dfs', 'batch', which is dfs with the
+               boards at the last turn evaluated in batches (see batchEval.py) or 'mcts', the Monte Carlo tree search
+               of mcts.py. 'mcts' doesn't use depth, it runs the simulations of its tree or until the time limit
+@:param table: an optional TranspositionTable for the alpha-beta search. Pass the same one to every call in a game so
+               the boards searched on one turn can be reused on the next
+@:param time_limit: optional number of seconds the alpha-beta search can take. The search then goes one turn deeper
+                    at a time (up to depth) and returns the best move of the deepest search it finished in time. The
+                    depth it got to is put in stats.depth
+@:param workers: optional number of processes to split the alpha-beta search over (see parallelSearch.py). Picks the
+                 same move as the search in one process. Not used together with time_limit
+@:param tablebase: an optional Tablebase (see tablebase.py). Boards with few enough pieces get their exact result from
+                   it instead of being searched or evaluated. It has to be for the same size of board, ValueError is
+                   raised if it isn't
+@:param book: an optional OpeningBook (see openingBook.py). If it has a move for the board that was found by a search
+              at least depth turns deep, that move is played without searching
+@:param ordering: an optional MoveOrder (see moveOrder.py) for the alpha-beta search. Pass the same one to every call
+                  in a game to keep its killer moves and history, otherwise a new one is made for each call
+@:param cache: an optional DiskCache (see diskCache.py) for the alpha-beta search, shared by every process that opens
+               the same file. A board that was searched at least depth turns deep before gets the same move again
+               without a search
+@:param tree: an optional SearchTree (see mcts.py) for engine='mcts' with its budget and rollout depth. Pass the same
+              one to every call in a game to keep the part of the tree below the board the game got to
 
 @:return:
     a List of strings that represent the board after the next best move has been played
 """
 
 
-def oskaplayer(initial_board: List[str], curr_player: str, depth: int) -> List[str]:
-    # convert board into List[List[str]] for easier manipulation
-    board = convert2D(initial_board)
+def oskaplayer(initial_board: List[str], curr_player: str, depth: int, stats: 'SearchStats' = None,
+               engine: str = 'alphabeta', table: TranspositionTable = None, time_limit: float = None,
+               workers: int = None, tablebase: Tablebase = None, book: 'OpeningBook' = None,
+               ordering: MoveOrder = None, cache: DiskCache = None, tree: SearchTree = None) -> List[str]:
+    if book is not None:
+        best = book.bestBoard(initial_board, curr_player, depth)
+        if best is not None:
+            return best
 
-    # use minmax function to determine the best move
-    best = minmax(board, curr_player, depth)
+    if engine in ('dfs', 'batch'):
+        # convert board into List[List[str]] for easier manipulation
+        board = convert2D(initial_board)
+
+        # use minmax function to determine the best move
+        best = minmax(board, curr_player, depth, stats, engine, tablebase)
+
+        # check if minmax returned an actual board
+        if best is None:
+            return None
+        else:
+            # return best but convert it back to List[str] first
+            return convertList(best)
+
+    # the alpha-beta search works on bitboards, so the board only gets converted here and back at the end
+    tables = boardTables(len(initial_board[0]))
+    white, black = toBits(tables, initial_board)
+    if engine == 'mcts':
+        best = mctsBits(tables, white, black, curr_player, stats, time_limit, tree)
+        return None if best is None else fromBits(tables, *best)
+    best = minmaxBits(tables, white, black, curr_player, depth, stats, table, time_limit, workers, tablebase,
+                      ordering, cache)
+    return None if best is None else fromBits(tables, *best)
+
+
+"""
+Function that works like oskaplayer() with the alpha-beta search but also returns the score of the move it picked, for
+when the score is needed as well (like when analysing a lot of boards, see batchAnalysis.py).
+
+@:param initial_board: a List of strings that represent a valid Oska board
+@:param curr_player: a string representing the current curr_player (who's turn it is). Should only be 'w' or 'b'
+@:param depth: an integer representing how many moves ahead the search should look to determine the best move
+@:param stats: an optional SearchStats object that will count how many nodes the search visited
+@:param table: an optional TranspositionTable for the search
+@:param cache: an optional DiskCache, same as for oskaplayer()
+
+@:return:
+    a tuple of the board after the best move (same as oskaplayer() returns) and the score of that move for
+    curr_player. The score is None when curr_player can't move
+"""
 
-    # check if minmax returned an actual board
-    if best is None:
-        return None
-    else:
-        # return best but convert it back to List[str] first
-        return convertList(best)
+
+def analyse(initial_board: List[str], curr_player: str, depth: int, stats: 'SearchStats' = None,
+            table: TranspositionTable = None, cache: DiskCache = None) -> Tuple[List[str], int]:
+    tables = boardTables(len(initial_board[0]))
+    white, black = toBits(tables, initial_board)
+    next_moves = genMoves(tables, white, black, curr_player)
+    if not next_moves:
+        # same as oskaplayer(), the board comes back as it is if the opponent can still move
+        best = minmaxBits(tables, white, black, curr_player, depth, stats)
+        return (None if best is None else fromBits(tables, *best)), None
+    if cache is not None:
+        entry = cache.lookup(tables, white, black, curr_player)
+        if entry is not None and entry[0] >= depth and entry[2] in next_moves:
+            return fromBits(tables, *playMove(white, black, curr_player, entry[2])), entry[1]
+    search = SearchContext(tables, curr_player, depth, stats, table, ordering=MoveOrder())
+    best_move, score = searchRoot(search, white, black, next_moves)
+    if stats is not None:
+        stats.depth = depth
+    if cache is not None:
+        cache.save(tables, white, black, curr_player, depth, score, best_move)
+    return fromBits(tables, *playMove(white, black, curr_player, best_move)), score
+
+
+"""
+Function that works like oskaplayer() but records the search in a SearchProfile and returns it with the move, to see
+where the time of a slow call went.
+
+@:param initial_board: a List of strings that represent a valid Oska board
+@:param curr_player: a string representing the current curr_player (who's turn it is). Should only be 'w' or 'b'
+@:param depth: an integer representing how many moves ahead the search should look to determine the best move
+@:param callback: an optional function that is called with the profile at the end of every search
+@:param kwargs: any of the other arguments of oskaplayer() (engine, table, time_limit, ...)
+
+@:return:
+    a tuple of the board after the best move (same as oskaplayer() returns) and the SearchProfile
+"""
+
+
+def profiledPlayer(initial_board: List[str], curr_player: str, depth: int,
+                   callback: Callable[['SearchProfile'], None] = None, **kwargs) -> Tuple[List[str], 'SearchProfile']:
+    profile = SearchProfile(callback)
+    return oskaplayer(initial_board, curr_player, depth, profile, **kwargs), profile
+
+
+"""
+Function that scores every move from a board in one call, for showing the alternatives to the best move. Every move
+gets its exact score (not just a bound like in the search for the best move) and its principal variation: the line of
+play both players would follow after it if they played the way the search thinks is best.
+
+@:param initial_board: a List of strings that represent a valid Oska board
+@:param curr_player: a string representing the current curr_player (who's turn it is). Should only be 'w' or 'b'
+@:param depth: an integer representing how many moves ahead the search should look
+@:param stats: an optional SearchStats object that will count how many nodes the search visited
+@:param table: an optional TranspositionTable for the search, a new one is made if None
+@:param tablebase: an optional Tablebase with the exact results of boards with few pieces
+
+@:return:
+    a list of RootMove, one for every move curr_player can make, best first. Moves with the same score are in the order
+    they are generated in, so the first one is the move oskaplayer() picks. The list is empty if curr_player can't move
+"""
+
+
+def multiPV(initial_board: List[str], curr_player: str, depth: int, stats: 'SearchStats' = None,
+            table: TranspositionTable = None, tablebase: Tablebase = None) -> List['RootMove']:
+    tables = boardTables(len(initial_board[0]))
+    white, black = toBits(tables, initial_board)
+    if table is None:
+        table = TranspositionTable(DEEPENING_TABLE_MEMORY)
+    search = SearchContext(tables, curr_player, depth, stats, table, tablebase, MoveOrder())
+    next_player = 'b' if curr_player == 'w' else 'w'
+    key = positionKey(search.keys, white, black, curr_player, curr_player)
+    counts = material(tables, white, black)
+    if stats is not None:
+        stats.nodes += 1
+        stats.depth = depth
+
+    root_moves = []
+    for move in genMoves(tables, white, black, curr_player):
+        new_white, new_black = playMove(white, black, curr_player, move)
+        if depth == 1:
+            score, line = search.evaluate(white, black, curr_player, move, counts), []
+        else:
+            # a full window, so the score is exact for every move and not only for the best one
+            new_key = moveKey(search.keys, key, curr_player, move)
+            new_counts = moveMaterial(tables, counts, curr_player, move)
+            score = alphabeta(search, new_white, new_black, next_player, 2, -INFINITY, INFINITY, new_key, new_counts)
+            line = principalVariation(search, new_white, new_black, next_player, 2, score, new_key, new_counts)
+        boards = [fromBits(tables, new_white, new_black)]
+        turn = next_player
+        for line_move in line:
+            new_white, new_black = playMove(new_white, new_black, turn, line_move)
+            boards.append(fromBits(tables, new_white, new_black))
+            turn = 'b' if turn == 'w' else 'w'
+        root_moves.append(RootMove(boards[0], score, boards[1:]))
+    # sorted() keeps the moves with the same score in the order they were generated
+    return sorted(root_moves, key=lambda root_move: -root_move.score)
 
 
 """
@@ -58,50 +235,514 @@ class Player:
 
 
 """
-Object for a piece
-Keeps track of which curr_player the piece belongs to and its current position on the board
+Class SearchStats keeps track of how much work a search did. A node is any board the search looked at, either to
+generate its moves or to evaluate it. Pass the same object to several oskaplayer() calls to get the total for a game.
 """
 
 
-class Piece:
-    def __init__(self, player: str, i: int, j: int):
-        self.player = player
-        self.row = i
-        self.col = j
+class SearchStats:
+    # a SearchProfile records a lot more about the search, see below
+    profiling = False
+
+    def __init__(self):
+        self.nodes = 0
+        # how deep the last search got, for a search with a time limit this is the last depth it finished
+        self.depth = 0
 
-    # function to just print out the object. Used for debugging purposes
+    # overriding string function to print stuff out. Used for debugging purposes
     def __str__(self):
-        return f'{self.player=}, {self.row=}, {self.col=}'
+        return f'{self.nodes=}, {self.depth=}'
 
 
 """
-Function for determining the next best move from a given board. It calls the turn first search function to determine 
-what the best move is from the list of all possible moves returned by the movegen function. 
+Class SearchProfile is a SearchStats that also records where a search spent its work and time, to find out why a
+search took as long as it did. Pass it to oskaplayer() as the stats (or use profiledPlayer()) and the search fills in:
+    ply_nodes: how many boards were looked at on each turn from the board the search started from (0 is that board)
+    expanded, children: how many boards on each turn had their moves searched and how many moves were searched from
+                        them, branching() is children / expanded for each turn
+    leaf_evals: how many boards at the last turn were evaluated
+    movegen_seconds, eval_seconds: the time spent generating moves and evaluating boards, seconds is the whole search
+    table_probes, table_hits, table_cutoffs: how many times the transposition table was looked in, how many times the
+                                            board was in it and how many times its score could be used
+    tablebase_hits: how many boards weren't searched because they were in the tablebase
+Searches with a plain SearchStats, or none, don't record any of this. The search with more than one worker only counts
+the nodes. The callback, if there is one, is called with the profile at the end of every search (so at every depth of
+a search with a time limit), and summary() has all of it as a dict.
+"""
+
+
+class SearchProfile(SearchStats):
+    profiling = True
+
+    def __init__(self, callback: Callable[['SearchProfile'], None] = None):
+        super().__init__()
+        self.callback = callback
+        self.ply_nodes: List[int] = []
+        self.expanded: List[int] = []
+        self.children: List[int] = []
+        self.leaf_evals = 0
+        self.movegen_seconds = self.eval_seconds = self.seconds = 0.0
+        self.table_probes = self.table_hits = self.table_cutoffs = 0
+        self.tablebase_hits = 0
+        self.start = None
+        self.table_counts = (0, 0)
+
+    # function the search calls for the boards it looks at, ply is how many turns they are from the root
+    def node(self, ply: int, boards: int = 1):
+        while len(self.ply_nodes) <= ply:
+            self.ply_nodes.append(0)
+            self.expanded.append(0)
+            self.children.append(0)
+        self.ply_nodes[ply] += boards
+
+    # function the search calls after it searched moves moves of a board ply turns from the root
+    def expand(self, ply: int, moves: int):
+        self.expanded[ply] += 1
+        self.children[ply] += moves
+
+    # function that yields the moves from moves and adds the time it took to generate them to movegen_seconds
+    def timedMoves(self, moves: Iterable) -> Iterator:
+        moves = iter(moves)
+        while True:
+            start = time.perf_counter()
+            move = next(moves, None)
+            self.movegen_seconds += time.perf_counter() - start
+            if move is None:
+                return
+            yield move
+
+    # function called when a search starts, the transposition table counters are kept to see how they change
+    def begin(self, table: TranspositionTable = None):
+        self.start = time.perf_counter()
+        if table is not None:
+            self.table_counts = (table.hits, table.misses)
+
+    # function called when a search depth turns deep finishes, it adds up the time and the use of the table and calls
+    # the callback
+    def finish(self, depth: int, table: TranspositionTable = None):
+        self.depth = depth
+        self.seconds += time.perf_counter() - self.start
+        if table is not None:
+            hits, misses = table.hits - self.table_counts[0], table.misses - self.table_counts[1]
+            self.table_hits += hits
+            self.table_probes += hits + misses
+        if self.callback is not None:
+            self.callback(self)
+
+    # the average number of moves searched from the boards on each turn that had their moves searched
+    def branching(self) -> List[float]:
+        return [children / expanded if expanded else 0.0 for expanded, children in zip(self.expanded, self.children)]
+
+    # everything the profile recorded as a dict, ready to be logged or dumped as JSON
+    def summary(self) -> Dict:
+        return {'nodes': self.nodes, 'depth': self.depth, 'seconds': self.seconds, 'ply_nodes': self.ply_nodes,
+                'branching': [round(b, 3) for b in self.branching()], 'leaf_evals': self.leaf_evals,
+                'movegen_seconds': self.movegen_seconds, 'eval_seconds': self.eval_seconds,
+                'table_probes': self.table_probes, 'table_hits': self.table_hits,
+                'table_hit_rate': self.table_hits / self.table_probes if self.table_probes else 0.0,
+                'table_cutoffs': self.table_cutoffs, 'tablebase_hits': self.tablebase_hits}
+
+    # overriding string function to print stuff out. Used for debugging purposes
+    def __str__(self):
+        return (f'{self.nodes=}, {self.depth=}, {self.seconds=:.4f}, {self.ply_nodes=}, {self.leaf_evals=}, '
+                f'{self.movegen_seconds=:.4f}, {self.eval_seconds=:.4f}, {self.table_probes=}, {self.table_hits=}, '
+                f'{self.table_cutoffs=}, {self.tablebase_hits=}')
+
+
+"""
+Class RootMove is one of the moves multiPV() returns: the board after the move, its score for the player who made it
+and its principal variation as the boards after each of the moves that follow it.
+"""
+
+
+class RootMove:
+    def __init__(self, board: List[str], score: int, pv: List[List[str]]):
+        self.board = board
+        self.score = score
+        self.pv = pv
+
+    # overriding string function to print stuff out. Used for debugging purposes
+    def __str__(self):
+        return f'{self.board=}, {self.score=}, {self.pv=}'
+
+
+"""
+Exception raised inside the search when its time limit is up. The iterative deepening loop catches it and goes with the
+best move of the last depth it finished.
+"""
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+"""
+Class SearchContext has everything about a search that stays the same from one board to the next, so the search
+functions only have to pass around what changes (the boards, whose turn it is and the alpha-beta bounds).
+"""
+
+
+class SearchContext:
+    def __init__(self, tables: BoardTables, player: str, depth: int, stats: SearchStats = None,
+                 table: TranspositionTable = None, tablebase: Tablebase = None, ordering: MoveOrder = None):
+        self.tables = tables
+        self.player = player
+        self.depth = depth
+        self.stats = stats
+        self.table = table
+        self.tablebase = tablebase
+        if tablebase is not None:
+            tablebase.checkSize(tables.n)
+        # without a MoveOrder the moves are tried captures first in the order they are generated
+        self.ordering = ordering
+        # the Zobrist keys are only needed to look boards up in the transposition table
+        self.keys = None if table is None else zobristKeys(tables)
+        # time.perf_counter() value the search has to stop at, or None if there is no time limit
+        self.deadline = None
+        self.until_check = TIME_CHECK_NODES
+        # the SearchProfile to record the search in, only when the stats are one
+        self.profile = stats if stats is not None and stats.profiling else None
+        if self.profile is not None:
+            # the search itself doesn't check for a profile at the bottom, evaluate() does it instead
+            self.evaluate = self.profiledEvaluate
+
+    # function that evaluates the board a move leads to at the bottom of the search. white, black and counts (see
+    # material() in bitBoard.py) are for the board before the move, the tablebase is used when the board is in it
+    def evaluate(self, white: int, black: int, turn: str, move: Tuple[int, int, int],
+                 counts: Tuple[int, int, int, int]) -> int:
+        if self.tablebase is not None:
+            next_player = 'b' if turn == 'w' else 'w'
+            score = self.tablebase.score(*playMove(white, black, turn, move), next_player, self.player)
+            if score is not None:
+                return score
+        return evaluateMove(self.tables, counts, turn, move, self.player)
+
+    # evaluate() for a search with a SearchProfile, it counts the evaluation and how long it took
+    def profiledEvaluate(self, white: int, black: int, turn: str, move: Tuple[int, int, int],
+                         counts: Tuple[int, int, int, int]) -> int:
+        start = time.perf_counter()
+        score = SearchContext.evaluate(self, white, black, turn, move, counts)
+        self.profile.eval_seconds += time.perf_counter() - start
+        self.profile.leaf_evals += 1
+        return score
+
+    # function the search calls for every board, it only looks at the clock every TIME_CHECK_NODES boards
+    def checkTime(self):
+        self.until_check -= 1
+        if self.until_check <= 0:
+            self.until_check = TIME_CHECK_NODES
+            if time.perf_counter() >= self.deadline:
+                raise SearchTimeout()
+
+
+"""
+Function for determining the next best move from a given board. It calls the search function to determine what the best
+move is from the list of all possible moves returned by the movegen function. The first move with the highest score is
+the one that gets picked, whichever engine is used.
 
 @:param board: a List[List[str]] that represents the current board
 @:param curr_player: a str that represents the current curr_player
 @:param turn: an integer representing how many moves ahead the dfs function should look to determine the best move
+@:param stats: an optional SearchStats object that will count how many nodes the search visited
+@:param engine: which search to use, 'alphabeta' (default), the exhaustive 'dfs' or 'batch', which is dfs with the
+               boards at the last turn evaluated in batches (see batchEval.py)
+@:param tablebase: an optional Tablebase with the exact results of boards with few pieces
 
 @:return:
     a List[List[str]] that represents the next best move from the board
 """
 
 
-def minmax(board: List[List[str]], player: str, depth: int) -> List[List[str]]:
+def minmax(board: List[List[str]], player: str, depth: int, stats: SearchStats = None,
+           engine: str = 'alphabeta', tablebase: Tablebase = None) -> List[List[str]]:
+    if tablebase is not None:
+        tablebase.checkSize(len(board[0]))
     # generate the next moves
-    next_moves = moveGen(board, player)
+    next_moves = moveList(board, player)
     # if no new moves can be generated, then either a tie or opponent makes the next turn
     if not next_moves:
         temp = 'w' if player == 'b' else 'b'
         # meaning that the other curr_player can't play a move either, so it's a tie
-        return None if not moveGen(board, temp) else board  # opponent can make a move so return the board
-    else:
+        return None if not moveList(board, temp) else board  # opponent can make a move so return the board
+    elif engine in ('dfs', 'batch'):
         howMany = 1  # to keep track of the current turn for the search
+        profile = stats if stats is not None and stats.profiling else None
+        if profile is not None:
+            profile.begin()
         # call the dfs function to get the index of the next best move from next_moves
-        best_idx = dfs(board, player, player, howMany, depth)
+        best_idx = dfs(board, player, player, howMany, depth, stats, tablebase, batch=engine == 'batch')
+        if profile is not None:
+            profile.finish(depth)
 
         # return the best move
-        return next_moves[best_idx]
+        return moveBoard(board, next_moves[best_idx])
+    else:
+        tables = boardTables(len(board[0]))
+        white, black = toBits(tables, board)
+        best = minmaxBits(tables, white, black, player, depth, stats, tablebase=tablebase)
+        return convert2D(fromBits(tables, *best))
+
+
+"""
+Same as minmax() but for a board that is already in its bitboard form. This is what oskaplayer() uses for the
+alpha-beta search. With a time limit it does iterative deepening: it searches 1 turn deep, then 2 turns deep and so on
+until depth, each time trying the best move of the last depth first. When the time is up in the middle of a depth, the
+best move of the last depth that finished is returned. The first depth always finishes so there is always a move.
+
+@:param tables: the BoardTables for the size of the board
+@:param white: the white bitboard
+@:param black: the black bitboard
+@:param player: a str that represents the current curr_player
+@:param depth: an integer representing how many moves ahead the search should look to determine the best move
+@:param stats: an optional SearchStats object that will count how many nodes the search visited
+@:param table: an optional TranspositionTable the search stores boards in and looks them up from
+@:param time_limit: an optional number of seconds the search can take
+@:param workers: an optional number of processes to split the moves from the board over, when there is no time limit
+@:param tablebase: an optional Tablebase with the exact results of boards with few pieces
+@:param ordering: an optional MoveOrder with the killer moves and history to start from, a new one is made if None
+@:param cache: an optional DiskCache (see diskCache.py). If the board was searched at least depth turns deep before its
+               move is played without a search, otherwise the result of the search is stored in it
+
+@:return:
+    a tuple of the white and black bitboards after the next best move, the same boards if the opponent has to make
+    the next move or None if neither curr_player can move
+"""
+
+
+def minmaxBits(tables: BoardTables, white: int, black: int, player: str, depth: int, stats: SearchStats = None,
+               table: TranspositionTable = None, time_limit: float = None, workers: int = None,
+               tablebase: Tablebase = None, ordering: MoveOrder = None, cache: DiskCache = None) -> Tuple[int, int]:
+    start = time.perf_counter()
+    # generate the next moves
+    next_moves = genMoves(tables, white, black, player)
+    # if no new moves can be generated, then either a tie or opponent makes the next turn
+    if not next_moves:
+        next_player = 'b' if player == 'w' else 'w'
+        # meaning that the other curr_player can't play a move either, so it's a tie
+        return None if not genMoves(tables, white, black, next_player) else (white, black)
+
+    if cache is not None:
+        entry = cache.lookup(tables, white, black, player, tablebase)
+        if entry is not None and entry[0] >= depth and entry[2] in next_moves:
+            return playMove(white, black, player, entry[2])
+
+    if ordering is None:
+        ordering = MoveOrder()
+    ordering.newSearch()
+
+    if time_limit is None and workers and len(next_moves) > 1:
+        # imported here since parallelSearch.py imports the search functions from this file
+        from parallelSearch import parallelRoot
+        best_move, score = parallelRoot(tables, white, black, player, depth, next_moves, workers, stats, tablebase)
+        if stats is not None:
+            stats.depth = depth
+        if cache is not None:
+            cache.save(tables, white, black, player, depth, score, best_move, tablebase)
+        return playMove(white, black, player, best_move)
+
+    if time_limit is None:
+        search = SearchContext(tables, player, depth, stats, table, tablebase, ordering)
+        best_move, score = searchRoot(search, white, black, next_moves)
+        if stats is not None:
+            stats.depth = depth
+        if cache is not None:
+            cache.save(tables, white, black, player, depth, score, best_move, tablebase)
+        return playMove(white, black, player, best_move)
+
+    # the deeper searches need the boards stored by the shallower ones to be any faster
+    if table is None:
+        table = TranspositionTable(DEEPENING_TABLE_MEMORY)
+    if stats is None:
+        # the cache needs to know how deep the search got
+        stats = SearchStats()
+    best_move, score = deepenRoot(tables, white, black, player, next_moves, depth, start + time_limit, stats, table,
+                                  tablebase, ordering)
+    if cache is not None:
+        cache.save(tables, white, black, player, stats.depth, score, best_move, tablebase)
+    return playMove(white, black, player, best_move)
+
+
+"""
+Function that does the iterative deepening of minmaxBits(): it searches 1 turn deep, then 2 turns deep and so on until
+depth, each time trying the best move of the last depth first. When the deadline passes in the middle of a depth, the
+best move of the last depth that finished is returned. The first depth always finishes so there is always a move.
+A depth of 0 or less has no limit, the same as for a search without a time limit: the depths go on until the deadline
+or until they reach gameLength() turns, where the search is as good as one to the end of the game.
+
+@:param tables: the BoardTables for the size of the board
+@:param white: the white bitboard
+@:param black: the black bitboard
+@:param player: the player the search is for, it's their turn
+@:param next_moves: all the moves the player can make, in the order genMoves() returns them
+@:param depth: the deepest the search goes, 0 or less for no limit
+@:param deadline: the time.perf_counter() time the search has to stop at
+@:param stats: an optional SearchStats object, its depth is set to the deepest depth that finished
+@:param table: the TranspositionTable the depths share
+@:param tablebase: an optional Tablebase with the exact results of boards with few pieces
+@:param ordering: the MoveOrder the depths share
+@:param best_move: an optional move to try first on the first depth, like the move a table has for the board
+
+@:return:
+    a tuple of the best move and its score
+"""
+
+
+def deepenRoot(tables: BoardTables, white: int, black: int, player: str, next_moves: List[Tuple[int, int, int]],
+               depth: int, deadline: float, stats: SearchStats = None, table: TranspositionTable = None,
+               tablebase: Tablebase = None, ordering: MoveOrder = None,
+               best_move: Tuple[int, int, int] = None) -> Tuple[Tuple[int, int, int], int]:
+    if depth <= 0:
+        depth = gameLength(tables, white, black)
+    score = None
+    for curr_depth in range(1, depth + 1):
+        search = SearchContext(tables, player, curr_depth, stats, table, tablebase, ordering)
+        if curr_depth > 1:
+            search.deadline = deadline
+        try:
+            best_move, score = searchRoot(search, white, black, next_moves, best_move)
+        except SearchTimeout:
+            break
+        if stats is not None:
+            stats.depth = curr_depth
+        if time.perf_counter() >= deadline:
+            break
+    return best_move, score
+
+
+"""
+Function that returns how many turns a game can last at most from a board. Every move takes a piece at least one step
+closer to the other side and a player can only pass if the other one moves next, so there are at most two turns for
+each step the pieces have left, and one more for a last pass.
+
+@:param tables: the BoardTables for the size of the board
+@:param white: the white bitboard
+@:param black: the black bitboard
+
+@:return:
+    the most turns the game can go on for
+"""
+
+
+def gameLength(tables: BoardTables, white: int, black: int) -> int:
+    _, white_steps, _, black_steps = material(tables, white, black)
+    return 2 * (white_steps + black_steps) + 1
+
+
+"""
+Function that searches all the moves from the board the search starts from and returns the best one. The first move in
+next_moves with the highest score is the best move even if first_move is searched before it, so the order the moves
+are searched in never changes which move gets picked.
+
+@:param search: the SearchContext with everything that stays the same during the search
+@:param white: the white bitboard
+@:param black: the black bitboard
+@:param next_moves: all the moves the player can make, in the order genMoves() returns them
+@:param first_move: an optional move that is searched first because it is likely to be the best one
+
+@:return:
+    a tuple of the best move and its score
+"""
+
+
+def searchRoot(search: SearchContext, white: int, black: int, next_moves: List[Tuple[int, int, int]],
+               first_move: Tuple[int, int, int] = None) -> Tuple[Tuple[int, int, int], int]:
+    tables, player, depth, stats, table = search.tables, search.player, search.depth, search.stats, search.table
+    next_player = 'b' if player == 'w' else 'w'
+    key = 0 if table is None else positionKey(search.keys, white, black, player, player)
+    # the counts and steps only get worked out here, the search updates them for each move
+    counts = material(tables, white, black)
+    if stats is not None:
+        stats.nodes += 1
+    if search.profile is not None:
+        search.profile.begin(table)
+        search.profile.node(0)
+
+    order = list(range(len(next_moves)))
+    if first_move is not None:
+        first = next_moves.index(first_move)
+        order.remove(first)
+        order.insert(0, first)
+
+    best_idx, best = None, None
+    for i in order:
+        move = next_moves[i]
+        if depth == 1:  # the root is the last turn, so just evaluate the moves
+            if stats is not None:
+                stats.nodes += 1
+                if search.profile is not None:
+                    search.profile.node(1)
+            good = search.evaluate(white, black, player, move, counts)
+        else:
+            # anything that can't beat the best move so far gets cut off. A move that comes before the best one in
+            # next_moves also wins a tie, and since scores are whole numbers it only has to beat best - 1
+            if best is None:
+                alpha = -INFINITY
+            else:
+                alpha = best - 1 if i < best_idx else best
+            new_white, new_black = playMove(white, black, player, move)
+            new_key = 0 if table is None else moveKey(search.keys, key, player, move)
+            good = alphabeta(search, new_white, new_black, next_player, 2, alpha, INFINITY, new_key,
+                             moveMaterial(tables, counts, player, move))
+        if best is None or good > best or (good == best and i < best_idx):
+            best_idx, best = i, good
+    if table is not None:
+        table.store(key, depth, best, EXACT, next_moves[best_idx])
+    if search.profile is not None:
+        search.profile.expand(0, len(next_moves))
+        search.profile.finish(depth, table)
+    return next_moves[best_idx], best
+
+
+"""
+Function that finds the principal variation below a board: the moves from it down to the last turn of the search that
+lead to its score, with both players picking the first of their moves that keeps the score. Each move is checked with
+a search that only finds out whether the move's score is exactly score, which is quick with the transposition table
+the search of the board filled in.
+
+@:param search: the SearchContext the board was searched with
+@:param white: the white bitboard
+@:param black: the black bitboard
+@:param turn: whose turn it is on the board
+@:param count: how deep the board is in the search, the same as for alphabeta()
+@:param score: the exact score of the board
+@:param key: the Zobrist key of the board
+@:param counts: the (white count, white steps, black count, black steps) of the board
+
+@:return
+    the list of moves, shorter than the rest of the search if a player can't move
+"""
+
+
+def principalVariation(search: SearchContext, white: int, black: int, turn: str, count: int, score: int, key: int,
+                       counts: Tuple[int, int, int, int]) -> List[Tuple[int, int, int]]:
+    tables = search.tables
+    line = []
+    while count <= search.depth:
+        # a board in the tablebase isn't searched, so it doesn't have a line
+        if search.tablebase is not None and search.tablebase.score(white, black, turn, search.player) is not None:
+            break
+        next_player = 'b' if turn == 'w' else 'w'
+        found = None
+        for move in genMoves(tables, white, black, turn):
+            if count == search.depth:
+                good = search.evaluate(white, black, turn, move, counts)
+            else:
+                # scores are whole numbers, so with this window the score that comes back is only score if it's exact
+                good = alphabeta(search, *playMove(white, black, turn, move), next_player, count + 1, score - 1,
+                                 score + 1, moveKey(search.keys, key, turn, move),
+                                 moveMaterial(tables, counts, turn, move))
+            if good == score:
+                found = move
+                break
+        if found is None:
+            break
+        line.append(found)
+        key = moveKey(search.keys, key, turn, found)
+        counts = moveMaterial(tables, counts, turn, found)
+        white, black = playMove(white, black, turn, found)
+        turn = next_player
+        count += 1
+    return line
 
 
 """
@@ -113,35 +754,202 @@ to determine which of the possible moves is the best one.
 @:param player: the player that will be used to evaluate the best move for that player
 @:param count: how deep the current search is
 @:param turn: the max turn the function can go
+@:param stats: an optional SearchStats object that will count how many nodes the search visited
+@:param tablebase: an optional Tablebase, boards in it get their exact result instead of being searched or evaluated
+@:param counts: the (white count, white steps, black count, black steps) of the board, worked out from the board if
+                None (see boardCounts())
+@:param batch: evaluate all the boards of the last turn from a board together with evaluateBoards() (see batchEval.py)
+               instead of one at a time
 
 @:return
     an integer value that represents the index of the best move
 """
 
 
-def dfs(board: List[List[str]], turn: str, player: str, count: int, depth: int) -> int:
+def dfs(board: List[List[str]], turn: str, player: str, count: int, depth: int, stats: SearchStats = None,
+        tablebase: Tablebase = None, counts: Tuple[int, int, int, int] = None, batch: bool = False) -> int:
+    # only a SearchProfile has to know about the time spent and the boards on each turn
+    profile = stats if stats is not None and stats.profiling else None
+    if stats is not None:
+        stats.nodes += 1
+        if profile is not None:
+            profile.node(count - 1)
+    # the root has to return the index of a move, every other board can be answered by the tablebase
+    if tablebase is not None and count > 1:
+        score = tablebase.scoreBoard(board, turn, player)
+        if score is not None:
+            if profile is not None:
+                profile.tablebase_hits += 1
+            return score
     # generate the new moves for the current board
-    pos_moves = moveGen(board, turn)
+    if profile is None:
+        pos_moves = moveList(board, turn)
+    else:
+        start = time.perf_counter()
+        pos_moves = moveList(board, turn)
+        profile.movegen_seconds += time.perf_counter() - start
+    # now it's the next curr_player's turn
+    next_player = 'b' if turn == 'w' else 'w'
+    # the counts and steps are only worked out for the root, after that they are updated for each move
+    if counts is None:
+        counts = boardCounts(board)
 
     # base case 1: pos_moves is empty so evaluate the current board
     if not pos_moves:
-        return evaluator(board, player)
+        return evaluateMaterial(counts, player)
     elif count == depth:  # base case 2: max turn has been reached, so evaluate all the boards
-        goodness = [None for _ in range(len(pos_moves))]  # the goodness of the boards in the pos_moves
-        for i, curr in enumerate(pos_moves):
-            goodness[i] = evaluator(curr, player)
+        if stats is not None:
+            stats.nodes += len(pos_moves)
+        if profile is not None:
+            profile.node(count, len(pos_moves))
+            profile.expand(count - 1, len(pos_moves))
+            profile.leaf_evals += len(pos_moves)
+            start = time.perf_counter()
+        # the goodness of the boards in the pos_moves
+        if batch:
+            goodness = evaluateBoards([moveBoard(board, move) for move in pos_moves], player)
+        else:
+            goodness = [evaluateCounts(counts, move, len(board), player) for move in pos_moves]
+        if tablebase is not None:
+            for i, move in enumerate(pos_moves):
+                # play the move on the board itself and take it back after, instead of copying the board
+                makeMove(board, move)
+                good = tablebase.scoreBoard(board, next_player, player)
+                unmakeMove(board, move)
+                if good is not None:
+                    goodness[i] = good
+        if profile is not None:
+            profile.eval_seconds += time.perf_counter() - start
         # return the index of the best value (could be min or max value depending on whose turn it is
         return returnGoodness(goodness, depth, count)
     else:  # recursive steps
-        # now it's the next curr_player's turn
-        next_player = 'b' if turn == 'w' else 'w'
         goodness = [None for _ in range(len(pos_moves))]  # the goodness of the boards in pos_moves
-        for i, curr in enumerate(pos_moves):
-            good = dfs(curr, next_player, player, count + 1, depth)
+        for i, move in enumerate(pos_moves):
+            makeMove(board, move)
+            good = dfs(board, next_player, player, count + 1, depth, stats, tablebase,
+                       moveCounts(counts, move, len(board)), batch)
+            unmakeMove(board, move)
             goodness[i] = good
+        if profile is not None:
+            profile.expand(count - 1, len(pos_moves))
         return returnGoodness(goodness, count, count)
 
 
+"""
+Alpha-beta search function. It returns the same value dfs() would for a board that isn't the root, but it stops
+looking at the moves of a board as soon as one of them shows that the board can't change the result higher up.
+alpha is the score the max curr_player is already sure to get and beta is the score the min curr_player is already sure
+to get. The returned value is exact when it is between alpha and beta, otherwise it is only a bound which is enough
+for the parent to ignore it. The board is passed in as bitboards (see bitBoard.py).
+If the search has a transposition table, a board that was already searched at least as deep is answered from the
+table, and the best move stored for it is searched first.
+
+@:param search: the SearchContext with everything that stays the same during the search
+@:param white: the white bitboard
+@:param black: the black bitboard
+@:param turn: the current curr_player for this current board. Who's turn it is
+@:param count: how deep the current search is
+@:param alpha: the best score the player is already guaranteed
+@:param beta: the best score the opponent is already guaranteed
+@:param key: the Zobrist key of the board, only used when the search has a transposition table
+@:param counts: the (white count, white steps, black count, black steps) of the board, see material() in bitBoard.py
+
+@:return
+    an integer value that represents the goodness of the board
+"""
+
+
+def alphabeta(search: SearchContext, white: int, black: int, turn: str, count: int, alpha: float, beta: float,
+              key: int, counts: Tuple[int, int, int, int]) -> int:
+    tables, player, stats, table, profile = search.tables, search.player, search.stats, search.table, search.profile
+    if stats is not None:
+        stats.nodes += 1
+        if profile is not None:
+            profile.node(count - 1)
+    if search.deadline is not None:
+        search.checkTime()
+    # a board in the tablebase has an exact result, so there is nothing to search
+    if search.tablebase is not None:
+        score = search.tablebase.score(white, black, turn, player)
+        if score is not None:
+            if profile is not None:
+                profile.tablebase_hits += 1
+            return score
+
+    # how many turns are still searched below this board
+    draft = search.depth - count + 1
+    table_move = None
+    if table is not None:
+        entry = table.probe(key)
+        if entry is not None:
+            _, entry_draft, score, bound, table_move = entry
+            # the stored score can only be used if it was searched at least as deep as needed now
+            if entry_draft >= draft and (bound == EXACT or (bound == LOWER and score >= beta) or
+                                         (bound == UPPER and score <= alpha)):
+                if profile is not None:
+                    profile.table_cutoffs += 1
+                return score
+
+    # the moves are generated one at a time so the ones after a cutoff never get generated
+    if search.ordering is not None:
+        pos_moves = search.ordering.moves(tables, white, black, turn, count, table_move)
+    else:
+        pos_moves = lazyMoves(tables, white, black, turn)
+        # the best move from last time is the most likely to cause a cutoff, so try it first
+        if table_move is not None and isLegal(tables, white, black, turn, table_move):
+            pos_moves = chain((table_move,), (move for move in pos_moves if move != table_move))
+    if profile is not None:
+        pos_moves = profile.timedMoves(pos_moves)
+
+    # same as returnGoodness(), odd turns are max turns and even turns are min turns
+    maximize = count % 2 == 1
+    next_player = 'b' if turn == 'w' else 'w'
+    original_alpha, original_beta = alpha, beta
+    best = -INFINITY if maximize else INFINITY
+    best_move = None
+    for i, move in enumerate(pos_moves):
+        if count == search.depth:  # max turn has been reached, so evaluate the board
+            if stats is not None:
+                stats.nodes += 1
+                if profile is not None:
+                    profile.node(count)
+            good = search.evaluate(white, black, turn, move, counts)
+        else:
+            new_white, new_black = playMove(white, black, turn, move)
+            new_key = 0 if table is None else moveKey(search.keys, key, turn, move)
+            good = alphabeta(search, new_white, new_black, next_player, count + 1, alpha, beta, new_key,
+                             moveMaterial(tables, counts, turn, move))
+        if maximize:
+            if good > best:
+                best, best_move = good, move
+            alpha = max(alpha, good)
+        else:
+            if good < best:
+                best, best_move = good, move
+            beta = min(beta, good)
+        # the other curr_player won't let the search get to this board, so the rest of the moves don't matter
+        if alpha >= beta:
+            if search.ordering is not None:
+                search.ordering.cutoff(turn, count, move, draft, i == 0)
+            break
+
+    # base case: there were no moves so evaluate the current board
+    if best_move is None:
+        return evaluateMaterial(counts, player)
+    if profile is not None:
+        profile.expand(count - 1, i + 1)
+
+    if table is not None:
+        if best <= original_alpha:
+            bound = UPPER
+        elif best >= original_beta:
+            bound = LOWER
+        else:
+            bound = EXACT
+        table.store(key, draft, best, bound, best_move)
+    return best
+
+
 """
 Function that evaluates the goodness of a given next potential board for the current curr_player. It first calculates the 
 minimum number of steps for each curr_player to reach the other side of the board (a winning case). While doing this, 
@@ -208,349 +1016,105 @@ def evaluator(possible_move: List[List[str]], curr_player: str):
 
 
 """
-Function that returns the index of the best move based on who's turn it is. Could be max or min of goodness list.
+Function that counts how many pieces each curr_player has and how many steps they are away from the other side, the
+same numbers evaluator() works out. dfs() only does this for the board it starts from, after that it updates the
+numbers for each move with moveCounts() and evaluates the boards with evaluateCounts(), so it never has to go through
+a whole board or make the Player objects again.
 
-@:param goodness: a list of ints that represent the goodness value of the board. (the value in a key-value pair where 
-                  the key is the board ex. goodness[0] is the good value of the board at pos_moves[0]).
-@:param turn: an int that's used to determine whether to use the min function or the max function
-@:param count: how deep the search has gone so far
+@:param board: a List[List[str]] that represents the board
 
 @:return:
-    an int value that represents the index of the best board in the pos_moves List (not passed to this function)
+    a tuple of (white count, white steps, black count, black steps)
 """
 
 
-def returnGoodness(goodness: List[int], turn: int, count: int):
-    # get the index of the highest value in goodness
-    if count == 1:
-        max_good = goodness[0]
-        output = 0
-        for i, good in enumerate(goodness):
-            if good > max_good:
-                max_good = good
-                output = i
-        return output
-    else:  # haven't reached root, so return evaluated value to parent
-        # return max when it's curr_player turn and return min when its opp turn
-        return max(goodness) if turn % 2 == 1 else min(goodness)
+def boardCounts(board: List[List[str]]) -> Tuple[int, int, int, int]:
+    white_count = white_steps = 0
+    black_count = black_steps = 0
+    for i, row in enumerate(board):
+        for cell in row:
+            if cell == 'w':
+                white_steps += len(board) - i - 1
+                white_count += 1
+            elif cell == 'b':
+                black_steps += i
+                black_count += 1
+    return white_count, white_steps, black_count, black_steps
 
 
 """
-Top function for generating new moves given a board and which curr_player's turn it is
+Function that updates the numbers from boardCounts() for a move. White moves down the board and black moves up, so
+which player moved is worked out from the move itself.
 
-@:param board: a list of strings representing the board
-@:param curr_player: a char value of either 'b' or 'w' which represents who's turn it is
-@:return a list of lists of strings which is all the possible moves that can be generated for the current curr_player
-"""
+@:param counts: the (white count, white steps, black count, black steps) before the move
+@:param move: the (from, to, captured) move
+@:param rows: how many rows the board has
 
-
-def moveGen(board: List[List[str]], piece: str) -> List[List[List[str]]]:
-    new = []
-    # go through the board and find all the pieces for the curr_player
-    for idx, row in enumerate(board):
-        for jdx, cell in enumerate(row):
-            if cell == piece:
-                playerPiece = Piece(cell, idx, jdx)
-                # generate the moves for the curr_player's piece
-                moves = possibleMoves(board, playerPiece)
-                # append all the new moves generated
-                for move in moves:
-                    new.append(move)
-    return new
-
-
-"""
-Function to generate the moves for an individual piece on the board
-@:param board: the current board 
-@:param playerPiece: the current piece that will be used to generate the new moves for
-@:return a list of list of str that will represent all the possible moves this current playerPiece can make
+@:return:
+    the (white count, white steps, black count, black steps) after the move
 """
 
 
-def possibleMoves(board: List[List[str]], playerPiece: Piece) -> List[List[List[str]]]:
-    # depending on which curr_player it is, the moves will either be going downwards or upwards.
-    # so depending on whose turn it is, return the appropriate moves
-    if playerPiece.player == 'w':
-        return whiteMoves(board, playerPiece)
+def moveCounts(counts: Tuple[int, int, int, int], move, rows: int) -> Tuple[int, int, int, int]:
+    white_count, white_steps, black_count, black_steps = counts
+    (row, _), (newRow, _), captured = move
+    if newRow > row:
+        white_steps -= newRow - row
+        if captured is not None:
+            black_count -= 1
+            black_steps -= captured[0]
     else:
-        # the black moves
-        return blackMoves(board, playerPiece)
+        black_steps -= row - newRow
+        if captured is not None:
+            white_count -= 1
+            white_steps -= rows - captured[0] - 1
+    return white_count, white_steps, black_count, black_steps
 
 
 """
-Function to generate the moves of a given white piece on the board. Does not do any error checking, assumes all input is 
-valid.
-@:param board: the current board
-@:param playerPiece: the piece that will be moved
-@:return a list of list of str that will represent all the possible moves this current white playerPiece can make
-"""
-
-
-def whiteMoves(board: List[List[str]], playerPiece: Piece) -> List[List[List[str]]]:
-    moves = []
-    # need the row and col of the current piece to determine which moves can be made from this position
-    row, col = playerPiece.row, playerPiece.col
-    # need the size of the board to know the bounds of the board
-    size = len(board)
-
-    # if the col is 0, then can't go diagonally to the left cause out of bounds unless its on the lower half of the
-    # board
-    if col == 0:
-        # Moving forward
-        # two scenarios: piece is either on the upper half or on the lower half
-        if row < size - 1 and board[row + 1][col] == '-':
-            moves.append(forward(board, playerPiece, row + 1, col))
-        # lower half
-        if (size - 1) // 2 <= row < size - 1 and board[row + 1][col + 1] == '-':
-            moves.append(forward(board, playerPiece, row + 1, col + 1))
-
-        # if there is an opponent's piece then capture
-        # upper half
-        if row < size - 2 and row != ((size - 1) // 2) - 1 and board[row + 1][col] == 'b' \
-                and board[row + 2][col] == '-':
-            oppPiece = Piece('b', row + 1, col)
-            moves.append(capture(board, playerPiece, oppPiece, row + 2, col))
-        # the piece is on the row just above the center
-        if row == ((size - 1) // 2) - 1 and board[row + 1][col] == 'b' and board[row + 2][col + 1] == '-':
-            oppPiece = Piece('b', row + 1, col)
-            moves.append(capture(board, playerPiece, oppPiece, row + 2, col + 1))
-        # if the piece is on the lower half of the board
-        if (size - 1) // 2 <= row < size - 2 and board[row + 1][col + 1] == 'b' and board[row + 2][col + 2] == '-':
-            oppPiece = Piece('b', row + 1, col + 1)
-            moves.append(capture(board, playerPiece, oppPiece, row + 2, col + 2))
-    # the piece is on the far right most side of the current row
-    elif col == len(board[row]) - 1:
-        # same thing again, generate the forward moves then the capture moves
-        # forward moves - upper half
-        if row < (size - 1) // 2 and board[row + 1][col - 1] == '-':
-            moves.append(forward(board, playerPiece, row + 1, col - 1))
-        # forward moves - lower half
-        if (size - 1) // 2 <= row < size - 1:
-            if board[row + 1][col] == '-':
-                moves.append(forward(board, playerPiece, row + 1, col))
-            if board[row + 1][col + 1] == '-':
-                moves.append(forward(board, playerPiece, row + 1, col + 1))
-
-        # capture moves - upper half
-        if row < ((size - 1) // 2) - 1 and board[row + 1][col - 1] == 'b' and board[row + 2][col - 2] == '-':
-            oppPiece = Piece('b', row + 1, col - 1)
-            moves.append(capture(board, playerPiece, oppPiece, row + 2, col - 2))
-        # capture moves - row above the center row
-        if row == ((size - 1) // 2) - 1 and board[row + 1][col - 1] == 'b' and board[row + 2][col - 1] == '-':
-            oppPiece = Piece('b', row + 1, col - 1)
-            moves.append(capture(board, playerPiece, oppPiece, row + 2, col - 1))
-        # capture moves - lower half
-        if (size - 1) // 2 <= row < size - 2:
-            # capture moves - right side lower half
-            if board[row + 1][col + 1] == 'b' and board[row + 2][col + 2] == '-':
-                oppPiece = Piece('b', row + 1, col + 1)
-                moves.append(capture(board, playerPiece, oppPiece, row + 2, col + 2))
-            # capture moves - left side lower half
-            if board[row + 1][col] == 'b' and board[row + 2][col] == '-':
-                oppPiece = Piece('b', row + 1, col)
-                moves.append(capture(board, playerPiece, oppPiece, row + 2, col))
-    # piece is in the middle of the row
-    else:
-        # upper half forward and capture moves
-        if row < (size - 1) // 2:
-            # upper half left forward and capture moves
-            # forward move - left
-            if board[row + 1][col - 1] == '-':
-                moves.append(forward(board, playerPiece, row + 1, col - 1))
-            # capture move - left
-            if col > 1 and board[row + 1][col - 1] == 'b' and board[row + 2][col - 2] == '-':
-                oppPiece = Piece('b', row + 1, col - 1)
-                moves.append(capture(board, playerPiece, oppPiece, row + 2, col - 2))
-            # piece is on the row above center
-            if col == 1 and row == ((size - 1) // 2) - 1 and board[row + 1][col - 1] == 'b' and board[row + 2][
-                col - 1] == '-':
-                oppPiece = Piece('b', row + 1, col - 1)
-                moves.append(capture(board, playerPiece, oppPiece, row + 2, col - 1))
-
-            # upper half right forward and capture moves
-            # forward move - right
-            if board[row + 1][col] == '-':
-                moves.append(forward(board, playerPiece, row + 1, col))
-            # capture move - right
-            if len(board[row + 2]) > col and row != ((size - 1) // 2) - 1 and board[row + 1][col] == 'b' and \
-                    board[row + 2][col] == '-':
-                oppPiece = Piece('b', row + 1, col)
-                moves.append(capture(board, playerPiece, oppPiece, row + 2, col))
-            # piece is on the row just above the center
-            if len(board[row + 2]) > col + 1 and row == ((size - 1) // 2) - 1 and board[row + 1][col] == 'b' and \
-                    board[row + 2][
-                        col + 1] == '-':
-                oppPiece = Piece('b', row + 1, col)
-                moves.append(capture(board, playerPiece, oppPiece, row + 2, col + 1))
-        # lower half forward and capture moves
-        else:
-            # forward move - left
-            if row < size - 1 and board[row + 1][col] == '-':
-                moves.append(forward(board, playerPiece, row + 1, col))
-            # capture move - left
-            if row < size - 2 and board[row + 1][col] == 'b' and board[row + 2][col] == '-':
-                oppPiece = Piece('b', row + 1, col)
-                moves.append(capture(board, playerPiece, oppPiece, row + 2, col))
-
-            # forward move - right
-            if row < size - 1 and board[row + 1][col + 1] == '-':
-                moves.append(forward(board, playerPiece, row + 1, col + 1))
-            # capture move - right
-            if row < size - 2 and board[row + 1][col + 1] == 'b' and board[row + 2][col + 2] == '-':
-                oppPiece = Piece('b', row + 1, col + 1)
-                moves.append(capture(board, playerPiece, oppPiece, row + 2, col + 2))
+Function that gives the same value as evaluator() for the board after a move, from the numbers of the board before it.
+It doesn't look at the board or make any objects.
 
-    return moves
+@:param counts: the (white count, white steps, black count, black steps) before the move
+@:param move: the (from, to, captured) move
+@:param rows: how many rows the board has
+@:param curr_player: the player the board is evaluated for
 
-
-"""
-Function to generate the moves of a given black piece on the board. Does not do any error checking, assumes all input is 
-valid.
-@:param board: the current board
-@:param playerPiece: the piece that will be moved
-@:return a list of list of str that will represent all the possible moves this current black playerPiece can make
-"""
-
-
-def blackMoves(board: List[List[str]], playerPiece: Piece) -> List[List[List[str]]]:
-    # list that will contain all the generated moves
-    moves = []
-    # need the row and col of the current piece to determine which moves can be made from this position
-    row, col = playerPiece.row, playerPiece.col
-    # need the size of the board to know the bounds of the board
-    size = len(board)
-
-    # if the piece is on the far left of the curr row
-    if col == 0:
-        # forward moves - upper half
-        if row <= (size - 1) // 2 and board[row - 1][col + 1] == '-':
-            moves.append(forward(board, playerPiece, row - 1, col + 1))
-        if row > 0 and board[row - 1][col] == '-':
-            moves.append(forward(board, playerPiece, row - 1, col))
-
-        # capture moves - upper half
-        if 1 < row <= (size - 1) // 2 and board[row - 1][col + 1] == 'w' and board[row - 2][col + 2] == '-':
-            oppPiece = Piece('w', row - 1, col + 1)
-            moves.append(capture(board, playerPiece, oppPiece, row - 2, col + 2))
-        # capture moves - lower half
-        if row != ((size - 1) // 2) + 1 and row > 1 and board[row - 1][col] == 'w' and board[row - 2][col] == '-':
-            oppPiece = Piece('w', row - 1, col)
-            moves.append(capture(board, playerPiece, oppPiece, row - 2, col))
-        # capture moves - row just below center row
-        if row == ((size - 1) // 2) + 1 and board[row - 1][col] == 'w' and board[row - 2][col + 1] == '-':
-            oppPiece = Piece('w', row - 1, col)
-            moves.append(capture(board, playerPiece, oppPiece, row - 2, col + 1))
-
-    elif col == len(board[row]) - 1:  # the curr piece is on the far right side of the curr row
-        # forward moves - upper half
-        if 1 <= row <= (size - 1) // 2:
-            if board[row - 1][col + 1] == '-':
-                moves.append(forward(board, playerPiece, row - 1, col + 1))
-            if board[row - 1][col] == '-':
-                moves.append(forward(board, playerPiece, row - 1, col))
-
-        # forward moves - lower half
-        if row > (size - 1) // 2 and board[row - 1][col - 1] == '-':
-            moves.append(forward(board, playerPiece, row - 1, col - 1))
-
-        # capture moves - upper half
-        if 1 < row <= (size - 1) // 2:
-            if board[row - 1][col + 1] == 'w' and board[row - 2][col + 2] == '-':
-                oppPiece = Piece('w', row - 1, col + 1)
-                moves.append(capture(board, playerPiece, oppPiece, row - 2, col + 2))
-            if board[row - 1][col] == 'w' and board[row - 2][col] == '-':
-                oppPiece = Piece('w', row - 1, col)
-                moves.append(capture(board, playerPiece, oppPiece, row - 2, col))
-        # capture moves - lower half
-        if row > ((size - 1) // 2) + 1 and board[row - 1][col - 1] == 'w' and board[row - 2][col - 2] == '-':
-            oppPiece = Piece('w', row - 1, col - 1)
-            moves.append(capture(board, playerPiece, oppPiece, row - 2, col - 2))
-
-        # capture moves - row just below the center
-        if row == ((size - 1) // 2) + 1 and board[row - 1][col - 1] == 'w' and board[row - 2][col - 1] == '-':
-            oppPiece = Piece('w', row - 1, col - 1)
-            moves.append(capture(board, playerPiece, oppPiece, row - 2, col - 1))
-    else:  # piece is in the middle of the row, so it can move in both directions
-        # forward and capture moves - upper half
-        if row < (size - 1) // 2:
-            if row > 0 and board[row - 1][col] == '-':  # forward move - left
-                moves.append(forward(board, playerPiece, row - 1, col))
-            if row > 1 and board[row - 1][col] == 'w' and board[row - 2][col] == '-':  # capture move - left
-                oppPiece = Piece('w', row - 1, col)
-                moves.append(capture(board, playerPiece, oppPiece, row - 2, col))
-
-            if row > 0 and board[row - 1][col + 1] == '-':  # forward move - right
-                moves.append(forward(board, playerPiece, row - 1, col + 1))
-            if row > 1 and board[row - 1][col + 1] == 'w' and board[row - 2][col + 2] == '-':  # capture move - right
-                oppPiece = Piece('w', row - 1, col + 1)
-                moves.append(capture(board, playerPiece, oppPiece, row - 2, col + 2))
-        else:  # forward and capture moves - lower half
-            if board[row - 1][col - 1] == '-':  # forward move - left
-                moves.append(forward(board, playerPiece, row - 1, col - 1))
-            if col > 1 and board[row - 1][col - 1] == 'w' and board[row - 2][col - 2] == '-':  # capture move - left
-                oppPiece = Piece('w', row - 1, col - 1)
-                moves.append(capture(board, playerPiece, oppPiece, row - 2, col - 2))
-            # capture move - row just below the center row
-            if col == 1 and row == ((size - 1) // 2) + 1 and board[row - 1][col - 1] == 'w' and board[row - 2][
-                col - 1] == '-':
-                oppPiece = Piece('w', row - 1, col - 1)
-                moves.append(capture(board, playerPiece, oppPiece, row - 2, col - 1))
-
-            # capture and forward moves - right
-            if board[row - 1][col] == '-':
-                moves.append(forward(board, playerPiece, row - 1, col))
-            if col < len(board[row - 2]) and row != ((size - 1) // 2) + 1 and board[row - 1][col] == 'w' and \
-                    board[row - 2][col] == '-':
-                oppPiece = Piece('w', row - 1, col)
-                moves.append(capture(board, playerPiece, oppPiece, row - 2, col))
-            # capture move - row just below the center row
-            if row == ((size - 1) // 2) + 1 and col + 1 < len(board[row - 2]) and board[row - 1][col] == 'w' and \
-                    board[row - 2][col + 1] == '-':
-                oppPiece = Piece('w', row - 1, col)
-                moves.append(capture(board, playerPiece, oppPiece, row - 2, col + 1))
-
-    return moves
-
-
-"""
-Function to make a forward move with no jumping over opponent's piece
-@:param board: the current board
-@:param playerPiece: the piece that will be moved
-@ param newRow: the new row position for the playerPiece
-@:param newCol: the new column position for the playerPiece
-@:return a list of str which represents the updated board
+@:return:
+    an integer value that represents the goodness of the board after the move
 """
 
 
-def forward(board: List[List[str]], playerPiece: Piece, newRow: int, newCol: int) -> List[List[str]]:
-    new = deepcopy(board)
-    row, col = playerPiece.row, playerPiece.col
-    new[row][col] = '-'
-    new[newRow][newCol] = playerPiece.player
-    return new
+def evaluateCounts(counts: Tuple[int, int, int, int], move, rows: int, curr_player: str) -> int:
+    return evaluateMaterial(moveCounts(counts, move, rows), curr_player)
 
 
 """
-Function to make a forward move and capture an opponent's piece
-@:param board: the current board
-@:param playerPiece: the piece that will be moved
-@:param oppPlayer: the piece that will be captured by the current curr_player
-@ param newRow: the new row position for the playerPiece
-@:param newCol: the new column position for the playerPiece
-@:return a list of str which represents the updated board
-"""
+Function that returns the index of the best move based on who's turn it is. Could be max or min of goodness list.
 
+@:param goodness: a list of ints that represent the goodness value of the board. (the value in a key-value pair where 
+                  the key is the board ex. goodness[0] is the good value of the board at pos_moves[0]).
+@:param turn: an int that's used to determine whether to use the min function or the max function
+@:param count: how deep the search has gone so far
 
-def capture(board: List[List[str]], playerPiece: Piece, oppPiece: Piece, newRow: int, newCol: int) -> List[List[str]]:
-    new = deepcopy(board)
-    rowPlayer, colPlayer = playerPiece.row, playerPiece.col
-    rowOpp, colOpp = oppPiece.row, oppPiece.col
+@:return:
+    an int value that represents the index of the best board in the pos_moves List (not passed to this function)
+"""
 
-    new[rowPlayer][colPlayer] = '-'
-    new[rowOpp][colOpp] = '-'
 
-    new[newRow][newCol] = playerPiece.player
-    return new
+def returnGoodness(goodness: List[int], turn: int, count: int):
+    # get the index of the highest value in goodness
+    if count == 1:
+        max_good = goodness[0]
+        output = 0
+        for i, good in enumerate(goodness):
+            if good > max_good:
+                max_good = good
+                output = i
+        return output
+    else:  # haven't reached root, so return evaluated value to parent
+        # return max when it's curr_player turn and return min when its opp turn
+        return max(goodness) if turn % 2 == 1 else min(goodness)
 
 
 """
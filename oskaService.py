@@ -0,0 +1,250 @@
+"""
+Asyncio service for the Oska search.
+oskaplayer() takes as long as its search does and would block the event loop it was called from, so SolverService
+runs the searches in a pool of worker processes and lets the event loop await them:
+    service = SolverService(workers=4)
+    best = await service.solve(board, 'w', 7, timeout=2.0)
+Requests for the same board, player and depth that come in while one of them is being searched all wait for that one
+search instead of starting their own. Every request has its own timeout (asyncio.TimeoutError when it is up) and can be
+cancelled, neither of which stops the search for the other requests waiting on it. Once no request is waiting on a
+search any more it is cancelled if it hasn't started yet; one that already started in a worker finishes there and its
+result isn't used.
+
+The file can also be run as a small JSON over HTTP server to load test the service:
+    python oskaService.py --port 8080 --workers 4
+    curl -d '{"board": ["wwww", "---", "--", "---", "bbbb"], "player": "w", "depth": 7}' localhost:8080/solve
+POST /solve takes "board" (a list of strings), "player" ('w' or 'b'), "depth" (an integer from 1 to MAX_DEPTH) and an
+optional "timeout" in seconds (a number or null) and answers {"best": board} (null when neither player can move). The
+status is 400 when the request isn't like that, 504 when the timeout was up and 500 when the search failed. GET /stats
+answers the counters of the service.
+
+Every search starts with an empty transposition table (see workerState.py), so a worker answers a request the same way
+no matter which requests it answered before.
+"""
+
+import argparse
+import asyncio
+import json
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+from diskCache import DiskCache
+from oskaPlayer import oskaplayer
+from workerState import initWorker, workerState
+
+# memory for the transposition table of each worker
+WORKER_TABLE_MEMORY = 16 * 1024 * 1024
+# largest request body the HTTP server reads
+MAX_BODY = 64 * 1024
+# deepest search a request can ask for. A search that started in a worker can't be stopped by the timeout of the
+# request, so the depth is what keeps one request from holding a worker for a long time (depth 0, which searches to
+# the end of the game, isn't allowed for the same reason)
+MAX_DEPTH = 12
+
+
+# runs in a worker process, searches one board
+def _solve(board: List[str], player: str, depth: int, cache: DiskCache = None) -> List[str]:
+    table, ordering = workerState()
+    return oskaplayer(board, player, depth, table=table, ordering=ordering, cache=cache)
+
+
+"""
+Class SolverService hands the searches out to a pool of worker processes, see the top of the file.
+"""
+
+
+class SolverService:
+    def __init__(self, workers: int = None, cache: DiskCache = None):
+        self.pool = ProcessPoolExecutor(max_workers=workers, initializer=initWorker,
+                                        initargs=(WORKER_TABLE_MEMORY,))
+        self.cache = cache
+        # the search running for each (board, player, depth) and how many requests are waiting on it
+        self.running: Dict[Tuple, asyncio.Future] = {}
+        self.waiting: Dict[Tuple, int] = {}
+        self.requests = self.searches = self.coalesced = self.timeouts = self.cancelled = 0
+
+    # function that returns the board after the best move, the same as oskaplayer(board, player, depth) does, without
+    # blocking the event loop. asyncio.TimeoutError is raised if the search isn't done within timeout seconds
+    async def solve(self, board: List[str], player: str, depth: int, timeout: float = None) -> List[str]:
+        self.requests += 1
+        key = (tuple(board), player, depth)
+        future = self.running.get(key)
+        # a search that is done (or was cancelled) but whose _finished() hasn't run yet can't be waited on any more
+        if future is None or future.done():
+            self.searches += 1
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self.pool, _solve, list(board), player, depth, self.cache)
+            self.running[key] = future
+            self.waiting[key] = 0
+            future.add_done_callback(lambda _: self._finished(key, future))
+        else:
+            self.coalesced += 1
+        self.waiting[key] += 1
+        try:
+            # shield() so a request that times out or is cancelled doesn't cancel the search for the others
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self._leave(key, future)
+
+    # function called when a request stops waiting on a search, the search is cancelled when nobody waits on it
+    def _leave(self, key: Tuple, future: asyncio.Future):
+        if self.running.get(key) is not future:
+            return
+        self.waiting[key] -= 1
+        if self.waiting[key] == 0 and not future.done():
+            # removed right away, not in _finished(), so a request for the same board that comes in before the
+            # cancelled future's callbacks run starts a new search instead of waiting on the cancelled one
+            del self.running[key]
+            del self.waiting[key]
+            # only stops the search if it hasn't started in a worker yet
+            future.cancel()
+
+    # function called when a search is done, later requests for the same board start a new search
+    def _finished(self, key: Tuple, future: asyncio.Future):
+        if self.running.get(key) is future:
+            del self.running[key]
+            del self.waiting[key]
+
+    # the counters of the service as a dict
+    def stats(self) -> Dict:
+        return {'requests': self.requests, 'searches': self.searches, 'coalesced': self.coalesced,
+                'timeouts': self.timeouts, 'cancelled': self.cancelled, 'running': len(self.running)}
+
+    # function to stop the worker processes, searches that already started are waited for
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+    async def __aenter__(self) -> 'SolverService':
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+    # overriding string function to print stuff out. Used for debugging purposes
+    def __str__(self):
+        return f'{self.requests=}, {self.searches=}, {self.coalesced=}, {self.timeouts=}, {self.cancelled=}'
+
+
+"""
+Function that answers the HTTP requests of one connection, see the top of the file. The connection is kept open for
+more requests unless the client asks for it to be closed.
+@:param service: the SolverService the searches are sent to
+@:param reader: the StreamReader of the connection
+@:param writer: the StreamWriter of the connection
+"""
+
+
+async def handleConnection(service: SolverService, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            method, path, _ = request_line.decode('latin-1').split(' ', 2)
+            headers = {}
+            while True:
+                line = (await reader.readline()).decode('latin-1').strip()
+                if not line:
+                    break
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+            length = int(headers.get('content-length', 0))
+            if length > MAX_BODY:
+                await _respond(writer, 413, {'error': 'request too large'}, close=True)
+                break
+            body = await reader.readexactly(length) if length else b''
+            status, answer = await _route(service, method, path, body)
+            close = headers.get('connection', '').lower() == 'close'
+            await _respond(writer, status, answer, close)
+            if close:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+# works out the answer to one request, a (status, JSON object) tuple
+async def _route(service: SolverService, method: str, path: str, body: bytes) -> Tuple[int, Dict]:
+    if method == 'GET' and path == '/stats':
+        return 200, service.stats()
+    if method != 'POST' or path != '/solve':
+        return 404, {'error': f'no {method} {path}'}
+    try:
+        request = json.loads(body)
+        board, player, depth, timeout = request['board'], request['player'], request['depth'], request.get('timeout')
+    except (ValueError, KeyError, TypeError, AttributeError) as error:
+        return 400, {'error': f'bad request: {error}'}
+    error = _checkRequest(board, player, depth, timeout)
+    if error is not None:
+        return 400, {'error': f'bad request: {error}'}
+    try:
+        return 200, {'best': await service.solve(board, player, depth, timeout)}
+    except asyncio.TimeoutError:
+        return 504, {'error': 'timeout'}
+    except Exception as error:
+        return 500, {'error': f'search failed: {error!r}'}
+
+
+# what is wrong with the fields of a /solve request, None if nothing is
+def _checkRequest(board, player, depth, timeout) -> str:
+    if not isinstance(board, list) or not board or not all(isinstance(row, str) for row in board):
+        return 'board has to be a list of strings'
+    if player not in ('w', 'b'):
+        return "player has to be 'w' or 'b'"
+    # bool is an int too but true isn't a depth
+    if not isinstance(depth, int) or isinstance(depth, bool) or not 1 <= depth <= MAX_DEPTH:
+        return f'depth has to be an integer from 1 to {MAX_DEPTH}'
+    if timeout is not None and (not isinstance(timeout, (int, float)) or isinstance(timeout, bool)):
+        return 'timeout has to be a number or null'
+    return None
+
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 413: 'Payload Too Large', 500: 'Internal Server Error',
+           504: 'Gateway Timeout'}
+
+
+# writes a JSON response
+async def _respond(writer: asyncio.StreamWriter, status: int, answer: Dict, close: bool = False):
+    body = json.dumps(answer).encode()
+    head = (f'HTTP/1.1 {status} {REASONS[status]}\r\nContent-Type: application/json\r\n'
+            f'Content-Length: {len(body)}\r\nConnection: {"close" if close else "keep-alive"}\r\n\r\n')
+    writer.write(head.encode('latin-1') + body)
+    await writer.drain()
+
+
+"""
+Function that runs the HTTP server until it is stopped
+@:param host: the address to listen on
+@:param port: the port to listen on
+@:param workers: how many worker processes to search with
+@:param cache: an optional DiskCache for the workers
+"""
+
+
+async def serve(host: str, port: int, workers: int = None, cache: DiskCache = None):
+    async with SolverService(workers, cache) as service:
+        server = await asyncio.start_server(lambda reader, writer: handleConnection(service, reader, writer),
+                                            host, port)
+        print(f'listening on {", ".join(str(sock.getsockname()) for sock in server.sockets)}')
+        async with server:
+            await server.serve_forever()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Serve the Oska search as JSON over HTTP')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--workers', type=int, default=None, help='number of worker processes')
+    parser.add_argument('--cache', help='DiskCache file shared by the workers')
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, None if args.cache is None else DiskCache(args.cache)))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,131 @@
+"""
+Root-split parallel alpha-beta search.
+Every move from the board the search starts from can be searched on its own, so the moves are handed out to a pool of
+worker processes. The first move is searched on its own first so its score can be used to cut off the other moves,
+which are then all searched at the same time. The pool is started the first time it is needed and kept for the next
+turns, call shutdownPool() when done with it. Each worker keeps its own transposition table, which it shares between
+the moves of one search and empties when the next search starts (see workerState.py).
+The move picked is always the same one the serial search picks: the first move in genMoves() order with the highest
+score.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count
+from typing import List, Tuple
+
+from bitBoard import BoardTables, boardTables, material, moveMaterial, playMove
+from oskaPlayer import INFINITY, SearchContext, SearchStats, alphabeta
+from tablebase import Tablebase, openTablebase
+from transTable import moveKey, positionKey
+from workerState import initWorker, workerState
+
+# memory for the transposition table each worker keeps
+WORKER_TABLE_MEMORY = 16 * 1024 * 1024
+
+_pool: ProcessPoolExecutor = None
+_pool_workers = 0
+# numbers the searches sent to the pool, so the workers know when a new one starts
+_searches = count()
+
+"""
+Function that returns the process pool, starting it if it isn't running yet or has a different number of workers
+@:param workers: how many worker processes the pool should have
+@:return the ProcessPoolExecutor
+"""
+
+
+def getPool(workers: int) -> ProcessPoolExecutor:
+    global _pool, _pool_workers
+    if _pool is None or _pool_workers != workers:
+        shutdownPool()
+        _pool = ProcessPoolExecutor(max_workers=workers, initializer=initWorker, initargs=(WORKER_TABLE_MEMORY,))
+        _pool_workers = workers
+    return _pool
+
+
+"""
+Function to stop the worker processes. The next parallel search starts a new pool.
+"""
+
+
+def shutdownPool():
+    global _pool, _pool_workers
+    if _pool is not None:
+        _pool.shutdown()
+    _pool, _pool_workers = None, 0
+
+
+"""
+Function that runs in a worker process and searches one move from the root board
+@:param n: the length of the first row of the board
+@:param white: the white bitboard of the root board
+@:param black: the black bitboard of the root board
+@:param player: the player the search is for, it's their turn on the root board
+@:param depth: how many turns the search looks ahead
+@:param move: the move to search
+@:param alpha: the score the move has to beat to matter
+@:param tablebase_path: the file of the tablebase to use, or None
+@:param search_id: the same for every move of one search, the worker's table is emptied when it changes
+@:return a tuple of the score of the move (exact if it is more than alpha) and the number of nodes searched
+"""
+
+
+def _searchMove(n: int, white: int, black: int, player: str, depth: int, move: Tuple[int, int, int],
+                alpha: float, tablebase_path: str = None, search_id: Tuple[int, int] = None) -> Tuple[int, int]:
+    tables = boardTables(n)
+    stats = SearchStats()
+    # the tablebase can't be sent to the worker, but the file can be opened there (once per worker)
+    tablebase = None if tablebase_path is None else openTablebase(tablebase_path)
+    table, ordering = workerState(search_id)
+    search = SearchContext(tables, player, depth, stats, table, tablebase, ordering)
+    counts = material(tables, white, black)
+    if depth == 1:
+        return search.evaluate(white, black, player, move, counts), 1
+    new_white, new_black = playMove(white, black, player, move)
+    next_player = 'b' if player == 'w' else 'w'
+    key = moveKey(search.keys, positionKey(search.keys, white, black, player, player), player, move)
+    return alphabeta(search, new_white, new_black, next_player, 2, alpha, INFINITY, key,
+                     moveMaterial(tables, counts, player, move)), stats.nodes
+
+
+"""
+Function that searches all the moves from the root board across the process pool and returns the best one
+
+@:param tables: the BoardTables for the size of the board
+@:param white: the white bitboard
+@:param black: the black bitboard
+@:param player: the player the search is for
+@:param depth: how many turns the search looks ahead
+@:param next_moves: all the moves the player can make, in the order genMoves() returns them
+@:param workers: how many worker processes to use
+@:param stats: an optional SearchStats object, the nodes searched by the workers are added to it
+@:param tablebase: an optional Tablebase, the workers open the same file
+
+@:return:
+    a tuple of the best move and its score
+"""
+
+
+def parallelRoot(tables: BoardTables, white: int, black: int, player: str, depth: int,
+                 next_moves: List[Tuple[int, int, int]], workers: int,
+                 stats: SearchStats = None, tablebase: Tablebase = None) -> Tuple[Tuple[int, int, int], int]:
+    pool = getPool(workers)
+    path = None if tablebase is None else tablebase.path
+    search_id = (os.getpid(), next(_searches))
+    # the first move gets a full search, its score is what the other moves have to beat
+    best, nodes = pool.submit(_searchMove, tables.n, white, black, player, depth, next_moves[0], -INFINITY,
+                              path, search_id).result()
+    best_idx = 0
+    futures = [pool.submit(_searchMove, tables.n, white, black, player, depth, move, best, path, search_id)
+               for move in next_moves[1:]]
+    # only scores higher than the first move's are exact, and going through them in order with a strict > keeps the
+    # first move with the highest score
+    for i, future in enumerate(futures, 1):
+        good, move_nodes = future.result()
+        nodes += move_nodes
+        if good > best:
+            best_idx, best = i, good
+    if stats is not None:
+        stats.nodes += nodes + 1
+    return next_moves[best_idx], best
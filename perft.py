@@ -0,0 +1,202 @@
+"""
+Perft for the Oska move generators.
+perft counts how many boards there are exactly depth turns from a board (a line of play that ends early because a
+player can't move doesn't count). The counts only depend on the rules, so any change to a move generator that changes
+them broke it, and the time it takes to count them is a benchmark for the generator.
+The counts for a set of boards (the start board and the boards of the game logged in main.py) are kept in
+perftGolden.json, and running this file checks every generator against them and prints how fast each one was:
+    python perft.py --depth 6
+    python perft.py --generator bits --depth 7
+Use --update to write new counts to the golden file after a change to the rules.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+from bitBoard import BoardTables, boardTables, genMoves, playMove, toBits
+from legacyMoveGen import legacyMoveList
+from moveEngine import makeMove, moveList, unmakeMove
+
+GOLDEN_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'perftGolden.json')
+
+# (name, board, whose turn it is) of the boards perft is run from. The game ones are the boards of the game in main.py,
+# each with the player who moves next
+POSITIONS: List[Tuple[str, List[str], str]] = [
+    ('start', ['wwww', '---', '--', '---', 'bbbb'], 'w'),
+    ('first turn', ['-www', 'w--', '--', 'b--', '-bbb'], 'w'),
+    ('turn=0', ['--ww', 'ww-', '--', 'b--', '-bbb'], 'b'),
+    ('turn=1', ['--ww', 'ww-', 'b-', '---', '-bbb'], 'w'),
+    ('turn=2', ['---w', 'www', 'b-', '---', '-bbb'], 'b'),
+    ('turn=3', ['---w', 'www', 'b-', 'b--', '--bb'], 'w'),
+    ('turn=4', ['---w', 'w-w', 'bw', 'b--', '--bb'], 'b'),
+    ('turn=5', ['---w', 'w-w', 'bw', 'bb-', '---b'], 'w'),
+    ('turn=6', ['---w', 'w-w', 'b-', 'bbw', '---b'], 'b'),
+    ('turn=7', ['---w', 'w-w', 'bb', 'b-w', '---b'], 'w'),
+    ('turn=8', ['---w', 'w--', 'b-', 'bww', '---b'], 'b'),
+    ('turn=9', ['---w', 'wb-', '--', 'bww', '---b'], 'w'),
+    ('turn=10', ['----', 'wbw', '--', 'bww', '---b'], 'b'),
+    ('turn=11', ['-b--', 'w-w', '--', 'bww', '---b'], 'w'),
+    ('turn=12', ['-b--', '--w', 'w-', 'bww', '---b'], 'b'),
+    ('turn=13', ['-b--', '--w', 'wb', 'bw-', '----'], 'w'),
+    ('turn=14', ['-b--', '--w', '-b', '-w-', 'w---'], 'b'),
+    ('turn=15', ['-b--', '-bw', '--', '-w-', 'w---'], 'w'),
+    ('turn=16', ['-b--', '-b-', '-w', '-w-', 'w---'], 'b'),
+    ('turn=17', ['-bb-', '---', '-w', '-w-', 'w---'], 'w'),
+    ('n=5 start', ['wwwww', '----', '---', '--', '---', '----', 'bbbbb'], 'w'),
+]
+
+"""
+perft with the List[List[str]] move generator in moveEngine.py
+@:param board: the board, a List[List[str]]
+@:param piece: whose turn it is
+@:param depth: how many turns to look ahead
+@:return the number of boards depth turns from the board
+"""
+
+
+def perftList(board: List[List[str]], piece: str, depth: int) -> int:
+    moves = moveList(board, piece)
+    if depth == 1:
+        return len(moves)
+    next_player = 'b' if piece == 'w' else 'w'
+    count = 0
+    for move in moves:
+        makeMove(board, move)
+        count += perftList(board, next_player, depth - 1)
+        unmakeMove(board, move)
+    return count
+
+
+"""
+perft with the old hand written move generators in legacyMoveGen.py
+@:param board: the board, a List[List[str]]
+@:param piece: whose turn it is
+@:param depth: how many turns to look ahead
+@:return the number of boards depth turns from the board
+"""
+
+
+def perftLegacy(board: List[List[str]], piece: str, depth: int) -> int:
+    moves = legacyMoveList(board, piece)
+    if depth == 1:
+        return len(moves)
+    next_player = 'b' if piece == 'w' else 'w'
+    count = 0
+    for move in moves:
+        makeMove(board, move)
+        count += perftLegacy(board, next_player, depth - 1)
+        unmakeMove(board, move)
+    return count
+
+
+"""
+perft with the bitboard move generator in bitBoard.py
+@:param tables: the BoardTables for the size of the board
+@:param white: the white bitboard
+@:param black: the black bitboard
+@:param piece: whose turn it is
+@:param depth: how many turns to look ahead
+@:return the number of boards depth turns from the board
+"""
+
+
+def perftBits(tables: BoardTables, white: int, black: int, piece: str, depth: int) -> int:
+    moves = genMoves(tables, white, black, piece)
+    if depth == 1:
+        return len(moves)
+    next_player = 'b' if piece == 'w' else 'w'
+    count = 0
+    for move in moves:
+        count += perftBits(tables, *playMove(white, black, piece, move), next_player, depth - 1)
+    return count
+
+
+# functions that run perft on a List[str] board with each of the generators
+def _runList(board: List[str], piece: str, depth: int) -> int:
+    return perftList([list(row) for row in board], piece, depth)
+
+
+def _runLegacy(board: List[str], piece: str, depth: int) -> int:
+    return perftLegacy([list(row) for row in board], piece, depth)
+
+
+def _runBits(board: List[str], piece: str, depth: int) -> int:
+    tables = boardTables(len(board[0]))
+    return perftBits(tables, *toBits(tables, board), piece, depth)
+
+
+GENERATORS: Dict[str, Callable[[List[str], str, int], int]] = {
+    'list': _runList,
+    'bits': _runBits,
+    'legacy': _runLegacy,
+}
+
+"""
+Function that runs perft from every board in POSITIONS for every depth from 1 to depth
+@:param generator: which move generator to use, one of GENERATORS
+@:param depth: the deepest perft to run
+@:return a dict of the name of each board to its list of counts (the count for depth d is at index d - 1) and the
+         total number of boards counted and the seconds it took
+"""
+
+
+def runPerft(generator: str, depth: int) -> Tuple[Dict[str, List[int]], int, float]:
+    run = GENERATORS[generator]
+    counts = {}
+    total = 0
+    start = time.perf_counter()
+    for name, board, piece in POSITIONS:
+        counts[name] = [run(board, piece, d) for d in range(1, depth + 1)]
+        total += sum(counts[name])
+    return counts, total, time.perf_counter() - start
+
+
+"""
+Function that compares counts with the ones in the golden file, only up to the depths both of them have
+@:param counts: the counts from runPerft()
+@:param golden: the counts from the golden file
+@:return a list of (name of the board, depth, count, golden count) for every count that isn't the same
+"""
+
+
+def compareGolden(counts: Dict[str, List[int]], golden: Dict[str, List[int]]) -> List[Tuple[str, int, int, int]]:
+    wrong = []
+    for name, board_counts in counts.items():
+        for d, (count, expected) in enumerate(zip(board_counts, golden.get(name, [])), 1):
+            if count != expected:
+                wrong.append((name, d, count, expected))
+    return wrong
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Count the boards depth turns from a set of boards (perft)')
+    parser.add_argument('--depth', type=int, default=5, help='deepest perft to run (default 5)')
+    parser.add_argument('--generator', choices=list(GENERATORS) + ['all'], default='all',
+                        help='which move generator to run (default all)')
+    parser.add_argument('--update', action='store_true', help='write the counts to the golden file')
+    args = parser.parse_args()
+
+    golden = {}
+    if os.path.exists(GOLDEN_FILE):
+        with open(GOLDEN_FILE) as file:
+            golden = json.load(file)
+
+    failed = False
+    generators = list(GENERATORS) if args.generator == 'all' else [args.generator]
+    for generator in generators:
+        counts, total, seconds = runPerft(generator, args.depth)
+        wrong = compareGolden(counts, golden)
+        # the old black generator has a bug that adds moves on some boards, so it isn't held to the golden counts
+        failed = failed or (bool(wrong) and generator != 'legacy')
+        print(f'{generator:8} {total=:>10} {seconds=:8.3f} nodes/sec={total / seconds:12.0f} wrong={len(wrong)}')
+        for name, d, count, expected in wrong[:10]:
+            print(f'    {name} depth {d}: {count} (golden {expected})')
+        if args.update and generator == 'list':
+            with open(GOLDEN_FILE, 'w') as file:
+                json.dump(counts, file, indent=1)
+            print(f'wrote {GOLDEN_FILE}')
+    sys.exit(1 if failed else 0)
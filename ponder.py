@@ -0,0 +1,98 @@
+"""
+Pondering: searching on the opponent's time.
+Once the engine has played its move it would sit there until the opponent plays theirs. A Ponderer uses that time to
+search the boards the engine will most likely have to answer: right after the engine's move, ponder() ranks the
+opponent's replies with a quick search and hands the boards after them to a worker process, most likely reply first.
+When the opponent's move comes in, answer() gives the move for the board it leads to:
+    - if that board was already searched, the move is there straight away
+    - if it is being searched, answer() waits for that search instead of starting it again
+    - otherwise (the reply wasn't expected, or a different depth is asked for) it searches the board itself
+Either way the move is the same one oskaplayer() would play. The searches of the other replies are dropped, the ones
+that haven't started are cancelled. Each search starts with an empty transposition table (see workerState.py), an
+entry left by another search could make it pick a different move.
+
+    ponderer = Ponderer(depth=7)
+    board = ponderer.answer(board, 'w')    # our move
+    ponderer.ponder(board, 'b')            # search black's likely replies while black thinks
+    ...
+    ponderer.close()
+"""
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+from moveOrder import MoveOrder
+from oskaPlayer import multiPV, oskaplayer
+from transTable import TranspositionTable
+from workerState import initWorker, workerState
+
+# how deep the quick search that ranks the opponent's replies looks
+PREDICT_DEPTH = 2
+# how many of the opponent's replies are searched, the most likely ones
+PONDER_REPLIES = 4
+# memory for the transposition table of the worker and of the searches answer() does itself
+PONDER_TABLE_MEMORY = 16 * 1024 * 1024
+
+
+# runs in the worker process, searches the board after one of the opponent's replies
+def _search(board: List[str], player: str, depth: int) -> List[str]:
+    table, ordering = workerState()
+    return oskaplayer(board, player, depth, table=table, ordering=ordering)
+
+
+"""
+Class Ponderer searches the boards after the opponent's likely replies in a worker process, see the top of the file.
+"""
+
+
+class Ponderer:
+    def __init__(self, depth: int, replies: int = PONDER_REPLIES):
+        self.depth = depth
+        self.replies = replies
+        self.pool = ProcessPoolExecutor(max_workers=1, initializer=initWorker, initargs=(PONDER_TABLE_MEMORY,))
+        # the search of the board after each expected reply, keyed by (board, whose turn it is)
+        self.pondering: Dict[Tuple[Tuple[str, ...], str], Future] = {}
+        self.table = TranspositionTable(PONDER_TABLE_MEMORY)
+        self.ordering = MoveOrder()
+        # answers that were ready, that waited for a search already running and that had to be searched from scratch
+        self.hits = self.waits = self.misses = 0
+
+    # function to call after playing a move: board is the board after it and opponent is who moves next
+    def ponder(self, board: List[str], opponent: str):
+        self.stop()
+        player = 'b' if opponent == 'w' else 'w'
+        # the replies that are best for the opponent come first
+        boards = [reply.board for reply in multiPV(board, opponent, min(PREDICT_DEPTH, self.depth))[:self.replies]]
+        # an opponent who can't move passes, and the board stays the same
+        for reply in boards or [board]:
+            self.pondering[tuple(reply), player] = self.pool.submit(_search, reply, player, self.depth)
+
+    # function that returns the board after the best move for player, the same as oskaplayer(board, player, depth)
+    def answer(self, board: List[str], player: str, depth: int = None) -> List[str]:
+        depth = self.depth if depth is None else depth
+        future = self.pondering.pop((tuple(board), player), None)
+        self.stop()
+        if future is not None and depth == self.depth:
+            if future.done():
+                self.hits += 1
+            else:
+                self.waits += 1
+            return future.result()
+        self.misses += 1
+        self.table.clear()
+        return oskaplayer(board, player, depth, table=self.table, ordering=self.ordering)
+
+    # function that drops the searches of the other replies, the ones that haven't started are cancelled
+    def stop(self):
+        for future in self.pondering.values():
+            future.cancel()
+        self.pondering.clear()
+
+    # function to stop the worker process
+    def close(self):
+        self.stop()
+        self.pool.shutdown(cancel_futures=True)
+
+    # overriding string function to print stuff out. Used for debugging purposes
+    def __str__(self):
+        return f'{self.depth=}, {self.hits=}, {self.waits=}, {self.misses=}'
@@ -0,0 +1,188 @@
+"""
+Symmetries of the Oska board.
+Two changes to a board give a board that plays exactly the same way:
+    MIRROR  every row is reversed (the board is mirrored left to right)
+    FLIP    the rows are put in the opposite order and the colours are swapped, so it is the other player's turn.
+            White moving down on the board is black moving up on the flipped one
+Doing both is the third symmetry (MIRROR_FLIP). Each of them undoes itself, so the same function maps a board or a move
+to the other form and back. The score of a board for the player whose turn it is doesn't change, and neither does how
+many turns are left until the game is over.
+
+The canonical form of a board is the one of its (up to) four forms that has white to move and the smallest bitboards,
+so a cache keyed on the canonical form only stores one entry where it would store up to four: about half as many
+because of FLIP and half of that again because of MIRROR.
+    white, black, turn, transform = canonicalBits(tables, white, black, turn)
+    ... look up or search the canonical board, which gives move ...
+    move = transformMove(tables, move, transform)    # the same move on the board the search started from
+The searches pick the first of the moves with the best score in the order the moves are generated, and that order
+isn't the same on a mirrored or flipped board, so a move mapped back from the canonical board can be a different move
+with the same score.
+"""
+
+from functools import lru_cache
+from typing import List, Tuple
+
+from bitBoard import NO_CELL, BoardTables, boardTables, fromBits, toBits
+
+IDENTITY = 0
+MIRROR = 1
+FLIP = 2
+MIRROR_FLIP = MIRROR | FLIP
+
+"""
+Class SymmetryTables has the cell each cell goes to for a size of board, for MIRROR and for FLIP
+"""
+
+
+class SymmetryTables:
+    def __init__(self, tables: BoardTables):
+        self.tables = tables
+        self.mirror = [tables.index[r][tables.rowLengths[r] - 1 - c] for r, c in tables.cells]
+        # the rows have the same lengths from the bottom up as from the top down
+        self.flip = [tables.index[tables.rows - 1 - r][c] for r, c in tables.cells]
+
+    # the cells each cell goes to for a transform, composed from the mirror and the flip
+    def cellMap(self, transform: int) -> List[int]:
+        cells = list(range(self.tables.size))
+        if transform & MIRROR:
+            cells = [self.mirror[cell] for cell in cells]
+        if transform & FLIP:
+            cells = [self.flip[cell] for cell in cells]
+        return cells
+
+    # overriding string function to print stuff out. Used for debugging purposes
+    def __str__(self):
+        return f'{self.tables.n=}, {self.mirror=}, {self.flip=}'
+
+
+# the SymmetryTables for each size of board, and the cell maps of each transform
+@lru_cache(maxsize=None)
+def symmetryTables(n: int) -> SymmetryTables:
+    return SymmetryTables(boardTables(n))
+
+
+@lru_cache(maxsize=None)
+def _cellMap(n: int, transform: int) -> Tuple[int, ...]:
+    return tuple(symmetryTables(n).cellMap(transform))
+
+
+# moves the bits of a bitboard to the cells in cells
+def _permute(bits: int, cells: Tuple[int, ...]) -> int:
+    result = 0
+    while bits:
+        low = bits & -bits
+        bits ^= low
+        result |= 1 << cells[low.bit_length() - 1]
+    return result
+
+
+"""
+Function that applies a symmetry to a board
+@:param tables: the BoardTables for the size of the board
+@:param white: the white bitboard
+@:param black: the black bitboard
+@:param turn: whose turn it is
+@:param transform: IDENTITY, MIRROR, FLIP or MIRROR_FLIP
+@:return the (white, black, turn) of the transformed board
+"""
+
+
+def transformBits(tables: BoardTables, white: int, black: int, turn: str, transform: int) -> Tuple[int, int, str]:
+    if transform == IDENTITY:
+        return white, black, turn
+    cells = _cellMap(tables.n, transform)
+    white, black = _permute(white, cells), _permute(black, cells)
+    if transform & FLIP:
+        return black, white, 'b' if turn == 'w' else 'w'
+    return white, black, turn
+
+
+"""
+Function that applies a symmetry to a bitboard move, (from, over, to) cells
+@:param tables: the BoardTables for the size of the board
+@:param move: the move
+@:param transform: IDENTITY, MIRROR, FLIP or MIRROR_FLIP
+@:return the same move on the transformed board
+"""
+
+
+def transformMove(tables: BoardTables, move: Tuple[int, int, int], transform: int) -> Tuple[int, int, int]:
+    if transform == IDENTITY:
+        return move
+    cells = _cellMap(tables.n, transform)
+    frm, over, to = move
+    return cells[frm], NO_CELL if over == NO_CELL else cells[over], cells[to]
+
+
+"""
+Function that finds the canonical form of a board: the one of its forms with white to move and the smallest bitboards
+@:param tables: the BoardTables for the size of the board
+@:param white: the white bitboard
+@:param black: the black bitboard
+@:param turn: whose turn it is
+@:return the (white, black, turn) of the canonical board and the transform that turns the board into it (and back)
+"""
+
+
+def canonicalBits(tables: BoardTables, white: int, black: int, turn: str) -> Tuple[int, int, str, int]:
+    transforms = (IDENTITY, MIRROR) if turn == 'w' else (FLIP, MIRROR_FLIP)
+    best = None
+    for transform in transforms:
+        form = transformBits(tables, white, black, turn, transform)
+        if best is None or form[:2] < best[:2]:
+            best = form + (transform,)
+    return best
+
+
+"""
+Function that applies a symmetry to a List[str] or List[List[str]] board
+@:param board: the board
+@:param turn: whose turn it is
+@:param transform: IDENTITY, MIRROR, FLIP or MIRROR_FLIP
+@:return the transformed board as a List[str] and whose turn it is on it
+"""
+
+
+def transformBoard(board: List[str], turn: str, transform: int) -> Tuple[List[str], str]:
+    tables = boardTables(len(board[0]))
+    white, black, turn = transformBits(tables, *toBits(tables, board), turn, transform)
+    return fromBits(tables, white, black), turn
+
+
+"""
+Function that finds the canonical form of a List[str] or List[List[str]] board, see canonicalBits()
+@:param board: the board
+@:param turn: whose turn it is
+@:return the canonical board as a List[str], whose turn it is on it (always 'w') and the transform to get there
+"""
+
+
+def canonicalBoard(board: List[str], turn: str) -> Tuple[List[str], str, int]:
+    tables = boardTables(len(board[0]))
+    white, black, turn, transform = canonicalBits(tables, *toBits(tables, board), turn)
+    return fromBits(tables, white, black), turn, transform
+
+
+"""
+Function that applies a symmetry to a List[List[str]] move, ((row, col) from, (row, col) to, (row, col) captured or
+None) like moveList() in moveEngine.py returns
+@:param move: the move
+@:param row_lengths: how many cells each row of the board has
+@:param transform: IDENTITY, MIRROR, FLIP or MIRROR_FLIP
+@:return the same move on the transformed board
+"""
+
+
+def transformListMove(move, row_lengths: List[int], transform: int):
+    def cell(position):
+        if position is None:
+            return None
+        row, col = position
+        if transform & MIRROR:
+            col = row_lengths[row] - 1 - col
+        if transform & FLIP:
+            row = len(row_lengths) - 1 - row
+        return row, col
+
+    frm, to, captured = move
+    return cell(frm), cell(to), cell(captured)
@@ -0,0 +1,308 @@
+"""
+Endgame tablebase for Oska boards with only a few pieces left.
+Pieces only ever move forward, so every move gets the game closer to the end and a board can never come up twice in a
+game. That means every board with up to some number of pieces can be solved exactly, starting from the boards where
+the game is over and working backwards: a board is solved once all the boards its moves lead to are solved. The boards
+are solved in order of how many pieces are on them (a capture always goes to a board with fewer pieces) and then of
+how many steps the pieces are away from the other side in total (a forward move always lowers it), so the boards a
+move leads to are always solved before the board itself.
+
+The results are written to a file with one byte per board, from the point of view of whoever's turn it is:
+    0       draw (neither player can move, or both have all their pieces on the other side with the same count)
+    d + 1   win in d turns
+    -d - 1  loss in d turns
+A player that can't move passes, which counts as a turn. The game is over when a player has no pieces left (they lost)
+or when all of a player's pieces are on the other side. If both players have all their pieces on the other side, the
+one with more pieces wins, the same as evaluator() in oskaPlayer.py.
+
+Every board is numbered with a perfect hash, so looking one up is a single read from the file. The boards are grouped by
+how many white and black pieces they have, and inside a group the number is worked out from the rank of the set of
+cells with a white piece and the rank of the set of cells with a black piece (only counting the cells without a white
+piece). Only boards with white to move are in the file: a board with black to move has the same result as the board
+flipped upside down with the colours swapped (FLIP in symmetry.py), which has white to move, so the file is half the
+size it would be with both and only half the boards have to be solved (the empty board, which can't come up in a game,
+is the only one where this isn't true). The file is memory mapped so only the parts the
+search looks at are ever read.
+
+To build the tablebase for every board with up to 5 pieces:
+    python tablebase.py oska4.tb --pieces 5
+"""
+
+import argparse
+import mmap
+import struct
+import time
+from math import comb
+from typing import Dict, Iterator, List, Tuple
+
+from bitBoard import BoardTables, boardTables, genMoves, playMove, toBits
+from symmetry import FLIP, transformBits
+
+# the header of the file: the magic string, the length of the first row of the board and the most pieces on a board
+HEADER = struct.Struct('<8sBB')
+MAGIC = b'OSKATB2\0'
+
+"""
+Class TablebaseIndex works out the number of every board with up to pieces pieces on a board whose top row is n cells
+long. It is used both to build the tablebase and to look boards up in it.
+"""
+
+
+class TablebaseIndex:
+    def __init__(self, n: int, pieces: int):
+        self.tables = boardTables(n)
+        self.pieces = pieces
+        size = self.tables.size
+        # binomials[c][k] is the number of ways to pick k of c cells
+        self.binomials = [[comb(c, k) for k in range(pieces + 1)] for c in range(size + 1)]
+        # where each (white count, black count) group starts, groups with fewer pieces first
+        self.offsets: Dict[Tuple[int, int], int] = {}
+        self.groups: List[Tuple[int, int]] = []
+        offset = 0
+        for total in range(pieces + 1):
+            for white_count in range(min(total, n) + 1):
+                black_count = total - white_count
+                if black_count > n:
+                    continue
+                self.groups.append((white_count, black_count))
+                self.offsets[white_count, black_count] = offset
+                offset += comb(size, white_count) * comb(size - white_count, black_count)
+        self.size = offset
+
+    # the rank of a set of cells among all the sets with as many cells, smallest cells first
+    def rank(self, bits: int) -> int:
+        binomials = self.binomials
+        rank = 0
+        k = 1
+        while bits:
+            low = bits & -bits
+            bits ^= low
+            rank += binomials[low.bit_length() - 1][k]
+            k += 1
+        return rank
+
+    # the number of a board, the board must not have more than pieces pieces on it. A board with black to move has the
+    # number of its flipped board
+    def index(self, white: int, black: int, turn: str) -> int:
+        if turn == 'b':
+            white, black, turn = transformBits(self.tables, white, black, turn, FLIP)
+        white_count = white.bit_count()
+        black_count = black.bit_count()
+        # the black pieces are numbered among the cells that don't have a white piece
+        free = 0
+        k = 1
+        bits = black
+        binomials = self.binomials
+        while bits:
+            low = bits & -bits
+            bits ^= low
+            cell = low.bit_length() - 1
+            free += binomials[cell - (white & (low - 1)).bit_count()][k]
+            k += 1
+        blacks = self.binomials[self.tables.size - white_count][black_count]
+        return self.offsets[white_count, black_count] + self.rank(white) * blacks + free
+
+    # all the (white, black) boards with white_count white and black_count black pieces
+    def boards(self, white_count: int, black_count: int) -> Iterator[Tuple[int, int]]:
+        cells = list(range(self.tables.size))
+        for white in _subsets(cells, white_count):
+            rest = [cell for cell in cells if not white >> cell & 1]
+            for black in _subsets(rest, black_count):
+                yield white, black
+
+
+# all the bitboards with k of the cells set
+def _subsets(cells: List[int], k: int) -> Iterator[int]:
+    if k == 0:
+        yield 0
+        return
+    for i in range(k - 1, len(cells)):
+        for rest in _subsets(cells[:i], k - 1):
+            yield rest | 1 << cells[i]
+
+
+"""
+Function that works out if the game is over on a board and who won
+@:param tables: the BoardTables for the size of the board
+@:param white: the white bitboard
+@:param black: the black bitboard
+@:param turn: whose turn it is
+@:return None if the game isn't over, otherwise the result for turn (1 for a win, -1 for a loss and 0 for a draw)
+"""
+
+
+def gameOver(tables: BoardTables, white: int, black: int, turn: str) -> int:
+    last = tables.rowMasks[-1]
+    first = tables.rowMasks[0]
+    white_done = white != 0 and white & ~last == 0
+    black_done = black != 0 and black & ~first == 0
+    if white == 0 or black == 0 or white_done or black_done:
+        if white_done and black_done:
+            winner = 'w' if white.bit_count() > black.bit_count() else 'b' if black.bit_count() > white.bit_count() \
+                else None
+        elif white == 0 or black_done:
+            winner = 'b'
+        else:
+            winner = 'w'
+        return 0 if winner is None else 1 if winner == turn else -1
+    return None
+
+
+# the value of a board for whoever's turn it is, given the values of the boards its moves lead to (for the other player)
+def _bestValue(values: List[int]) -> int:
+    wins = [-value for value in values if value < 0]
+    if wins:
+        # win as fast as possible
+        return min(wins) + 1
+    if 0 in values:
+        return 0
+    # lose as slowly as possible
+    return -max(values) - 1
+
+
+# the value of a board for a player who has to pass, given its value for the other player
+def _passValue(value: int) -> int:
+    if value > 0:
+        return -value - 1
+    if value < 0:
+        return -value + 1
+    return 0
+
+
+"""
+Function that solves every board with up to pieces pieces and writes the results to a file
+@:param path: the file to write
+@:param pieces: the most pieces on a board
+@:param n: the length of the first row of the board (4 for the standard board)
+@:param verbose: print how far along the build is
+"""
+
+
+def buildTablebase(path: str, pieces: int, n: int = 4, verbose: bool = False):
+    index = TablebaseIndex(n, pieces)
+    tables = index.tables
+    values = bytearray(index.size)
+    start = time.perf_counter()
+    for white_count, black_count in index.groups:
+        # the results of both players are worked out for every board, and the result for black is the one for white on
+        # the flipped board, which is in the (black_count, white_count) group. So that group doesn't need to be solved
+        if white_count > black_count:
+            continue
+        # forward moves lower the total steps, so boards with fewer steps get solved first
+        boards = sorted(index.boards(white_count, black_count),
+                        key=lambda board: _steps(tables, *board))
+        for white, black in boards:
+            results = {}
+            passing = []
+            for turn in ('w', 'b'):
+                over = gameOver(tables, white, black, turn)
+                if over is not None:
+                    results[turn] = over
+                    continue
+                next_player = 'b' if turn == 'w' else 'w'
+                moves = genMoves(tables, white, black, turn)
+                if not moves:
+                    passing.append(turn)
+                    continue
+                children = []
+                for move in moves:
+                    child = values[index.index(*playMove(white, black, turn, move), next_player)]
+                    children.append(child - 256 if child > 127 else child)
+                results[turn] = _bestValue(children)
+            for turn in passing:
+                # the other player has to move, or neither can and it's a draw
+                other = 'b' if turn == 'w' else 'w'
+                results[turn] = 0 if other in passing else _passValue(results[other])
+            for turn, value in results.items():
+                values[index.index(white, black, turn)] = value & 0xff
+        if verbose:
+            print(f'{white_count=} {black_count=} solved, {time.perf_counter() - start:.1f}s')
+
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, n, pieces))
+        file.write(values)
+
+
+# the total steps of both players' pieces, used to order the boards in a group
+def _steps(tables: BoardTables, white: int, black: int) -> int:
+    steps = 0
+    for r, mask in enumerate(tables.rowMasks):
+        steps += (white & mask).bit_count() * (tables.rows - r - 1) + (black & mask).bit_count() * r
+    return steps
+
+
+"""
+Class Tablebase is a tablebase file opened for lookups. Open it once and pass it to oskaplayer(), the search then gets
+the exact result of every board with few enough pieces instead of searching it or using the evaluator.
+"""
+
+
+class Tablebase:
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, n, pieces = HEADER.unpack_from(self.data)
+        if magic != MAGIC:
+            raise ValueError(f'{path} is not an Oska tablebase')
+        self.index = TablebaseIndex(n, pieces)
+        self.tables = self.index.tables
+        self.pieces = pieces
+        if len(self.data) != HEADER.size + self.index.size:
+            raise ValueError(f'{path} is the wrong size')
+
+    # function to look up a board, returns its byte value (see the top of the file) or None if it has too many pieces
+    def probe(self, white: int, black: int, turn: str) -> int:
+        if (white | black).bit_count() > self.pieces:
+            return None
+        value = self.data[HEADER.size + self.index.index(white, black, turn)]
+        return value - 256 if value > 127 else value
+
+    # function that gives the score of a board for player the same way the evaluator does: 20 if player wins, -20 if
+    # they lose and 0 for a draw, or None if the board isn't in the tablebase
+    def score(self, white: int, black: int, turn: str, player: str) -> int:
+        value = self.probe(white, black, turn)
+        if value is None:
+            return None
+        score = 20 if value > 0 else -20 if value < 0 else 0
+        return score if turn == player else -score
+
+    # same as score() but for a List[str] or List[List[str]] board
+    def scoreBoard(self, board: List[str], turn: str, player: str) -> int:
+        return self.score(*toBits(self.tables, board), turn, player)
+
+    # function that raises ValueError if the tablebase isn't for boards with a first row of length n. A tablebase for
+    # another size of board would be indexed with the wrong cells and give wrong results
+    def checkSize(self, n: int):
+        if self.tables.n != n:
+            raise ValueError(f'the tablebase is for the {self.tables.n} board, not the {n} one')
+
+    # function to close the file
+    def close(self):
+        self.data.close()
+
+
+_opened: Dict[str, Tablebase] = {}
+
+"""
+Function that opens a tablebase file, or returns the one that is already open (the worker processes of
+parallelSearch.py use this so each of them only opens the file once)
+@:param path: the tablebase file
+@:return the Tablebase
+"""
+
+
+def openTablebase(path: str) -> Tablebase:
+    tablebase = _opened.get(path)
+    if tablebase is None:
+        tablebase = _opened[path] = Tablebase(path)
+    return tablebase
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Solve every Oska board with only a few pieces left')
+    parser.add_argument('path', help='file to write the tablebase to')
+    parser.add_argument('--pieces', type=int, default=5, help='most pieces on a board (default 5)')
+    parser.add_argument('--size', type=int, default=4, help='length of the first row of the board (default 4)')
+    args = parser.parse_args()
+    buildTablebase(args.path, args.pieces, args.size, verbose=True)
@@ -0,0 +1,14 @@
+"""
+Checks that compareBaseline() flags a search that uses more memory than the baseline, not just a slower one.
+"""
+
+from benchmark import compareBaseline
+
+
+def test_memory_regressions_are_flagged():
+    old = {'engine': 'alphabeta', 'n': 4, 'position': 'start', 'depth': 5, 'seconds': 0.01, 'nodes': 269,
+           'peak_rss_kb': 18000, 'peak_alloc_bytes': 4888, 'alloc_bytes_per_node': 18.17}
+    assert compareBaseline([dict(old)], [old]) == []
+    more = dict(old, peak_alloc_bytes=48880, alloc_bytes_per_node=181.7)
+    assert len(compareBaseline([more], [old])) == 1
+    assert len(compareBaseline([dict(old, peak_rss_kb=36000)], [old])) == 1
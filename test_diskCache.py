@@ -0,0 +1,30 @@
+"""
+Checks that a DiskCache never has more than max_entries entries and keys the searches with a tablebase apart.
+"""
+
+from bitBoard import boardTables
+from diskCache import DiskCache, cacheKey
+
+
+def test_max_entries_is_a_bound(tmp_path):
+    cache = DiskCache(str(tmp_path / 'oska.cache'), max_entries=100)
+    for i in range(290):
+        cache.store(f'key{i}', 1, 0, (0, 1, 2))
+        assert len(cache) <= 100
+    assert len(cache) == 100
+    # the entries used longest ago are the ones that went
+    assert cache.probe('key289') == (1, 0, (0, 1, 2))
+    assert cache.probe('key0') is None
+    # a file opened again counts the same entries
+    assert len(DiskCache(str(tmp_path / 'oska.cache'), max_entries=100)) == 100
+
+
+def test_tablebase_is_part_of_the_key(tmp_path):
+    tables = boardTables(4)
+    cache = DiskCache(str(tmp_path / 'oska.cache'))
+    tablebase = type('Tablebase', (), {'pieces': 5})()
+    white, black = 0b1, 0b10
+    assert cacheKey(tables, white, black, 'w') != cacheKey(tables, white, black, 'w', tablebase)
+    cache.save(tables, white, black, 'w', 3, 20, (0, 1, 2), tablebase)
+    assert cache.lookup(tables, white, black, 'w') is None
+    assert cache.lookup(tables, white, black, 'w', tablebase) == (3, 20, (0, 1, 2))
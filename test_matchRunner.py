@@ -0,0 +1,37 @@
+"""
+Checks that the Elo error bars are finite, that a match is only carried on with the settings it was started with and
+that an engine's tablebase is checked against the size of the board before the match.
+"""
+
+import math
+
+import pytest
+
+from matchRunner import EngineConfig, eloDifference, runMatch, schedule
+from tablebase import buildTablebase
+
+
+def test_elo_is_finite():
+    for wins, draws, losses in ((10, 0, 0), (0, 0, 10), (0, 10, 0), (7, 2, 1)):
+        elo, low, high = eloDifference(wins, draws, losses)
+        assert all(math.isfinite(value) for value in (elo, low, high)) and low <= elo <= high and low < high
+    assert eloDifference(5, 0, 5)[0] == 0
+
+
+def test_resume_needs_the_same_settings(tmp_path):
+    path = str(tmp_path / 'match.jsonl')
+    engines = [EngineConfig('depth=1'), EngineConfig('depth=2')]
+    settings = {'size': 4, 'games': 2, 'random_plies': 2, 'seed': 0}
+    first = runMatch(schedule(engines, 2, 4, 2, 0), path, settings, workers=1)
+    assert runMatch(schedule(engines, 2, 4, 2, 0), path, settings, workers=1) == first
+    with pytest.raises(ValueError):
+        runMatch(schedule(engines, 2, 4, 2, 1), path, dict(settings, seed=1), workers=1)
+
+
+def test_tablebase_size_is_checked(tmp_path):
+    path = str(tmp_path / 'oska4.tb')
+    buildTablebase(path, 2, 4)
+    config = EngineConfig(f'depth=2,tablebase={path}')
+    config.checkSize(4)
+    with pytest.raises(ValueError):
+        config.checkSize(5)
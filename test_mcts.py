@@ -0,0 +1,10 @@
+"""
+Checks that MCTS plays a move on a board where the game is already decided but the player can still move.
+"""
+
+from oskaPlayer import oskaplayer
+
+
+def test_decided_board_gets_a_move():
+    board = ['----', '---', '--', '-b-', 'ww--']
+    assert oskaplayer(board, 'b', 3, engine='mcts') == oskaplayer(board, 'b', 3) == ['----', '---', 'b-', '---', 'ww--']
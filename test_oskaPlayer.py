@@ -0,0 +1,41 @@
+"""
+Checks that the move generator functions that used to be in oskaPlayer.py can still be imported from it, and that
+depth 0 (no limit) works with a time limit.
+"""
+
+import moveEngine
+from oskaPlayer import (Piece, SearchStats, capture, convert2D, forward, iterMoves, makeMove, moveBoard, moveGen,
+                        moveList, oskaplayer, unmakeMove)
+
+
+def test_moveGen_still_makes_boards():
+    board = convert2D(['---w', 'w-w', 'bb', 'b-w', '---b'])
+    assert moveGen(board, 'w') == moveEngine.moveGen(board, 'w')
+    assert moveGen(board, 'w') == [moveBoard(board, move) for move in moveList(board, 'w')]
+    assert sorted(iterMoves(board, 'b')) == sorted(moveList(board, 'b'))
+
+
+def test_board_helpers():
+    board = convert2D(['---w', 'w-w', 'bb', 'b-w', '---b'])
+    move = moveList(board, 'w')[0]
+    played = moveBoard(board, move)
+    makeMove(board, move)
+    assert board == played
+    unmakeMove(board, move)
+    assert board == convert2D(['---w', 'w-w', 'bb', 'b-w', '---b'])
+    (row, col), (new_row, new_col), captured = move
+    piece = Piece('w', row, col)
+    if captured is None:
+        assert forward(board, piece, new_row, new_col) == played
+    else:
+        assert capture(board, piece, Piece('b', *captured), new_row, new_col) == played
+
+
+def test_no_depth_limit_with_a_time_limit():
+    board = ['---w', 'w-w', 'bb', 'b-w', '---b']
+    stats = SearchStats()
+    # the search goes deep enough to be the same as one to the end of the game
+    assert oskaplayer(board, 'w', 0, stats, time_limit=60.0) == oskaplayer(board, 'w', 0)
+    assert stats.depth > 1
+    # and stops at the time limit on a board where that takes much longer
+    assert oskaplayer(['wwww', '---', '--', '---', 'bbbb'], 'w', 0, time_limit=0.2) is not None
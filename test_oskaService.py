@@ -0,0 +1,52 @@
+"""
+Checks the answers of the /solve route of oskaService.py to good and bad requests.
+"""
+
+import asyncio
+import json
+
+from oskaPlayer import oskaplayer
+from oskaService import MAX_DEPTH, SolverService, _route
+
+START = ['wwww', '---', '--', '---', 'bbbb']
+
+
+async def _answers(bodies):
+    async with SolverService(workers=1) as service:
+        return [await _route(service, 'POST', '/solve', json.dumps(body).encode()) for body in bodies]
+
+
+def test_solve_route():
+    answers = asyncio.run(_answers([
+        {'board': START, 'player': 'w', 'depth': 3},
+        # the same request again, the worker's table from the first one mustn't change it
+        {'board': START, 'player': 'w', 'depth': 3},
+        {'board': 'wwww', 'player': 'w', 'depth': 3},
+        {'board': START, 'player': 'x', 'depth': 3},
+        {'board': START, 'player': 'w', 'depth': -1},
+        # depth 0 searches to the end of the game, which can hold a worker for a long time
+        {'board': START, 'player': 'w', 'depth': 0},
+        {'board': START, 'player': 'w', 'depth': MAX_DEPTH + 1},
+        {'board': START, 'player': 'w', 'depth': '3'},
+        {'board': START, 'player': 'w', 'depth': 3, 'timeout': '1'},
+        ['not', 'an', 'object'],
+        # passes the checks but isn't a board the search can play on
+        {'board': ['w'], 'player': 'w', 'depth': 2},
+    ]))
+    assert answers[0] == answers[1] == (200, {'best': oskaplayer(START, 'w', 3)})
+    assert [status for status, _ in answers[2:]] == [400, 400, 400, 400, 400, 400, 400, 400, 500]
+
+
+async def _leaveAndAskAgain():
+    async with SolverService(workers=1) as service:
+        first = asyncio.create_task(service.solve(START, 'w', 3))
+        await asyncio.sleep(0)
+        # the only request waiting on the search goes, which cancels it
+        first.cancel()
+        await asyncio.sleep(0)
+        # in the same tick, before the callbacks of the cancelled search have run
+        return await service.solve(START, 'w', 3)
+
+
+def test_request_after_cancelled_search():
+    assert asyncio.run(_leaveAndAskAgain()) == oskaplayer(START, 'w', 3)
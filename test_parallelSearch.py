@@ -0,0 +1,31 @@
+"""
+Checks that the parallel search picks the same move as the serial search, also when the same pool of workers is kept
+from one search to the next.
+"""
+
+from benchmark import startBoard
+from oskaPlayer import oskaplayer
+from parallelSearch import shutdownPool
+
+
+# the boards of the first turns of a game on the 4 and the 5 board, played with a shallow search
+def gameBoards():
+    boards = []
+    for n, turns in ((4, 14), (5, 10)):
+        board, player = startBoard(n), 'w'
+        for _ in range(turns):
+            boards.append((board, player))
+            board = oskaplayer(board, player, 3)
+            player = 'b' if player == 'w' else 'w'
+    return boards
+
+
+def test_persistent_pool_matches_serial():
+    try:
+        for board, player in gameBoards():
+            # the deepest search first, so the workers' tables are full of deeper entries for the shallower searches
+            for depth in (6, 2, 3, 4, 5):
+                assert oskaplayer(board, player, depth, workers=2) == oskaplayer(board, player, depth), \
+                    (board, player, depth)
+    finally:
+        shutdownPool()
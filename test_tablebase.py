@@ -0,0 +1,38 @@
+"""
+Checks that a tablebase is only used on the size of board it was built for.
+"""
+
+import pytest
+
+from benchmark import startBoard
+from gameSession import GameSession
+from oskaPlayer import multiPV, oskaplayer
+from tablebase import buildTablebase, openTablebase
+
+
+@pytest.fixture
+def tablebase4(tmp_path):
+    path = str(tmp_path / 'oska4.tb')
+    buildTablebase(path, 2, 4)
+    return openTablebase(path)
+
+
+def test_oskaplayer_checks_the_size(tablebase4):
+    for engine in ('alphabeta', 'dfs'):
+        with pytest.raises(ValueError):
+            oskaplayer(startBoard(5), 'w', 3, engine=engine, tablebase=tablebase4)
+    assert oskaplayer(startBoard(4), 'w', 3, tablebase=tablebase4) == oskaplayer(startBoard(4), 'w', 3)
+
+
+def test_game_session_checks_the_size(tablebase4):
+    with pytest.raises(ValueError):
+        GameSession('w', 3, tablebase=tablebase4).move(startBoard(5))
+    with pytest.raises(ValueError):
+        GameSession('w', 3, time_limit=1.0, tablebase=tablebase4).move(startBoard(5))
+    assert GameSession('w', 3, tablebase=tablebase4).move(startBoard(4)) == oskaplayer(startBoard(4), 'w', 3)
+
+
+def test_multipv_checks_the_size(tablebase4):
+    with pytest.raises(ValueError):
+        multiPV(startBoard(5), 'w', 3, tablebase=tablebase4)
+    assert multiPV(startBoard(4), 'w', 3, tablebase=tablebase4)[0].board == oskaplayer(startBoard(4), 'w', 3)
@@ -0,0 +1,185 @@
+"""
+Transposition table for the alpha-beta search.
+The same board comes up again and again through different move orders, so the search stores what it found out about
+each board it searched (how deep, the score, whether the score is exact or only a bound, and the best move) and looks
+it up before searching a board again. Boards are found by their Zobrist key, which is the XOR of a random number for
+every piece on the board plus one for whose turn it is and one for who the board is evaluated for. Playing a move only
+changes a few pieces, so the search updates the key with a few XORs instead of working it out again.
+The table has a fixed number of buckets that is worked out from a memory cap. Each bucket has two entries: one that
+keeps whichever board was searched the deepest and one that always takes the newest board. Pieces in Oska only move
+forward, so once a game has moved on the boards of its earlier turns never come up again; newGeneration() marks the
+entries stored so far as old, and an old entry gives up its depth-preferred place to any new board however deep it was.
+"""
+
+import random
+from typing import Dict, List, Tuple
+
+from bitBoard import BoardTables
+
+# the score stored is exact, a lower bound (the real score is at least that) or an upper bound (at most that)
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+# rough size in bytes of one stored entry (the tuple, the key int and the move tuple)
+ENTRY_BYTES = 200
+
+# the keys have to be the same in every run so they can be written to disk (see openingBook.py)
+ZOBRIST_SEED = 20201122
+
+"""
+Class ZobristKeys holds the random numbers used to make the keys for one size of board. Use zobristKeys() to get them.
+"""
+
+
+class ZobristKeys:
+    def __init__(self, tables: BoardTables):
+        rng = random.Random(ZOBRIST_SEED + tables.n)
+        self.white = [rng.getrandbits(64) for _ in range(tables.size)]
+        self.black = [rng.getrandbits(64) for _ in range(tables.size)]
+        # XORed in when it's black's turn / when the board is evaluated for black
+        self.blackTurn = rng.getrandbits(64)
+        self.blackPlayer = rng.getrandbits(64)
+
+
+_keys: Dict[int, ZobristKeys] = {}
+
+"""
+Function that returns the Zobrist keys for the size of board the tables are for. They are made the first time a size
+is asked for and shared after that.
+@:param tables: the BoardTables for the size of the board
+@:return the ZobristKeys for that size
+"""
+
+
+def zobristKeys(tables: BoardTables) -> ZobristKeys:
+    keys = _keys.get(tables.n)
+    if keys is None:
+        keys = _keys[tables.n] = ZobristKeys(tables)
+    return keys
+
+
+"""
+Function to work out the key of a board from scratch. The search only does this for the board it starts from.
+@:param keys: the ZobristKeys for the size of the board
+@:param white: the white bitboard
+@:param black: the black bitboard
+@:param turn: whose turn it is
+@:param player: the player the board is evaluated for
+@:return the 64 bit key of the board
+"""
+
+
+def positionKey(keys: ZobristKeys, white: int, black: int, turn: str, player: str) -> int:
+    key = 0
+    for bits, cellKeys in ((white, keys.white), (black, keys.black)):
+        while bits:
+            low = bits & -bits
+            bits ^= low
+            key ^= cellKeys[low.bit_length() - 1]
+    if turn == 'b':
+        key ^= keys.blackTurn
+    if player == 'b':
+        key ^= keys.blackPlayer
+    return key
+
+
+"""
+Function to update a key for a move. The result is the key of the board after the move, with the turn passed over to
+the other player.
+@:param keys: the ZobristKeys for the size of the board
+@:param key: the key of the board before the move
+@:param turn: who is making the move
+@:param move: the (from, over, to) move
+@:return the key of the board after the move
+"""
+
+
+def moveKey(keys: ZobristKeys, key: int, turn: str, move: Tuple[int, int, int]) -> int:
+    frm, over, to = move
+    if turn == 'w':
+        key ^= keys.white[frm] ^ keys.white[to]
+        if over >= 0:
+            key ^= keys.black[over]
+    else:
+        key ^= keys.black[frm] ^ keys.black[to]
+        if over >= 0:
+            key ^= keys.white[over]
+    return key ^ keys.blackTurn
+
+
+"""
+Class TranspositionTable is the table itself. One table can be used for a whole game (pass it to every oskaplayer()
+call) since the keys include whose turn it is and who the board is evaluated for.
+Entries are (key, depth, score, bound, move) tuples, where depth is how many turns were searched below the board.
+hits, misses, stores and evictions count how the table is being used.
+"""
+
+
+class TranspositionTable:
+    def __init__(self, memory: int = 16 * 1024 * 1024):
+        # the number of buckets is a power of two so the bucket of a key is just its lowest bits
+        buckets = 1
+        while buckets * 4 * ENTRY_BYTES <= memory:
+            buckets *= 2
+        self.mask = buckets - 1
+        # entry 2 * i is the depth-preferred one of bucket i and 2 * i + 1 the always-replace one
+        self.entries: List[Tuple] = [None] * (2 * buckets)
+        # the generation each depth-preferred entry was stored in, see newGeneration()
+        self.generation = 0
+        self.ages: List[int] = [0] * buckets
+        self.hits = self.misses = self.stores = self.evictions = 0
+
+    # function to look up a board, returns the entry or None if the board isn't in the table
+    def probe(self, key: int) -> Tuple:
+        slot = 2 * (key & self.mask)
+        entry = self.entries[slot]
+        if entry is None or entry[0] != key:
+            entry = self.entries[slot + 1]
+            if entry is None or entry[0] != key:
+                self.misses += 1
+                return None
+        self.hits += 1
+        return entry
+
+    # function to store what the search found out about a board
+    def store(self, key: int, depth: int, score: int, bound: int, move: Tuple[int, int, int]):
+        slot = 2 * (key & self.mask)
+        entries = self.entries
+        deepest = entries[slot]
+        self.stores += 1
+        if (deepest is None or deepest[0] == key or depth >= deepest[1] or
+                self.ages[key & self.mask] != self.generation):
+            # the board that was in the depth-preferred entry still gets to stay in the always-replace one
+            if deepest is not None and deepest[0] != key:
+                self.replace(slot + 1, deepest)
+            elif deepest is not None:
+                # same board searched again, don't leave an older copy of it in the other entry
+                other = entries[slot + 1]
+                if other is not None and other[0] == key:
+                    entries[slot + 1] = None
+            entries[slot] = (key, depth, score, bound, move)
+            self.ages[key & self.mask] = self.generation
+        else:
+            self.replace(slot + 1, (key, depth, score, bound, move))
+
+    # function to put an entry in a slot, counting it as an eviction if it pushes out a different board
+    def replace(self, slot: int, entry: Tuple):
+        old = self.entries[slot]
+        if old is not None and old[0] != entry[0]:
+            self.evictions += 1
+        self.entries[slot] = entry
+
+    # function to call when the game has moved on: the entries stored so far can still be found, but the depth-preferred
+    # ones no longer keep out newer boards that were searched less deep
+    def newGeneration(self):
+        self.generation += 1
+
+    # function to empty the table, the counters are kept
+    def clear(self):
+        self.entries = [None] * len(self.entries)
+        self.ages = [0] * len(self.ages)
+
+    # overriding string function to print stuff out. Used for debugging purposes
+    def __str__(self):
+        return f'{self.hits=}, {self.misses=}, {self.stores=}, {self.evictions=}'
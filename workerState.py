@@ -0,0 +1,46 @@
+"""
+The transposition table and move ordering of a worker process (see parallelSearch.py, oskaService.py and ponder.py).
+A worker keeps them for as long as it runs so they don't have to be made again for every job, but what a table holds
+depends on the search that filled it: an entry from a deeper search is used by a shallower one as if it were its own,
+which gives a different result from searching the board on its own. So the table is emptied whenever a job belongs to
+a different search than the last job the worker ran, and jobs that are each a search of their own empty it every time.
+"""
+
+from typing import Hashable, Tuple
+
+from moveOrder import MoveOrder
+from transTable import TranspositionTable
+
+# the table and move ordering of this process, made by initWorker(), and the search they were last used for
+_table: TranspositionTable = None
+_ordering: MoveOrder = None
+_search: Hashable = None
+
+"""
+Function that runs once in each worker process when it starts, use it as the initializer of the pool
+@:param memory: the memory for the transposition table
+"""
+
+
+def initWorker(memory: int):
+    global _table, _ordering, _search
+    _table = TranspositionTable(memory)
+    _ordering = MoveOrder()
+    _search = None
+
+
+"""
+Function that returns the transposition table and move ordering for a job, emptied if the job is part of a different
+search than the last one
+@:param search: something that is the same for all the jobs of one search, None if the job is a search of its own
+@:return the (TranspositionTable, MoveOrder) tuple
+"""
+
+
+def workerState(search: Hashable = None) -> Tuple[TranspositionTable, MoveOrder]:
+    global _search
+    if search is None or search != _search:
+        _table.clear()
+        _ordering.newSearch()
+        _search = search
+    return _table, _ordering